@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-invocation overhead of the data-gathering workflow.
+
+Compares building the WorkflowBuilder graph on every call (the old
+behaviour) with checking a prebuilt instance out of the WorkflowPool.
+Runs in mock mode, so the numbers are framework overhead, not backend I/O.
+
+Usage:
+    python -m scripts.bench_workflow [iterations]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("USE_MOCK_DATA", "true")
+
+from src.workflow import CustomerRequest, WorkflowPool, create_data_workflow  # noqa: E402
+
+
+def _timed(samples: list[float], start: float) -> None:
+    samples.append((time.perf_counter() - start) * 1000)
+
+
+async def _run(iterations: int) -> dict[str, list[float]]:
+    build, rebuild_run, pooled_run = [], [], []
+    pool = WorkflowPool(size=1)
+    req = CustomerRequest(customer_name="Contoso", request_text="")
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        create_data_workflow()
+        _timed(build, start)
+
+        start = time.perf_counter()
+        await create_data_workflow().run(req)
+        _timed(rebuild_run, start)
+
+        start = time.perf_counter()
+        with pool.checkout() as wf:
+            await wf.run(req)
+        _timed(pooled_run, start)
+
+    return {
+        "build graph only": build,
+        "build + run (before)": rebuild_run,
+        "pooled run (after)": pooled_run,
+    }
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    results = asyncio.run(_run(iterations))
+    print(f"{iterations} iterations, mock data\n")
+    print(f"{'':24} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for label, samples in results.items():
+        samples.sort()
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        print(f"{label:24} {statistics.mean(samples):9.3f} {statistics.median(samples):9.3f} {p95:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""Build-time script: pre-strip the PowerPoint brand template.
+
+Writes a slide-free .pptx next to PPTX_TEMPLATE, named by the template's
+content hash, so the first deck in a cold container skips the ZIP rewrite.
+
+Usage:
+    python -m scripts.build_template_artifact
+"""
+
+from __future__ import annotations
+
+from src.tools.doc_generator import build_template_artifact
+
+
+def main():
+    artifact = build_template_artifact()
+    print(f"Template artifact: {artifact} ({artifact.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Admission control — bounds concurrent agent runs on ``/responses``.
+
+Every run holds a Copilot session, workflow threads and often a render slot;
+letting a burst of meeting-prep requests all start at once just makes every
+one of them slow.  ``AdmissionMiddleware`` admits at most
+``ADMISSION_MAX_CONCURRENT_RUNS`` runs, parks up to ``ADMISSION_MAX_QUEUED``
+more in a wait queue, and answers anything beyond that — or anything that
+waited longer than ``ADMISSION_MAX_WAIT_SECONDS`` — with an immediate 429 and
+a ``Retry-After`` header.  A slot is held until the response (including a
+streamed one) has been fully sent.
+
+Requests are sorted into two lanes by ``classify_prompt``:
+
+* ``lookup`` — quick, targeted questions ("What's Contoso's renewal date?").
+  They are dequeued before any waiting prep and may use
+  ``ADMISSION_LOOKUP_SLOTS`` extra slots, so they stay fast during a burst;
+* ``prep`` — everything else, including full meeting prep and documents.
+
+Queue depth, active runs, wait time and rejections are exported as
+OpenTelemetry metrics (``sales_agent.admission.*``, by ``lane``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from opentelemetry import metrics
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import (
+    ADMISSION_LOOKUP_SLOTS,
+    ADMISSION_MAX_CONCURRENT_RUNS,
+    ADMISSION_MAX_QUEUED,
+    ADMISSION_MAX_WAIT_SECONDS,
+    ADMISSION_RETRY_AFTER_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+LOOKUP = "lookup"
+PREP = "prep"
+_LANES = (LOOKUP, PREP)  # dequeue order
+
+_meter = metrics.get_meter(__name__)
+_queue_depth = _meter.create_up_down_counter(
+    "sales_agent.admission.queue_depth", unit="{request}", description="Requests waiting for a run slot")
+_active_runs = _meter.create_up_down_counter(
+    "sales_agent.admission.active_runs", unit="{request}", description="Agent runs in progress")
+_wait_time = _meter.create_histogram(
+    "sales_agent.admission.wait_time", unit="ms", description="Time from arrival to admission")
+_rejected = _meter.create_counter(
+    "sales_agent.admission.rejected", unit="{request}", description="Requests answered with 429")
+
+# Prompts that can trigger the workflow, rendering or a long agent loop.
+_PREP_WORDS = re.compile(
+    r"\b(prep\w*|prepar\w*|brief\w*|doc|docs|document\w*|deck\w*|presentation\w*|slides?|"
+    r"pptx|docx|package|workflow|everything)\b",
+    re.IGNORECASE,
+)
+_LOOKUP_MAX_CHARS = 300
+
+
+def classify_prompt(prompt: str) -> str:
+    """``lookup`` for a short question that names no prep or document work, else ``prep``."""
+    if not prompt.strip() or len(prompt) > _LOOKUP_MAX_CHARS or _PREP_WORDS.search(prompt):
+        return PREP
+    return LOOKUP
+
+
+class AdmissionRejected(Exception):
+    """No run slot available; retry after ``retry_after`` seconds."""
+
+    def __init__(self, lane: str, reason: str, retry_after: int):
+        self.lane = lane
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"Server busy ({reason}); retry after {retry_after}s")
+
+
+class AdmissionController:
+    """Concurrency limit with a bounded, two-lane wait queue.
+
+    Not thread-safe: use it from one event loop.  ``max_concurrent <= 0``
+    disables the limit.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = ADMISSION_MAX_CONCURRENT_RUNS,
+        max_queued: int = ADMISSION_MAX_QUEUED,
+        lookup_slots: int = ADMISSION_LOOKUP_SLOTS,
+        max_wait: float = ADMISSION_MAX_WAIT_SECONDS,
+        retry_after: int = ADMISSION_RETRY_AFTER_SECONDS,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.lookup_slots = lookup_slots
+        self.max_wait = max_wait
+        self.retry_after = retry_after
+        self.active = 0
+        self._waiters: dict[str, deque[asyncio.Future[None]]] = {lane: deque() for lane in _LANES}
+
+    def _limit(self, lane: str) -> int:
+        return self.max_concurrent + (self.lookup_slots if lane == LOOKUP else 0)
+
+    def queued(self, lane: str | None = None) -> int:
+        lanes = (lane,) if lane else _LANES
+        return sum(1 for name in lanes for f in self._waiters[name] if not f.done())
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"active": self.active, **{f"queued_{lane}": self.queued(lane) for lane in _LANES}}
+
+    def _ahead_of(self, lane: str) -> int:
+        """Waiters that would be dequeued before a new request in ``lane``."""
+        return self.queued(LOOKUP) if lane == LOOKUP else self.queued()
+
+    def _admit(self, lane: str, start: float) -> None:
+        _active_runs.add(1, {"lane": lane})
+        _wait_time.record((time.monotonic() - start) * 1000, {"lane": lane})
+
+    def _reject(self, lane: str, reason: str) -> AdmissionRejected:
+        _rejected.add(1, {"lane": lane, "reason": reason})
+        logger.warning("[Admission] Rejected %s request (%s): %s", lane, reason, self.snapshot())
+        return AdmissionRejected(lane, reason, self.retry_after)
+
+    async def acquire(self, lane: str) -> None:
+        """Wait for a run slot, or raise AdmissionRejected."""
+        start = time.monotonic()
+        if self.max_concurrent <= 0 or (self.active < self._limit(lane) and not self._ahead_of(lane)):
+            self.active += 1
+            self._admit(lane, start)
+            return
+        if self.queued() >= self.max_queued:
+            raise self._reject(lane, "queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(waiter)
+        _queue_depth.add(1, {"lane": lane})
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.max_wait)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done():
+                # A slot was reserved for us just as we gave up — pass it on.
+                self._free()
+            else:
+                waiter.cancel()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise self._reject(lane, "wait_timeout") from None
+        finally:
+            _queue_depth.add(-1, {"lane": lane})
+        self._admit(lane, start)
+
+    def release(self, lane: str) -> None:
+        """Give back a slot taken by ``acquire``."""
+        _active_runs.add(-1, {"lane": lane})
+        self._free()
+
+    def _free(self) -> None:
+        """Free a slot and hand it to the next waiter, lookups first."""
+        self.active -= 1
+        for name in _LANES:
+            queue = self._waiters[name]
+            while queue and self.active < self._limit(name):
+                waiter = queue.popleft()
+                if not waiter.done():
+                    # Reserve the slot now so a newcomer can't take it
+                    # before the waiter resumes.
+                    self.active += 1
+                    waiter.set_result(None)
+                    return
+
+    @asynccontextmanager
+    async def slot(self, lane: str) -> AsyncIterator[None]:
+        await self.acquire(lane)
+        try:
+            yield
+        finally:
+            self.release(lane)
+
+
+class AdmissionMiddleware:
+    """ASGI middleware that runs ``paths`` POSTs through an AdmissionController.
+
+    ``lane_of`` maps the parsed JSON body to a lane; unparsable bodies go to
+    ``prep`` and are rejected downstream as usual.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController,
+        lane_of: Callable[[dict[str, Any]], str],
+        paths: tuple[str, ...] = ("/responses", "/runs"),
+    ):
+        self.app = app
+        self.controller = controller
+        self.lane_of = lane_of
+        self.paths = paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        # Read the body up front to pick a lane, then replay it downstream.
+        messages: list[Message] = []
+        body = b""
+        while True:
+            message = await receive()
+            messages.append(message)
+            body += message.get("body", b"")
+            if message["type"] != "http.request" or not message.get("more_body"):
+                break
+        try:
+            payload = json.loads(body)
+            lane = self.lane_of(payload) if isinstance(payload, dict) else PREP
+        except ValueError:
+            lane = PREP
+
+        try:
+            await self.controller.acquire(lane)
+        except AdmissionRejected as e:
+            response = JSONResponse(
+                {"error": {"code": "too_many_requests", "message": str(e)}},
+                status_code=429,
+                headers={"Retry-After": str(e.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        async def replay() -> Message:
+            return messages.pop(0) if messages else await receive()
+
+        try:
+            await self.app(scope, replay, send)
+        finally:
+            self.controller.release(lane)
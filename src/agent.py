@@ -28,18 +28,33 @@ Individual data lookups (use for quick, targeted questions):
 - get_fabric_iq_data: Business metrics (contract, spend, usage, support tickets)
 - get_foundry_iq_data: Sales enablement materials (sales plays, competitive intel)
 
-Parallel workflow (use for full meeting prep — gathers all 3 at once):
+Full meeting prep (use for "prepare for my meeting with X"):
+- prepare_meeting_package: Runs a deterministic Agent Framework pipeline that
+  gathers all 3 data sources in parallel AND generates the Word prep doc and
+  PowerPoint deck, returning their links in "documents" plus the gathered
+  data. Do NOT call the document tools afterwards — just write the summary
+  and share the links. If "render_error" is set, tell the user why the
+  documents are missing.
+
+Parallel workflow (use when the user wants all the data but no documents):
 - run_meeting_prep_workflow: Runs a deterministic Agent Framework workflow that
   fans out to all 3 data sources in parallel, then aggregates the results.
-  Much faster than calling the 3 tools sequentially. Use this when the user
-  asks for comprehensive meeting prep.
+  Much faster than calling the 3 tools sequentially.
+
+For both: if "degraded" is true, tell the user which sources are missing
+(see "timed_out") rather than guessing.
 
 Document generation (use after data has been gathered):
-- generate_prep_doc: Generate a Word meeting prep document
-- generate_presentation: Generate a branded PowerPoint deck
+- generate_meeting_package: Generate the Word prep doc AND the PowerPoint deck
+  in one call (renders both in parallel). Prefer this when both are needed.
+- generate_prep_doc: Generate a Word meeting prep document only
+- generate_presentation: Generate a branded PowerPoint deck only
+Pass the "intel_id" from run_meeting_prep_workflow to these tools. Never copy
+the gathered data into their arguments — the data stays on the server.
 
 Decision guide:
-- "Prepare for meeting with X" → call run_meeting_prep_workflow, then generate docs
+- "Prepare for meeting with X" → call prepare_meeting_package once
+- "Give me everything on X" (no documents) → call run_meeting_prep_workflow
 - "What's the latest email from X?" → call get_work_iq_data only
 - "Show me Contoso's contract details" → call get_fabric_iq_data only
 
@@ -67,21 +82,29 @@ def create_orchestrator():
 
     from src.middleware import DocGenerationGuardrail, ToolLoggingMiddleware
     from src.tools import (
+        generate_meeting_package,
         generate_prep_doc,
         generate_presentation,
         get_fabric_iq_data,
         get_foundry_iq_data,
         get_work_iq_data,
     )
-    from src.workflow import run_meeting_prep_workflow
+    from src.tools.compaction import compact_tool
+    from src.tools.doc_generator import async_doc_tool
+    from src.workflow import prepare_meeting_package, run_meeting_prep_workflow
 
+    # IQ lookups hand the LLM a token-budgeted view; the full data stays
+    # server-side.  Document tools are CPU-bound — run them in the render
+    # pool so they don't block the event loop.
     tools = [
-        get_work_iq_data,
-        get_fabric_iq_data,
-        get_foundry_iq_data,
+        compact_tool("work_iq", get_work_iq_data),
+        compact_tool("fabric_iq", get_fabric_iq_data),
+        compact_tool("foundry_iq", get_foundry_iq_data),
+        prepare_meeting_package,
         run_meeting_prep_workflow,
-        generate_prep_doc,
-        generate_presentation,
+        generate_meeting_package,
+        async_doc_tool(generate_prep_doc),
+        async_doc_tool(generate_presentation),
     ]
 
     middleware = [
@@ -211,6 +234,33 @@ def create_orchestrator():
             print(f"[SalesAgent] RESUMING session {session_id}", flush=True)
             return await self._client.resume_session(session_id, config)
 
+        # ── Progress routing ──
+        # Tool handlers are invoked from the Copilot SDK's JSON-RPC reader, so
+        # nothing from the HTTP request's context reaches them.  Link the
+        # request's AgentSession to the Copilot session id, and bind that id
+        # around every tool call so tools can publish progress to the right
+        # SSE stream (see src.progress).
+
+        async def _get_or_create_session(self, agent_session, streaming=False, runtime_options=None):
+            from src import progress
+
+            session = await super()._get_or_create_session(agent_session, streaming, runtime_options)
+            progress.link(agent_session, session.session_id)
+            return session
+
+        def _tool_to_copilot_tool(self, ai_func):
+            from src import progress
+
+            tool = super()._tool_to_copilot_tool(ai_func)
+            inner = tool.handler
+
+            async def handler(invocation):
+                with progress.bind(invocation.get("session_id")):
+                    return await inner(invocation)
+
+            tool.handler = handler
+            return tool
+
     return SalesAgent(
         instructions=SYSTEM_INSTRUCTIONS,
         tools=tools,
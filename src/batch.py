@@ -0,0 +1,224 @@
+"""Batch meeting prep — gather and render documents for many customers at once.
+
+Before QBR week sales ops preps dozens to hundreds of accounts.  Rather than
+one ``/responses`` call (and one LLM loop) per customer, ``run_batch_prep``
+drives the meeting-prep workflow directly:
+
+* Work IQ for every customer is prefetched up front in Graph $batch calls,
+  which fills the IQ cache the per-customer workflows then read from;
+* up to ``BATCH_CONCURRENCY`` customers are gathered at once, each fanning
+  out to its three sources under the usual per-source deadlines, so at most
+  ``3 × BATCH_CONCURRENCY`` source calls are in flight;
+* a customer's meeting package is rendered in the render pool as soon as its
+  data is in, with at most ``BATCH_RENDER_CONCURRENCY`` packages at a time so
+  the batch never overflows the pool's queue and starves interactive requests;
+* a customer with a failed, timed-out or sign-in-blocked source is reported
+  (``error``, or ``degraded`` if the sources only timed out) and not rendered
+  — the same rule the interactive pipeline applies.
+
+IQ caches, single-flight coalescing, HTTP pools and prebuilt workflows are
+the process-wide ones the server uses.  Each customer gets a
+``CustomerReport`` with its status, document URLs and timings.
+
+Usage:
+    sales-prep-batch Contoso Fabrikam "Northwind Traders"
+    sales-prep-batch --file customers.txt --report batch_report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.config import (
+    BATCH_CONCURRENCY,
+    BATCH_RENDER_CONCURRENCY,
+    USE_MOCK_DATA,
+    WORKFLOW_SOURCE_TIMEOUTS,
+)
+from src.tools import generate_meeting_package, http_pool, render_pool
+from src.tools.customer_resolver import canonical_key
+from src.tools.work_iq import get_work_iq_data_many
+from src.workflow import render_blocker, stream_meeting_prep_workflow
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CustomerReport:
+    customer_name: str
+    status: str = "pending"  # ok | degraded | error
+    documents: dict[str, str] = field(default_factory=dict)
+    sources: dict[str, str] = field(default_factory=dict)  # source → completed | timed_out | error
+    timed_out: list[str] = field(default_factory=list)
+    timings_ms: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+
+def _dedupe(customer_names: list[str]) -> list[str]:
+    """Drop blanks and repeats of the same account, keeping the first spelling."""
+    seen: set[str] = set()
+    unique = []
+    for name in (n.strip() for n in customer_names):
+        if name and canonical_key(name) not in seen:
+            seen.add(canonical_key(name))
+            unique.append(name)
+    return unique
+
+
+async def _prefetch_work_iq(customer_names: list[str]) -> None:
+    """Warm the IQ cache with one batched Graph pass over every customer."""
+    if USE_MOCK_DATA:
+        return
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(get_work_iq_data_many(customer_names), WORKFLOW_SOURCE_TIMEOUTS["work_iq"])
+    except Exception as e:
+        # Best effort: each customer's workflow fetches whatever is missing.
+        logger.warning("[Batch] Work IQ prefetch incomplete: %r", e)
+    logger.info("[Batch] Work IQ prefetch for %d customers took %.0f ms",
+                len(customer_names), (time.perf_counter() - start) * 1000)
+
+
+async def _prep_one(customer_name: str, gather_slots: asyncio.Semaphore,
+                    render_slots: asyncio.Semaphore | None) -> CustomerReport:
+    report = CustomerReport(customer_name=customer_name)
+    start = time.perf_counter()
+    result: dict[str, Any] = {}
+
+    async with gather_slots:
+        async for event in stream_meeting_prep_workflow(customer_name):
+            if event["type"] == "source":
+                report.sources[event["source"]] = event["status"]
+                report.timings_ms[event["source"]] = event["elapsed_ms"]
+            else:
+                result = event["result"]
+    report.timings_ms["gather"] = round((time.perf_counter() - start) * 1000, 1)
+    report.timed_out = result.get("timed_out", [])
+
+    blocker = None if "error" in result else render_blocker({s: result.get(s) or {} for s in report.sources})
+    if "error" in result:
+        report.status, report.error = "error", result["error"]
+    elif blocker:
+        # Same completeness rule as the interactive path: no documents from
+        # missing data.  Sources that only timed out may work on a retry.
+        failed = [s for s, status in report.sources.items() if status != "completed"]
+        timed_out_only = bool(failed) and set(failed) <= set(report.timed_out)
+        report.status, report.error = ("degraded" if timed_out_only else "error"), blocker
+    elif render_slots is not None:
+        render_start = time.perf_counter()
+        try:
+            async with render_slots:
+                report.documents = await generate_meeting_package(
+                    customer_name, result["work_iq"], result["fabric_iq"], result["foundry_iq"],
+                )
+        except Exception as e:
+            logger.warning("[Batch] Rendering failed for %s: %r", customer_name, e)
+            report.status, report.error = "error", f"Document rendering failed: {e}"
+        report.timings_ms["render"] = round((time.perf_counter() - render_start) * 1000, 1)
+
+    if report.status == "pending":
+        report.status = "degraded" if result.get("degraded") else "ok"
+    report.timings_ms["total"] = round((time.perf_counter() - start) * 1000, 1)
+    logger.info("[Batch] %s: %s in %.0f ms", customer_name, report.status, report.timings_ms["total"])
+    return report
+
+
+async def run_batch_prep(
+    customer_names: list[str],
+    *,
+    concurrency: int = BATCH_CONCURRENCY,
+    render: bool = True,
+    render_concurrency: int = BATCH_RENDER_CONCURRENCY,
+) -> list[CustomerReport]:
+    """Gather intel (and, with ``render``, the meeting package) for every customer.
+
+    Returns one report per distinct customer, in input order.  A failure for
+    one customer is recorded in its report and never stops the batch.
+    """
+    names = _dedupe(customer_names)
+    if not names:
+        return []
+    await _prefetch_work_iq(names)
+
+    gather_slots = asyncio.Semaphore(max(concurrency, 1))
+    render_slots = asyncio.Semaphore(max(render_concurrency, 1)) if render else None
+    results = await asyncio.gather(
+        *(_prep_one(name, gather_slots, render_slots) for name in names),
+        return_exceptions=True,
+    )
+
+    reports = []
+    for name, result in zip(names, results):
+        if isinstance(result, BaseException):
+            logger.error("[Batch] %s failed: %r", name, result)
+            result = CustomerReport(customer_name=name, status="error", error=str(result) or repr(result))
+        reports.append(result)
+    return reports
+
+
+# ── CLI ────────────────────────────────────────────────────────────────
+
+
+def _read_customers(path: Path) -> list[str]:
+    """One customer per line; blank lines and ``#`` comments are skipped."""
+    return [
+        line.strip() for line in path.read_text(encoding="utf-8").splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+
+
+async def _main(args: argparse.Namespace) -> list[CustomerReport]:
+    if not args.no_docs:
+        await asyncio.to_thread(render_pool.start)
+    try:
+        return await run_batch_prep(
+            args.customers + (_read_customers(args.file) if args.file else []),
+            concurrency=args.concurrency,
+            render=not args.no_docs,
+        )
+    finally:
+        await http_pool.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Prepare meeting packages for many customers at once.")
+    parser.add_argument("customers", nargs="*", help="Customer names")
+    parser.add_argument("-f", "--file", type=Path, help="File with one customer name per line")
+    parser.add_argument("-c", "--concurrency", type=int, default=BATCH_CONCURRENCY,
+                        help=f"Customers gathered at once (default {BATCH_CONCURRENCY})")
+    parser.add_argument("--no-docs", action="store_true", help="Gather data only; skip rendering")
+    parser.add_argument("--report", type=Path, help="Write the full JSON report here")
+    args = parser.parse_args()
+    if not args.customers and not args.file:
+        parser.error("give customer names or --file")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    start = time.perf_counter()
+    try:
+        reports = asyncio.run(_main(args))
+    finally:
+        render_pool.shutdown()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{'Customer':32} {'Status':9} {'Gather ms':>10} {'Render ms':>10}  Timed out")
+    for r in reports:
+        print(f"{r.customer_name[:32]:32} {r.status:9} {r.timings_ms.get('gather', 0):10.0f} "
+              f"{r.timings_ms.get('render', 0):10.0f}  {', '.join(r.timed_out) or '-'}")
+    counts = {s: sum(r.status == s for r in reports) for s in ("ok", "degraded", "error")}
+    print(f"\n{len(reports)} customers in {elapsed:.1f}s — "
+          + ", ".join(f"{n} {s}" for s, n in counts.items()))
+
+    if args.report:
+        args.report.write_text(json.dumps([asdict(r) for r in reports], indent=2), encoding="utf-8")
+        print(f"Report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
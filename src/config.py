@@ -44,6 +44,76 @@ TOKEN_STORAGE_URL: str | None = os.getenv("TOKEN_STORAGE_URL")
 # ── Output blob storage (upload generated docs) ─────────────────────
 OUTPUT_STORAGE_ACCOUNT_URL: str | None = os.getenv("OUTPUT_STORAGE_ACCOUNT_URL")  # e.g. "https://salespresdemostor.blob.core.windows.net"
 OUTPUT_STORAGE_CONTAINER: str = os.getenv("OUTPUT_STORAGE_CONTAINER", "output")
+# Account-key auth instead of Entra ID, e.g. "UseDevelopmentStorage=true" for Azurite
+OUTPUT_STORAGE_CONNECTION_STRING: str | None = os.getenv("OUTPUT_STORAGE_CONNECTION_STRING")
+# Keep a copy of generated docs in OUTPUT_DIR.  On by default only when there
+# is no blob storage to upload to (local dev); otherwise docs go straight from
+# memory to blob storage.
+SAVE_LOCAL_OUTPUT: bool = os.getenv(
+    "SAVE_LOCAL_OUTPUT",
+    "false" if OUTPUT_STORAGE_ACCOUNT_URL or OUTPUT_STORAGE_CONNECTION_STRING else "true",
+).lower() == "true"
+
+# ── Output cache (content-addressed reuse of generated docs) ─────────
+OUTPUT_CACHE_MAX_BYTES: int = int(os.getenv("OUTPUT_CACHE_MAX_BYTES", str(500 * 1024 * 1024)))
+OUTPUT_CACHE_MAX_FILES: int = int(os.getenv("OUTPUT_CACHE_MAX_FILES", "200"))
+
+# ── Render pool (docx/pptx generation off the event loop) ────────────
+RENDER_POOL_SIZE: int = int(os.getenv("RENDER_POOL_SIZE", "0"))  # 0 = use a worker thread
+RENDER_QUEUE_DEPTH: int = int(os.getenv("RENDER_QUEUE_DEPTH", "8"))  # waiting renders beyond the pool size
+
+# ── Outbound HTTP (Graph / AI Search) retries and rate limiting ──────
+HTTP_RETRY_MAX_ATTEMPTS: int = int(os.getenv("HTTP_RETRY_MAX_ATTEMPTS", "5"))
+HTTP_RETRY_DEADLINE_SECONDS: float = float(os.getenv("HTTP_RETRY_DEADLINE_SECONDS", "30"))
+HTTP_RATE_LIMIT_PER_SECOND: float = float(os.getenv("HTTP_RATE_LIMIT_PER_SECOND", "15"))  # per host
+HTTP_RATE_LIMIT_BURST: int = int(os.getenv("HTTP_RATE_LIMIT_BURST", "30"))
+
+# ── IQ result cache (per customer, stale-while-revalidate) ─────────
+# Seconds a result is fresh, per source; 0 disables caching for that source.
+IQ_CACHE_TTLS: dict[str, float] = {
+    "work_iq": float(os.getenv("IQ_CACHE_TTL_WORK_IQ", "300")),
+    "fabric_iq": float(os.getenv("IQ_CACHE_TTL_FABRIC_IQ", "900")),
+    "foundry_iq": float(os.getenv("IQ_CACHE_TTL_FOUNDRY_IQ", "3600")),
+}
+IQ_CACHE_STALE_SECONDS: float = float(os.getenv("IQ_CACHE_STALE_SECONDS", "600"))  # served while refreshing
+IQ_CACHE_NEGATIVE_TTL: float = float(os.getenv("IQ_CACHE_NEGATIVE_TTL", "60"))  # "not found" results
+IQ_CACHE_MAX_ENTRIES: int = int(os.getenv("IQ_CACHE_MAX_ENTRIES", "1024"))
+IQ_CACHE_BACKEND: str = os.getenv("IQ_CACHE_BACKEND", "memory").lower()  # memory | sqlite
+IQ_CACHE_PATH: Path = _PROJECT_ROOT / os.getenv("IQ_CACHE_PATH", ".cache/iq_cache.sqlite3")
+
+# ── Meeting-prep workflow deadlines ───────────────────────────────────
+# Each source gets its own deadline; the whole gather must finish within
+# WORKFLOW_BUDGET_SECONDS.  Late sources are reported as timed out.
+WORKFLOW_SOURCE_TIMEOUTS: dict[str, float] = {
+    "work_iq": float(os.getenv("WORKFLOW_TIMEOUT_WORK_IQ", "12")),
+    "fabric_iq": float(os.getenv("WORKFLOW_TIMEOUT_FABRIC_IQ", "8")),
+    "foundry_iq": float(os.getenv("WORKFLOW_TIMEOUT_FOUNDRY_IQ", "10")),
+}
+WORKFLOW_BUDGET_SECONDS: float = float(os.getenv("WORKFLOW_BUDGET_SECONDS", "15"))
+# Rendering both documents in the full-prep pipeline, after the gather budget.
+WORKFLOW_RENDER_TIMEOUT_SECONDS: float = float(os.getenv("WORKFLOW_RENDER_TIMEOUT_SECONDS", "30"))
+# Prebuilt workflow instances (one per concurrent run; more are built on demand).
+WORKFLOW_POOL_SIZE: int = int(os.getenv("WORKFLOW_POOL_SIZE", "4"))
+
+# ── IQ payloads shown to the LLM ──────────────────────────────────────
+# Estimated tokens per source; larger payloads are ranked and trimmed.
+IQ_PROMPT_TOKEN_BUDGET: int = int(os.getenv("IQ_PROMPT_TOKEN_BUDGET", "600"))
+
+# ── Intel store (server-side IQ data behind intel_id handles) ──────
+INTEL_STORE_TTL_SECONDS: float = float(os.getenv("INTEL_STORE_TTL_SECONDS", "3600"))
+INTEL_STORE_MAX_ENTRIES: int = int(os.getenv("INTEL_STORE_MAX_ENTRIES", "512"))
+
+# ── Batch meeting prep (many customers per run) ──────────────────────
+BATCH_CONCURRENCY: int = int(os.getenv("BATCH_CONCURRENCY", "8"))  # customers gathered at once
+# Meeting packages rendered at once; keeps batch renders inside the render pool's queue.
+BATCH_RENDER_CONCURRENCY: int = int(os.getenv("BATCH_RENDER_CONCURRENCY", str(max(RENDER_POOL_SIZE, 1))))
+
+# ── Admission control (/responses) ───────────────────────────────────
+ADMISSION_MAX_CONCURRENT_RUNS: int = int(os.getenv("ADMISSION_MAX_CONCURRENT_RUNS", "8"))  # 0 = unlimited
+ADMISSION_MAX_QUEUED: int = int(os.getenv("ADMISSION_MAX_QUEUED", "16"))  # waiting runs; beyond this → 429
+ADMISSION_LOOKUP_SLOTS: int = int(os.getenv("ADMISSION_LOOKUP_SLOTS", "2"))  # extra slots for quick lookups
+ADMISSION_MAX_WAIT_SECONDS: float = float(os.getenv("ADMISSION_MAX_WAIT_SECONDS", "30"))
+ADMISSION_RETRY_AFTER_SECONDS: int = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "5"))
 
 # ── Fabric IQ ─────────────────────────────────────────────────────────
 FABRIC_WORKSPACE_ID: str | None = os.getenv("FABRIC_WORKSPACE_ID")
@@ -13,6 +13,7 @@ from __future__ import annotations
 import logging
 import time
 from collections.abc import Awaitable, Callable
+from typing import NoReturn
 
 from agent_framework import (
     FunctionInvocationContext,
@@ -20,6 +21,8 @@ from agent_framework import (
     MiddlewareTermination,
 )
 
+from src.tools import intel_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,13 +51,15 @@ class ToolLoggingMiddleware(FunctionMiddleware):
 
 
 class DocGenerationGuardrail(FunctionMiddleware):
-    """Block generate_prep_doc / generate_presentation when IQ data is empty.
+    """Block document generation tools when IQ data is empty.
 
     Prevents the LLM from generating documents with hallucinated data by
     requiring all three data sources to be populated before document creation.
+    With an ``intel_id`` the check runs against the server-side intel store,
+    so the handle must exist, belong to this session and be complete.
     """
 
-    _GUARDED_TOOLS = frozenset({"generate_prep_doc", "generate_presentation"})
+    _GUARDED_TOOLS = frozenset({"generate_prep_doc", "generate_presentation", "generate_meeting_package"})
     _IQ_ARGS = ("work_iq", "fabric_iq", "foundry_iq")
 
     async def process(
@@ -75,6 +80,21 @@ class DocGenerationGuardrail(FunctionMiddleware):
         else:
             arg_dict = dict(args)
 
+        intel_id = arg_dict.get("intel_id")
+        if intel_id:
+            try:
+                missing = intel_store.get_store().get(intel_id).missing()
+            except intel_store.IntelNotFound as e:
+                self._block(f"BLOCKED: {context.function.name} — {e}")
+            if missing:
+                self._block(
+                    f"BLOCKED: {context.function.name} — intel {intel_id} has no usable data for "
+                    f"{', '.join(missing)}. Resolve that first (e.g. sign in) and run "
+                    f"run_meeting_prep_workflow again."
+                )
+            await call_next()
+            return
+
         missing = [a for a in self._IQ_ARGS if not arg_dict.get(a)]
 
         if missing:
@@ -83,7 +103,11 @@ class DocGenerationGuardrail(FunctionMiddleware):
                 f"{', '.join(missing)}. Gather the data first using the "
                 f"corresponding IQ tools before generating documents."
             )
-            logger.warning("[Guardrail] %s", msg)
-            raise MiddlewareTermination(msg, result=msg)
+            self._block(msg)
 
         await call_next()
+
+    @staticmethod
+    def _block(msg: str) -> NoReturn:
+        logger.warning("[Guardrail] %s", msg)
+        raise MiddlewareTermination(msg, result=msg)
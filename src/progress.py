@@ -0,0 +1,117 @@
+"""Progress events — side channel from tools to the request's SSE stream.
+
+Tool calls arrive from the Copilot SDK's JSON-RPC reader, not from the task
+serving the HTTP request, so the server cannot simply pass a callback down.
+Instead:
+
+1. the server opens a ``ProgressChannel`` for its AgentSession;
+2. the agent links that AgentSession to the Copilot session id once the
+   session exists, and binds ``current_session`` around every tool call;
+3. tools (e.g. the meeting-prep workflow) call ``publish`` — the event goes
+   to the channel of whichever request the tool call belongs to, or nowhere
+   if that request is not streaming.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import threading
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+current_session: ContextVar[str | None] = ContextVar("progress_session", default=None)
+
+# Progress is best effort: a stalled client must not grow memory unbounded.
+_MAX_PENDING_EVENTS = 256
+
+
+class ProgressChannel:
+    """Bounded queue of progress events for one streaming response."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_MAX_PENDING_EVENTS)
+        self.session_id: str | None = None
+
+    def _put(self, event: dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.debug("Dropping progress event for session %s", self.session_id)
+
+    def put(self, event: dict[str, Any]) -> None:
+        """Enqueue ``event`` from any thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._put(event)
+        else:
+            self._loop.call_soon_threadsafe(self._put, event)
+
+    async def get(self) -> dict[str, Any]:
+        return await self._queue.get()
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Take every event already queued, without waiting."""
+        events = []
+        while not self._queue.empty():
+            events.append(self._queue.get_nowait())
+        return events
+
+
+_by_owner: dict[int, ProgressChannel] = {}
+_by_session: dict[str, ProgressChannel] = {}
+_lock = threading.Lock()
+
+
+def open_channel(owner: object) -> ProgressChannel:
+    """Start collecting progress for the request that owns ``owner`` (its AgentSession)."""
+    channel = ProgressChannel()
+    with _lock:
+        _by_owner[id(owner)] = channel
+    return channel
+
+
+def close_channel(owner: object) -> None:
+    with _lock:
+        channel = _by_owner.pop(id(owner), None)
+        if channel is not None and channel.session_id is not None:
+            _by_session.pop(channel.session_id, None)
+
+
+def link(owner: object, session_id: str) -> None:
+    """Route events published under ``session_id`` to ``owner``'s channel, if any."""
+    with _lock:
+        channel = _by_owner.get(id(owner))
+        if channel is not None:
+            channel.session_id = session_id
+            _by_session[session_id] = channel
+
+
+@contextlib.contextmanager
+def bind(session_id: str | None) -> Iterator[None]:
+    """Attribute everything published inside the block to ``session_id``."""
+    token = current_session.set(session_id)
+    try:
+        yield
+    finally:
+        current_session.reset(token)
+
+
+def publish(event: dict[str, Any]) -> bool:
+    """Send ``event`` to the current request's stream.  Returns False if nobody listens."""
+    session_id = current_session.get()
+    if session_id is None:
+        return False
+    with _lock:
+        channel = _by_session.get(session_id)
+    if channel is None:
+        return False
+    channel.put(event)
+    return True
@@ -3,7 +3,10 @@
 Subclasses FoundryCBAgent from azure-ai-agentserver-core to expose:
 - POST /responses  — OpenAI Responses API format (SSE streaming)
 - GET  /liveness   — health check
-- GET  /readiness  — readiness check
+- GET  /readiness  — readiness check (503 until startup warm-up has finished)
+
+Concurrent agent runs are bounded by ``src.admission``: excess requests wait
+in a short queue or get a 429 with ``Retry-After``.
 
 The server is a thin adapter — the agent handles tool selection,
 workflow invocation, and document generation autonomously.
@@ -14,7 +17,9 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
-from typing import AsyncGenerator
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator
 
 from azure.ai.agentserver.core import FoundryCBAgent, AgentRunContext
 from azure.ai.agentserver.core.models import Response as OpenAIResponse
@@ -34,8 +39,13 @@ from azure.ai.agentserver.core.models.projects import (
 )
 
 from agent_framework import AgentSession
+from starlette.responses import JSONResponse
 
+from src import admission, progress
 from src.agent import create_orchestrator
+from src.config import MOCK_DATA_DIR
+from src.tools import customer_resolver, http_pool, mock_store, render_pool
+from src.workflow import get_pipeline_pool, get_workflow_pool
 
 # ── Enhancement 3: OpenTelemetry Observability ─────────────────────────
 # One call enables distributed tracing across the entire stack — every
@@ -50,24 +60,162 @@ except Exception as exc:
 logger = logging.getLogger(__name__)
 
 
+def _workflow_progress_event(sequence_number: int, event: dict[str, Any]) -> ResponseStreamEvent:
+    """Per-source progress from the meeting-prep workflow.
+
+    Emitted as each data source finishes so clients can render partial
+    results while the agent is still working.  Carries the source's status
+    and the same compact summary the LLM sees — never the raw data.  Not part
+    of the OpenAI Responses API; clients that don't know the type ignore it.
+    """
+    return ResponseStreamEvent({
+        "type": "response.workflow_progress",
+        "sequence_number": sequence_number,
+        "customer_name": event.get("customer_name", ""),
+        "source": event.get("source", ""),
+        "status": event.get("status", ""),
+        "elapsed_ms": event.get("elapsed_ms", 0.0),
+        "summary": event.get("summary"),
+    })
+
+
+@dataclass
+class _ResponseStream:
+    """State of one streamed response.
+
+    The server instance is shared by every concurrent ``/responses`` request,
+    so sequence numbers, the accumulated text and the counters live here —
+    one object per stream — rather than on the server.
+    """
+
+    context: AgentRunContext
+    item_id: str
+    created_at: datetime.datetime
+    seq: int = 0
+    text: str = ""
+    update_count: int = 0
+    keepalive_count: int = 0
+    progress_count: int = 0
+
+    def next_seq(self) -> int:
+        val = self.seq
+        self.seq += 1
+        return val
+
+    def text_delta(self, delta: str) -> ResponseTextDeltaEvent:
+        self.text += delta
+        return ResponseTextDeltaEvent(
+            sequence_number=self.next_seq(),
+            item_id=self.item_id,
+            output_index=0,
+            content_index=0,
+            delta=delta,
+        )
+
+
 class SalesAgentServer(FoundryCBAgent):
     """FoundryCBAgent adapter that runs GitHubCopilotAgent internally."""
 
     def __init__(self):
         super().__init__()
         self._orchestrator = create_orchestrator()
-        self._started = False
-        self._seq = 0
+        self._ready = False
+        self._warmup: asyncio.Task | None = None
+        self._warmup_ms: dict[str, float] = {}
+        # Bound concurrent agent runs; excess requests queue or get a 429.
+        self.admission = admission.AdmissionController()
+        self.app.add_middleware(
+            admission.AdmissionMiddleware,
+            controller=self.admission,
+            lane_of=self._admission_lane,
+        )
 
-    def _next_seq(self) -> int:
-        val = self._seq
-        self._seq += 1
-        return val
+        @self.app.on_event("startup")
+        async def start_warm_up():
+            # In the background, so /liveness and /readiness answer meanwhile.
+            self._ensure_warm_up()
+
+    # ── Warm-up ───────────────────────────────────────────────────────
+
+    def _ensure_warm_up(self) -> asyncio.Task:
+        """Start warm-up unless it is running or done; retried after a failure."""
+        if self._warmup is None or (self._warmup.done() and not self._ready):
+            self._warmup = asyncio.create_task(self._warm_up())
+        return self._warmup
+
+    async def _warm_up(self) -> None:
+        """Pay every cold-start cost before the first request does.
+
+        The orchestrator (Copilot CLI subprocess) starts alongside the local
+        phases.  Only an orchestrator failure leaves the server not ready —
+        the other phases fall back to lazy initialization.
+        """
+        async def phase(name, fn, *, required=False):
+            start = time.perf_counter()
+            try:
+                await fn()
+            except Exception as exc:
+                print(f"[SalesAgent] Warm-up phase {name!r} failed: {exc!r}", flush=True)
+                if required:
+                    raise
+            finally:
+                self._warmup_ms[name] = round((time.perf_counter() - start) * 1000, 1)
+                print(f"[SalesAgent] Warm-up {name}: {self._warmup_ms[name]:.0f} ms", flush=True)
+
+        async def local_phases():
+            await phase("renderers", lambda: asyncio.to_thread(self._warm_renderers))
+            await phase("mock_data", lambda: asyncio.to_thread(self._warm_mock_data))
+            await phase("http_pools", self._warm_http_pools)
+            await phase("render_pool", lambda: asyncio.to_thread(render_pool.start))
+            await phase("workflows", lambda: asyncio.to_thread(self._warm_workflows))
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            phase("orchestrator", self._orchestrator.start, required=True),
+            local_phases(),
+        )
+        self._warmup_ms["total"] = round((time.perf_counter() - start) * 1000, 1)
+        self._ready = True
+        print(f"[SalesAgent] Warm-up complete in {self._warmup_ms['total']:.0f} ms — ready", flush=True)
+
+    @staticmethod
+    def _warm_renderers() -> None:
+        """Import docx/pptx and load the stripped brand template."""
+        from docx import Document
+
+        from src.tools import doc_generator
+
+        Document()
+        doc_generator._load_template()
+
+    @staticmethod
+    def _warm_mock_data() -> None:
+        customer_resolver.default_resolver()
+        mock_store.preload(*(
+            MOCK_DATA_DIR / name
+            for name in ("brands.json", "work_iq_data.json", "fabric_iq_data.json", "foundry_iq_data.json")
+        ))
+
+    @staticmethod
+    async def _warm_http_pools() -> None:
+        http_pool.get_client()
+        http_pool.get_async_client()
+
+    @staticmethod
+    def _warm_workflows() -> None:
+        get_workflow_pool()
+        get_pipeline_pool()
+
+    async def agent_readiness(self, request):
+        if not self._ready:
+            self._ensure_warm_up()
+            return JSONResponse({"status": "warming_up", "warmup_ms": self._warmup_ms}, status_code=503)
+        return {"status": "ready", "warmup_ms": self._warmup_ms}
 
     async def agent_run(self, context: AgentRunContext):
-        if not self._started:
-            await self._orchestrator.start()
-            self._started = True
+        if not self._ready:
+            # Requests that arrive before warm-up finishes wait for it.
+            await asyncio.shield(self._ensure_warm_up())
 
         # --- Diagnostic logging ---
         payload = context.raw_payload
@@ -109,38 +257,39 @@ class SalesAgentServer(FoundryCBAgent):
         self, prompt: str, session: AgentSession, context: AgentRunContext
     ) -> AsyncGenerator[ResponseStreamEvent, None]:
         """Yield RAPI SSE events following the standard envelope sequence."""
-        self._seq = 0
-        item_id = context.id_generator.generate_message_id()
-        now = datetime.datetime.now()
-        accumulated_text = ""
+        rs = _ResponseStream(
+            context=context,
+            item_id=context.id_generator.generate_message_id(),
+            created_at=datetime.datetime.now(),
+        )
 
         # --- Opening envelope ---
         yield ResponseCreatedEvent(
-            sequence_number=self._next_seq(),
-            response=self._build_response(context, "in_progress", now),
+            sequence_number=rs.next_seq(),
+            response=self._build_response(context, "in_progress", rs.created_at),
         )
 
         yield ResponseInProgressEvent(
-            sequence_number=self._next_seq(),
-            response=self._build_response(context, "in_progress", now),
+            sequence_number=rs.next_seq(),
+            response=self._build_response(context, "in_progress", rs.created_at),
         )
 
         # Output item (assistant message)
         item = ResponsesAssistantMessageItemResource(
-            id=item_id,
+            id=rs.item_id,
             status="in_progress",
             content=[],
         )
         yield ResponseOutputItemAddedEvent(
-            sequence_number=self._next_seq(),
+            sequence_number=rs.next_seq(),
             output_index=0,
             item=item,
         )
 
         # Content part (text)
         yield ResponseContentPartAddedEvent(
-            sequence_number=self._next_seq(),
-            item_id=item_id,
+            sequence_number=rs.next_seq(),
+            item_id=rs.item_id,
             output_index=0,
             content_index=0,
             part=ItemContentOutputText(text="", annotations=[]),
@@ -154,88 +303,97 @@ class SalesAgentServer(FoundryCBAgent):
         KEEPALIVE_INTERVAL = 15  # seconds — well under the ~30s proxy timeout
 
         print(f"[SalesAgent] Starting agent stream for prompt: {prompt[:80]!r}", flush=True)
-        update_count = 0
-        keepalive_count = 0
+        # Tools publish workflow progress to this channel while the agent runs
+        # (see src.progress); it is drained alongside the agent's own updates.
+        channel = progress.open_channel(session)
+        next_update: asyncio.Task | None = None
+        next_progress: asyncio.Task | None = None
         try:
             stream = self._orchestrator.run(prompt, stream=True, session=session)
             stream_iter = stream.__aiter__()
-            stream_exhausted = False
-
-            while not stream_exhausted:
-                try:
-                    update = await asyncio.wait_for(
-                        stream_iter.__anext__(), timeout=KEEPALIVE_INTERVAL
-                    )
-                    update_count += 1
-                    text = update.text
-                    if text:
-                        accumulated_text += text
-                        yield ResponseTextDeltaEvent(
-                            sequence_number=self._next_seq(),
-                            item_id=item_id,
-                            output_index=0,
-                            content_index=0,
-                            delta=text,
-                        )
-                except asyncio.TimeoutError:
+            next_update = asyncio.ensure_future(stream_iter.__anext__())
+            next_progress = asyncio.ensure_future(channel.get())
+
+            while next_update is not None:
+                done, _ = await asyncio.wait(
+                    {next_update, next_progress},
+                    timeout=KEEPALIVE_INTERVAL,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
                     # No update within the keepalive window — send a
                     # heartbeat so the proxy doesn't drop us.
-                    keepalive_count += 1
-                    yield ResponseTextDeltaEvent(
-                        sequence_number=self._next_seq(),
-                        item_id=item_id,
-                        output_index=0,
-                        content_index=0,
-                        delta="",
-                    )
-                except StopAsyncIteration:
-                    stream_exhausted = True
+                    rs.keepalive_count += 1
+                    yield rs.text_delta("")
+                    continue
+
+                if next_progress in done:
+                    event = next_progress.result()
+                    next_progress = asyncio.ensure_future(channel.get())
+                    rs.progress_count += 1
+                    yield _workflow_progress_event(rs.next_seq(), event)
+
+                if next_update in done:
+                    try:
+                        update = next_update.result()
+                    except StopAsyncIteration:
+                        next_update = None
+                        continue
+                    next_update = asyncio.ensure_future(stream_iter.__anext__())
+                    rs.update_count += 1
+                    if update.text:
+                        yield rs.text_delta(update.text)
+
+            # Progress published just before the agent finished is still
+            # queued (or scheduled from a tool thread) — send it before closing.
+            await asyncio.sleep(0)
+            pending = [next_progress.result()] if next_progress.done() else []
+            for event in pending + channel.drain():
+                rs.progress_count += 1
+                yield _workflow_progress_event(rs.next_seq(), event)
         except Exception as exc:
-            print(f"[SalesAgent] Stream ERROR after {update_count} updates: {exc!r}", flush=True)
-            error_text = f"\n\n[Error: {exc}]"
-            accumulated_text += error_text
-            yield ResponseTextDeltaEvent(
-                sequence_number=self._next_seq(),
-                item_id=item_id,
-                output_index=0,
-                content_index=0,
-                delta=error_text,
-            )
-
-        print(f"[SalesAgent] Stream ended after {update_count} updates, {keepalive_count} keepalives, accumulated {len(accumulated_text)} chars", flush=True)
+            print(f"[SalesAgent] Stream ERROR after {rs.update_count} updates: {exc!r}", flush=True)
+            yield rs.text_delta(f"\n\n[Error: {exc}]")
+        finally:
+            for task in (next_update, next_progress):
+                if task is not None:
+                    task.cancel()
+            progress.close_channel(session)
+
+        print(f"[SalesAgent] Stream ended after {rs.update_count} updates, {rs.keepalive_count} keepalives, {rs.progress_count} progress events, accumulated {len(rs.text)} chars", flush=True)
 
         # --- Closing envelope ---
         yield ResponseTextDoneEvent(
-            sequence_number=self._next_seq(),
-            item_id=item_id,
+            sequence_number=rs.next_seq(),
+            item_id=rs.item_id,
             output_index=0,
             content_index=0,
-            text=accumulated_text,
+            text=rs.text,
         )
 
         yield ResponseContentPartDoneEvent(
-            sequence_number=self._next_seq(),
-            item_id=item_id,
+            sequence_number=rs.next_seq(),
+            item_id=rs.item_id,
             output_index=0,
             content_index=0,
-            part=ItemContentOutputText(text=accumulated_text, annotations=[]),
+            part=ItemContentOutputText(text=rs.text, annotations=[]),
         )
 
         done_item = ResponsesAssistantMessageItemResource(
-            id=item_id,
+            id=rs.item_id,
             status="completed",
-            content=[ItemContentOutputText(text=accumulated_text, annotations=[])],
+            content=[ItemContentOutputText(text=rs.text, annotations=[])],
         )
         yield ResponseOutputItemDoneEvent(
-            sequence_number=self._next_seq(),
+            sequence_number=rs.next_seq(),
             output_index=0,
             item=done_item,
         )
 
         yield ResponseCompletedEvent(
-            sequence_number=self._next_seq(),
+            sequence_number=rs.next_seq(),
             response=self._build_response(
-                context, "completed", now, output=[done_item]
+                context, "completed", rs.created_at, output=[done_item]
             ),
         )
 
@@ -279,6 +437,14 @@ class SalesAgentServer(FoundryCBAgent):
             "output": output or [],
         })
 
+    @classmethod
+    def _admission_lane(cls, payload: dict) -> str:
+        """Admission lane for a request, judged by its latest message only."""
+        raw = payload.get("input", "")
+        if isinstance(raw, list):
+            raw = raw[-1:]
+        return admission.classify_prompt(cls._extract_prompt({"input": raw}))
+
     @staticmethod
     def _extract_prompt(payload: dict) -> str:
         raw = payload.get("input", "")
@@ -1,7 +1,7 @@
 from .work_iq import get_work_iq_data
 from .fabric_iq import get_fabric_iq_data
 from .foundry_iq import get_foundry_iq_data
-from .doc_generator import generate_prep_doc, generate_presentation
+from .doc_generator import generate_meeting_package, generate_prep_doc, generate_presentation
 
 __all__ = [
     "get_work_iq_data",
@@ -9,4 +9,5 @@ __all__ = [
     "get_foundry_iq_data",
     "generate_prep_doc",
     "generate_presentation",
+    "generate_meeting_package",
 ]
@@ -0,0 +1,142 @@
+"""Blob upload client — long-lived Azure Blob Storage client for generated docs.
+
+Creating a DefaultAzureCredential, a BlobServiceClient, probing the container
+and fetching a user-delegation key on every upload costs several network
+round trips.  ``BlobUploader`` keeps all of them for the life of the process:
+the container is created at most once and the delegation key is refreshed
+shortly before it expires.
+
+Set OUTPUT_STORAGE_CONNECTION_STRING (e.g. ``UseDevelopmentStorage=true`` for
+Azurite) to use account-key auth instead of Entra ID; SAS tokens are then
+signed with the account key.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any
+
+from src.config import (
+    OUTPUT_STORAGE_ACCOUNT_URL,
+    OUTPUT_STORAGE_CONNECTION_STRING,
+    OUTPUT_STORAGE_CONTAINER,
+)
+
+_CONTENT_TYPES = {
+    ".pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+# Download links are valid for 1 hour; the delegation key must outlive them.
+SAS_LIFETIME = timedelta(hours=1)
+_DELEGATION_KEY_LIFETIME = timedelta(hours=6)
+_DELEGATION_KEY_REFRESH_MARGIN = SAS_LIFETIME + timedelta(minutes=10)
+_CLOCK_SKEW = timedelta(minutes=5)
+
+
+def enabled() -> bool:
+    """True when generated docs should be uploaded to blob storage."""
+    return bool(OUTPUT_STORAGE_ACCOUNT_URL or OUTPUT_STORAGE_CONNECTION_STRING)
+
+
+class BlobUploader:
+    """Uploads generated docs and issues read-only SAS download URLs."""
+
+    def __init__(
+        self,
+        account_url: str | None = None,
+        container: str = OUTPUT_STORAGE_CONTAINER,
+        *,
+        connection_string: str | None = None,
+        service_client: Any | None = None,
+    ):
+        self._account_url = account_url
+        self._connection_string = connection_string
+        self._container_name = container
+        self._service = service_client
+        self._container: Any | None = None
+        self._delegation_key: Any | None = None
+        self._delegation_key_expiry: datetime | None = None
+        self._lock = threading.Lock()
+
+    # ── Lazily-created, cached clients ───────────────────────────────
+
+    def _service_client(self) -> Any:
+        if self._service is None:
+            from azure.storage.blob import BlobServiceClient
+
+            if self._connection_string:
+                self._service = BlobServiceClient.from_connection_string(self._connection_string)
+            else:
+                from azure.identity import DefaultAzureCredential
+
+                self._service = BlobServiceClient(self._account_url, credential=DefaultAzureCredential())
+        return self._service
+
+    def _container_client(self) -> Any:
+        with self._lock:
+            if self._container is None:
+                container = self._service_client().get_container_client(self._container_name)
+                try:
+                    container.create_container()
+                except Exception:
+                    pass  # already exists
+                self._container = container
+            return self._container
+
+    def _user_delegation_key(self, now: datetime) -> Any:
+        with self._lock:
+            if (self._delegation_key is None
+                    or self._delegation_key_expiry - now < _DELEGATION_KEY_REFRESH_MARGIN):
+                expiry = now + _DELEGATION_KEY_LIFETIME
+                self._delegation_key = self._service_client().get_user_delegation_key(
+                    now - _CLOCK_SKEW, expiry,
+                )
+                self._delegation_key_expiry = expiry
+            return self._delegation_key
+
+    # ── Public API ───────────────────────────────────────────────────
+
+    def upload(self, blob_name: str, data: bytes | IO[bytes]) -> str:
+        """Upload ``data`` as ``blob_name`` and return a 1-hour SAS download URL."""
+        from azure.storage.blob import BlobSasPermissions, ContentSettings, generate_blob_sas
+
+        suffix = blob_name[blob_name.rfind("."):]
+        settings = ContentSettings(content_type=_CONTENT_TYPES.get(suffix, "application/octet-stream"))
+        blob_client = self._container_client().get_blob_client(blob_name)
+        kwargs = {"length": len(data)} if isinstance(data, bytes) else {}
+        blob_client.upload_blob(data, overwrite=True, content_settings=settings, **kwargs)
+
+        now = datetime.now(timezone.utc)
+        service = self._service_client()
+        account_key = getattr(service.credential, "account_key", None)
+        sas = generate_blob_sas(
+            account_name=service.account_name,
+            container_name=self._container_name,
+            blob_name=blob_name,
+            account_key=account_key,
+            user_delegation_key=None if account_key else self._user_delegation_key(now),
+            permission=BlobSasPermissions(read=True),
+            expiry=now + SAS_LIFETIME,
+            start=now - _CLOCK_SKEW,
+            content_disposition=f'attachment; filename="{blob_name}"',
+        )
+        return f"{blob_client.url}?{sas}"
+
+
+_uploader: BlobUploader | None = None
+_uploader_lock = threading.Lock()
+
+
+def get_uploader() -> BlobUploader:
+    """Return the process-wide uploader, creating it on first use."""
+    global _uploader
+    with _uploader_lock:
+        if _uploader is None:
+            _uploader = BlobUploader(
+                OUTPUT_STORAGE_ACCOUNT_URL,
+                OUTPUT_STORAGE_CONTAINER,
+                connection_string=OUTPUT_STORAGE_CONNECTION_STRING,
+            )
+        return _uploader
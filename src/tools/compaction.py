@@ -0,0 +1,195 @@
+"""Compaction — token-budgeted views of IQ payloads for the LLM.
+
+Raw IQ records carry every email snippet, ticket description and sales-play
+resource.  The model only needs the signals the system prompt asks for —
+relationship context, risks (open tickets, competitive threats) and
+opportunities (expansion, top sales plays) — so what it sees is a ranked,
+trimmed copy:
+
+* emails, meetings and Teams messages newest first;
+* open tickets before resolved ones, then by severity;
+* expansion opportunities by incremental value;
+* sales plays by ``relevance_score``, with talking points deduplicated across
+  plays and resources reduced to their titles.
+
+``compact`` tightens item counts and text lengths step by step until the
+payload fits ``IQ_PROMPT_TOKEN_BUDGET`` (estimated, ~4 characters a token).
+The full data is untouched: caches, the intel store and document rendering
+keep using it.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import re
+from collections.abc import Callable
+from typing import Any
+
+from src.config import IQ_PROMPT_TOKEN_BUDGET
+
+# (max items per list, max characters per text field), loosest first.
+_LEVELS = ((5, 400), (3, 200), (2, 120), (1, 60))
+
+_SEVERITY_RANK = {"p1": 0, "p2": 1, "p3": 2, "p4": 3}
+
+
+def estimate_tokens(data: Any) -> int:
+    """Rough token count of ``data`` as the model would see it (JSON, ~4 chars/token)."""
+    return (len(json.dumps(data, default=str, separators=(",", ":"))) + 3) // 4
+
+
+def _clip(text: Any, limit: int) -> Any:
+    if not isinstance(text, str) or len(text) <= limit:
+        return text
+    return text[:limit - 1].rstrip() + "…"
+
+
+def _pick(item: dict[str, Any], keys: tuple[str, ...], text_limit: int) -> dict[str, Any]:
+    return {k: _clip(item[k], text_limit) for k in keys if k in item}
+
+
+def _newest(items: list[dict[str, Any]] | None, n: int) -> list[dict[str, Any]]:
+    return sorted(items or [], key=lambda i: str(i.get("date", "")), reverse=True)[:n]
+
+
+def _work_iq(data: dict[str, Any], n: int, t: int) -> dict[str, Any]:
+    return {
+        "customer_name": data.get("customer_name"),
+        "primary_contact": data.get("primary_contact") or {},
+        "account_team": data.get("account_team") or {},
+        "relationship_summary": _clip(data.get("relationship_summary", ""), 2 * t),
+        "recent_emails": [
+            _pick(e, ("date", "from", "subject", "snippet"), t) for e in _newest(data.get("recent_emails"), n)
+        ],
+        "recent_meetings": [
+            {**_pick(m, ("date", "title", "notes"), t), "attendees": (m.get("attendees") or [])[:6]}
+            for m in _newest(data.get("recent_meetings"), n)
+        ],
+        "teams_messages": [
+            _pick(m, ("date", "channel", "from", "message"), t) for m in _newest(data.get("teams_messages"), n)
+        ],
+    }
+
+
+def _is_open(ticket: dict[str, Any]) -> bool:
+    return str(ticket.get("status", "")).lower() not in ("resolved", "closed")
+
+
+def _ranked_tickets(tickets: list[dict[str, Any]] | None) -> list[dict[str, Any]]:
+    """Open before resolved, then most severe, then newest."""
+    newest = sorted(tickets or [], key=lambda tk: str(tk.get("opened", "")), reverse=True)
+    return sorted(newest, key=lambda tk: (
+        not _is_open(tk),
+        _SEVERITY_RANK.get(str(tk.get("severity", "")).lower(), len(_SEVERITY_RANK)),
+    ))
+
+
+def _trim_series(key: str, value: Any, n: int) -> Any:
+    """Keep the latest points of a ``*_trend`` series and the top entries of other lists."""
+    if not isinstance(value, list):
+        return value
+    return value[-max(n, 3):] if key.endswith("_trend") else value[:n]
+
+
+def _fabric_iq(data: dict[str, Any], n: int, t: int) -> dict[str, Any]:
+    contract = data.get("contract") or {}
+    usage = data.get("usage_trends") or {}
+    tickets = _ranked_tickets(data.get("support_tickets"))[:n]
+    return {
+        "customer_name": data.get("customer_name"),
+        "contract": {
+            **{k: contract[k] for k in ("type", "annual_spend", "renewal_date") if k in contract},
+            "products": [
+                _pick(p, ("name", "seats", "annual_value"), t)
+                for p in sorted(contract.get("products") or [], key=lambda p: -(p.get("annual_value") or 0))[:n]
+            ],
+        },
+        "usage_trends": {
+            name: {k: _trim_series(k, v, n) for k, v in trend.items()} if isinstance(trend, dict) else trend
+            for name, trend in usage.items()
+        },
+        "support_tickets": [
+            _pick(tk, ("id", "severity", "status", "title", "opened", "description"), t)
+            if _is_open(tk) else _pick(tk, ("id", "severity", "status", "title"), t)
+            for tk in tickets
+        ],
+        "expansion_opportunities": [
+            _pick(o, ("product", "proposed", "incremental_value", "stage", "confidence", "champion", "notes"), t)
+            for o in sorted(data.get("expansion_opportunities") or [],
+                            key=lambda o: -(o.get("incremental_value") or 0))[:n]
+        ],
+        "financial_summary": data.get("financial_summary") or {},
+    }
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\W+", " ", text.lower()).strip()
+
+
+def _foundry_iq(data: dict[str, Any], n: int, t: int) -> dict[str, Any]:
+    seen: set[str] = set()
+    plays = []
+    for play in sorted(data.get("sales_plays") or [], key=lambda p: -(p.get("relevance_score") or 0))[:n]:
+        points = []
+        for point in play.get("key_talking_points") or []:
+            key = _normalize(str(point))
+            if key and key not in seen:
+                seen.add(key)
+                points.append(_clip(point, t))
+        plays.append({
+            **_pick(play, ("play_name", "relevance_score", "summary"), t),
+            "key_talking_points": points[:n],
+            "customer_references": [
+                _pick(r, ("company", "summary"), t) for r in (play.get("customer_references") or [])[:max(n - 1, 1)]
+            ],
+            "resources": [r.get("title") for r in (play.get("resources") or [])[:n] if r.get("title")],
+        })
+    intel = data.get("competitive_intelligence") or {}
+    return {
+        "customer_name": data.get("customer_name"),
+        "industry": data.get("industry"),
+        "sales_plays": plays,
+        "competitive_intelligence": {
+            k: [_clip(v, t) for v in items[:n]] if isinstance(items, list) else _clip(items, t)
+            for k, items in intel.items()
+        },
+    }
+
+
+_COMPACTORS: dict[str, Callable[[dict[str, Any], int, int], dict[str, Any]]] = {
+    "work_iq": _work_iq,
+    "fabric_iq": _fabric_iq,
+    "foundry_iq": _foundry_iq,
+}
+
+
+def compact(source: str, data: Any, budget: int = IQ_PROMPT_TOKEN_BUDGET) -> Any:
+    """Ranked, trimmed copy of one IQ payload that fits ``budget`` tokens where possible.
+
+    Errors, sign-in prompts and anything already within budget are returned
+    unchanged.  If even the tightest level is over budget, that level is
+    returned.
+    """
+    if (not isinstance(data, dict) or "error" in data or data.get("auth_required")
+            or estimate_tokens(data) <= budget):
+        return data
+    compacted = data
+    for items, text in _LEVELS:
+        compacted = _COMPACTORS[source](data, items, text)
+        if estimate_tokens(compacted) <= budget:
+            break
+    return compacted
+
+
+def compact_tool(source: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a sync IQ tool so the LLM receives the compacted result.
+
+    The wrapper keeps ``fn``'s name, docstring and signature, so the tool
+    schema is unchanged.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return compact(source, fn(*args, **kwargs))
+
+    return wrapper
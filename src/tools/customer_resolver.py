@@ -0,0 +1,212 @@
+"""Customer resolver — maps free-text customer names to canonical account keys.
+
+Names are canonicalized (lowercased, punctuation and legal suffixes like
+"The", "Company", "Inc." dropped) and looked up in an exact table of keys and
+aliases, so "Coca Cola", "The Coca-Cola Company" and "KO" all resolve to
+``coca-cola``.  Anything else is matched through token and trigram inverted
+indexes: only entries sharing a token or trigram with the query are scored,
+and the best-ranked one wins if it clears a similarity threshold.  Token
+similarity is Jaccard, and only distinctive tokens count as shared — a
+generic word ("bank", "healthcare"), a single letter or a token several
+customers have in common never makes a match by itself, and a query naming
+an industry the account's names lack ("Alpine Airlines") is a different
+business.
+
+Aliases come from mock_data/customer_aliases.json plus each brand's display
+and short names.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Iterable
+
+from src.config import MOCK_DATA_DIR
+
+_ALIASES_FILE = MOCK_DATA_DIR / "customer_aliases.json"
+_BRANDS_FILE = MOCK_DATA_DIR / "brands.json"
+
+_STOPWORDS = frozenset({
+    "the", "company", "co", "inc", "incorporated", "corp", "corporation",
+    "ltd", "limited", "llc", "plc", "group", "holdings",
+})
+
+# Industry words: sharing one says nothing about being the same customer
+# ("Bank of America" is not Woodgrove Bank), and naming one the customer's
+# own names lack means a different business ("Alpine Airlines" is not Alpine
+# Ski House).
+_INDUSTRY_TOKENS = frozenset({
+    "bank", "banking", "financial", "finance", "insurance",
+    "health", "healthcare", "medical", "pharma", "pharmaceuticals", "hospital",
+    "ski", "house", "hotel", "hotels", "resort", "airline", "airlines",
+    "traders", "trading", "partners", "services", "solutions", "systems",
+    "technologies", "technology", "tech", "global", "international", "national",
+    "america", "american", "college", "university", "school", "toys", "foods",
+    "energy", "media", "retail", "industries", "manufacturing", "consulting",
+})
+_FILLER_TOKENS = frozenset({"of", "and", "for", "at", "in"})
+
+# Minimum similarity (0–1) for a fuzzy match to be accepted.
+_MIN_SCORE = 0.5
+_MEMO_LIMIT = 4096
+
+
+def tokens(name: str) -> list[str]:
+    """Split a customer name into lowercase word tokens, minus legal suffixes."""
+    words = re.findall(r"[a-z0-9]+", name.lower())
+    return [w for w in words if w not in _STOPWORDS] or words
+
+
+def canonical_form(name: str) -> str:
+    """Canonical key form of a name, e.g. "The Coca-Cola Company" → "coca-cola"."""
+    return "-".join(tokens(name))
+
+
+def _trigrams(form: str) -> frozenset[str]:
+    s = form.replace("-", "")
+    if len(s) < 3:
+        return frozenset({s}) if s else frozenset()
+    return frozenset(s[i:i + 3] for i in range(len(s) - 2))
+
+
+class CustomerResolver:
+    """Resolve customer names against a fixed set of canonical keys."""
+
+    def __init__(self, keys: Iterable[str], aliases: dict[str, list[str]] | None = None):
+        self._exact: dict[str, str] = {}
+        self._entries: list[tuple[str, frozenset[str], frozenset[str]]] = []
+        self._token_index: dict[str, list[int]] = defaultdict(list)
+        self._trigram_index: dict[str, list[int]] = defaultdict(list)
+        self._memo: dict[str, str | None] = {}
+        self._lock = threading.Lock()
+
+        keys = list(keys)
+        for key in keys:
+            self._add(key, key)
+        for key, names in (aliases or {}).items():
+            if key in self._exact.values():
+                for name in names:
+                    self._add(name, key)
+
+        # Tokens that can't identify a customer on their own: generic words,
+        # single characters, and tokens shared by more than one customer.
+        self._weak = {
+            t for t, ids in self._token_index.items()
+            if len({self._entries[i][0] for i in ids}) > 1
+        }
+        self._key_tokens: dict[str, set[str]] = defaultdict(set)
+        for key, entry_tokens, _ in self._entries:
+            self._key_tokens[key] |= entry_tokens
+
+    def _add(self, name: str, key: str) -> None:
+        form = canonical_form(name)
+        if not form or form in self._exact:
+            return
+        self._exact[form] = key
+        entry_id = len(self._entries)
+        entry_tokens = frozenset(form.split("-"))
+        entry_trigrams = _trigrams(form)
+        self._entries.append((key, entry_tokens, entry_trigrams))
+        for t in entry_tokens:
+            self._token_index[t].append(entry_id)
+        for g in entry_trigrams:
+            self._trigram_index[g].append(entry_id)
+
+    def resolve(self, name: str) -> str | None:
+        """Return the canonical key for ``name``, or None if nothing matches well."""
+        form = canonical_form(name)
+        if not form:
+            return None
+        key = self._exact.get(form)
+        if key is not None:
+            return key
+        with self._lock:
+            if form in self._memo:
+                return self._memo[form]
+        key = self._rank(form)
+        with self._lock:
+            if len(self._memo) >= _MEMO_LIMIT:
+                self._memo.clear()
+            self._memo[form] = key
+        return key
+
+    def _rank(self, form: str) -> str | None:
+        words = form.split("-")
+        q_tokens = frozenset(words)
+        q_strong = frozenset(t for t in q_tokens if not self._is_weak(t))
+        if not q_strong:
+            return None
+        q_industry = q_tokens & _INDUSTRY_TOKENS
+        # Fuzzy-match only the distinctive part of the name
+        q_trigrams = _trigrams("-".join(t for t in words if t in q_strong))
+
+        shared_trigrams: Counter[int] = Counter()
+        for g in q_trigrams:
+            shared_trigrams.update(self._trigram_index.get(g, ()))
+        candidates = set(shared_trigrams)
+        for t in q_strong:
+            candidates.update(self._token_index.get(t, ()))
+
+        best: tuple[float, float, int] | None = None
+        best_key = None
+        for entry_id in candidates:
+            key, e_tokens, e_trigrams = self._entries[entry_id]
+            if not q_industry <= self._key_tokens[key]:
+                continue
+            # Jaccard over all tokens, crediting only distinctive shared ones
+            token_score = len(q_strong & e_tokens) / len(q_tokens | e_tokens)
+            shared = shared_trigrams[entry_id]
+            trigram_score = shared / (len(q_trigrams) + len(e_trigrams) - shared) if shared else 0.0
+            # Rank by the stronger signal, then the weaker one, then entry order
+            rank = (max(token_score, trigram_score), min(token_score, trigram_score), -entry_id)
+            if best is None or rank > best:
+                best, best_key = rank, key
+        if best is None or best[0] < _MIN_SCORE:
+            return None
+        return best_key
+
+    def _is_weak(self, token: str) -> bool:
+        return (len(token) < 2 or token in _INDUSTRY_TOKENS or token in _FILLER_TOKENS
+                or token in self._weak)
+
+
+# ── Shared alias table / default resolver ────────────────────────────
+
+_alias_table: dict[str, list[str]] | None = None
+_default_resolver: CustomerResolver | None = None
+_init_lock = threading.Lock()
+
+
+def alias_table() -> dict[str, list[str]]:
+    """Canonical key → alias names (alias file plus brand display/short names)."""
+    global _alias_table
+    with _init_lock:
+        if _alias_table is None:
+            table: dict[str, list[str]] = defaultdict(list)
+            with open(_ALIASES_FILE) as f:
+                for key, names in json.load(f).items():
+                    table[key].extend(names)
+            with open(_BRANDS_FILE) as f:
+                brands: dict[str, Any] = json.load(f)
+            for key, brand in brands.items():
+                table[key].extend([brand["display_name"], brand["short_name"]])
+            _alias_table = dict(table)
+        return _alias_table
+
+
+def default_resolver() -> CustomerResolver:
+    """Resolver over every known customer (all keys in the alias table)."""
+    global _default_resolver
+    aliases = alias_table()
+    with _init_lock:
+        if _default_resolver is None:
+            _default_resolver = CustomerResolver(aliases, aliases)
+        return _default_resolver
+
+
+def canonical_key(customer_name: str) -> str:
+    """Resolve ``customer_name`` to a known key, else its canonical form."""
+    return default_resolver().resolve(customer_name) or canonical_form(customer_name)
@@ -2,16 +2,27 @@
 
 These functions are structured as Copilot SDK function tools with annotated
 parameters so they can be registered via ``GitHubCopilotAgent(tools=[...])``.
+
+Each tool takes either an ``intel_id`` handle from the meeting-prep workflow
+(the data is looked up server-side, see ``intel_store``) or the three IQ
+payloads themselves.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
+import logging
+import os
+import re
+import threading
 import zipfile
 from datetime import date
 from io import BytesIO
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, Callable
 
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
@@ -22,80 +33,174 @@ from pptx.dml.color import RGBColor as PptxRGB
 from pptx.enum.text import PP_ALIGN
 from pptx.util import Inches as PptxInches, Pt as PptxPt
 
-from src.config import MOCK_DATA_DIR, PPTX_TEMPLATE, ensure_output_dir, OUTPUT_STORAGE_ACCOUNT_URL, OUTPUT_STORAGE_CONTAINER
+from src.config import MOCK_DATA_DIR, OUTPUT_DIR, PPTX_TEMPLATE, SAVE_LOCAL_OUTPUT
+from src.tools import blob_upload, intel_store, mock_store, output_cache, render_pool
+from src.tools.customer_resolver import canonical_key
+
+logger = logging.getLogger(__name__)
 
 
 # ── Blob upload helper ────────────────────────────────────────────────
 
-def _upload_and_get_url(local_path: Path) -> str:
+def _upload_and_get_url(local_path: Path, data: bytes | None = None) -> str:
     """Upload a generated file to Azure Blob Storage and return a SAS download URL.
 
-    Falls back to returning the local path when OUTPUT_STORAGE_ACCOUNT_URL is not
-    set or when Azure credentials are unavailable (e.g. local container without
-    managed identity).
+    Uploads ``data`` straight from memory when given, otherwise reads
+    ``local_path``.  Falls back to returning the local path when blob storage
+    is not configured or when Azure credentials are unavailable (e.g. local
+    container without managed identity); an in-memory document is written to
+    disk first in that case.
     """
-    if not OUTPUT_STORAGE_ACCOUNT_URL:
-        return str(local_path)
+    if not blob_upload.enabled():
+        return _save_fallback(local_path, data)
 
     try:
-        from azure.identity import DefaultAzureCredential
-        from azure.storage.blob import (
-            BlobServiceClient, ContentSettings,
-            generate_blob_sas, BlobSasPermissions,
-        )
-        from datetime import datetime, timedelta, timezone
-
-        credential = DefaultAzureCredential()
-        blob_service = BlobServiceClient(OUTPUT_STORAGE_ACCOUNT_URL, credential=credential)
-
-        # Ensure container exists
-        container_client = blob_service.get_container_client(OUTPUT_STORAGE_CONTAINER)
-        try:
-            container_client.create_container()
-        except Exception:
-            pass  # already exists
-
-        # Upload
-        blob_name = local_path.name
-        if blob_name.endswith(".pptx"):
-            content_type = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-        else:
-            content_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        blob_client = container_client.get_blob_client(blob_name)
+        uploader = blob_upload.get_uploader()
+        if data is not None:
+            return uploader.upload(local_path.name, data)
         with open(local_path, "rb") as f:
-            blob_client.upload_blob(f, overwrite=True, content_settings=ContentSettings(content_type=content_type))
-
-        # Generate user delegation SAS (1 hour)
-        now = datetime.now(timezone.utc)
-        udk = blob_service.get_user_delegation_key(now - timedelta(minutes=5), now + timedelta(hours=1))
-        sas = generate_blob_sas(
-            account_name=blob_service.account_name,
-            container_name=OUTPUT_STORAGE_CONTAINER,
-            blob_name=blob_name,
-            user_delegation_key=udk,
-            permission=BlobSasPermissions(read=True),
-            expiry=now + timedelta(hours=1),
-            start=now - timedelta(minutes=5),
-            content_disposition=f'attachment; filename="{blob_name}"',
-        )
-
-        return f"{blob_client.url}?{sas}"
+            return uploader.upload(local_path.name, f)
     except Exception as exc:
         import warnings
         warnings.warn(f"Blob upload failed, returning local path: {exc}")
-        return str(local_path)
+        return _save_fallback(local_path, data)
+
+
+def _save_fallback(local_path: Path, data: bytes | None) -> str:
+    """Make sure an in-memory document exists on disk and return its path."""
+    if data is not None and not local_path.exists():
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        local_path.write_bytes(data)
+    return str(local_path)
+
+
+# ── Render + publish helpers ──────────────────────────────────────────
+
+# Bump whenever rendering changes so cached outputs are not reused.
+_GENERATOR_VERSION = "1"
+
+
+def _save_local() -> bool:
+    """Whether rendered docs go to OUTPUT_DIR (always, without blob storage)."""
+    return SAVE_LOCAL_OUTPUT or not blob_upload.enabled()
+
+
+def _render_to_file(kind: str, path: Path, brand: dict[str, Any], work_iq: dict[str, Any],
+                    fabric_iq: dict[str, Any], foundry_iq: dict[str, Any]) -> None:
+    """Render ``path`` unless it is already cached on disk.
+
+    ``path`` is content-addressed (its name embeds the input hash), so an
+    existing file is always a valid result.  Module-level so it can run in
+    the render pool.
+    """
+    if output_cache.touch(path):
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = _BUILDERS[kind](brand, work_iq, fabric_iq, foundry_iq)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    doc.save(str(tmp))
+    os.replace(tmp, path)
+    output_cache.evict(path.parent, keep=path)
+
+
+def _render_to_bytes(kind: str, brand: dict[str, Any], work_iq: dict[str, Any],
+                     fabric_iq: dict[str, Any], foundry_iq: dict[str, Any]) -> bytes:
+    """Render a document entirely in memory (no local disk)."""
+    buf = BytesIO()
+    _BUILDERS[kind](brand, work_iq, fabric_iq, foundry_iq).save(buf)
+    return buf.getvalue()
+
+
+def _publish(path: Path, data: bytes | None = None) -> str:
+    """Return a download URL (or local path) for a rendered doc, reusing cached URLs."""
+    url = output_cache.get_url(path)
+    if url:
+        return url
+    url = _upload_and_get_url(path, data)
+    if url != str(path):
+        output_cache.put_url(path, url)
+    return url
+
+
+def _produce(kind: str, path: Path, brand: dict[str, Any], work_iq: dict[str, Any],
+             fabric_iq: dict[str, Any], foundry_iq: dict[str, Any]) -> str:
+    """Render (unless cached) and publish one document."""
+    url = output_cache.get_url(path)
+    if url:
+        return url
+    if _save_local():
+        _render_to_file(kind, path, brand, work_iq, fabric_iq, foundry_iq)
+        return _publish(path)
+    return _publish(path, _render_to_bytes(kind, brand, work_iq, fabric_iq, foundry_iq))
+
+
+async def _produce_async(kind: str, path: Path, brand: dict[str, Any], work_iq: dict[str, Any],
+                         fabric_iq: dict[str, Any], foundry_iq: dict[str, Any]) -> str:
+    """``_produce`` with rendering in the render pool and upload on a thread."""
+    url = output_cache.get_url(path)
+    if url:
+        return url
+    if _save_local():
+        await render_pool.run(_render_to_file, kind, path, brand, work_iq, fabric_iq, foundry_iq)
+        return await asyncio.to_thread(_publish, path)
+    data = await render_pool.run(_render_to_bytes, kind, brand, work_iq, fabric_iq, foundry_iq)
+    return await asyncio.to_thread(_publish, path, data)
+
+
+def _coerce_iq(data: dict[str, Any] | str) -> dict[str, Any]:
+    """Accept JSON strings (for function-tool invocation) or dicts."""
+    return json.loads(data) if isinstance(data, str) else data
+
+
+IQData = tuple[dict[str, Any], dict[str, Any], dict[str, Any]]
+
+
+def _resolve_iq(intel_id: str | None, work_iq: dict[str, Any] | str | None,
+                fabric_iq: dict[str, Any] | str | None,
+                foundry_iq: dict[str, Any] | str | None) -> IQData:
+    """The three IQ payloads, from the intel store when given a handle.
+
+    Raises ``intel_store.IntelNotFound`` for an unknown handle and ValueError
+    when neither a handle nor all three payloads were passed.
+    """
+    if intel_id:
+        record = intel_store.get_store().get(intel_id)
+        return record.work_iq, record.fabric_iq, record.foundry_iq
+    if work_iq is None or fabric_iq is None or foundry_iq is None:
+        raise ValueError("Pass the intel_id from run_meeting_prep_workflow (or work_iq, fabric_iq and foundry_iq).")
+    return _coerce_iq(work_iq), _coerce_iq(fabric_iq), _coerce_iq(foundry_iq)
+
+
+def _output_path(kind: str, out_dir: Path, customer_name: str, brand: dict[str, Any],
+                 work_iq: dict[str, Any], fabric_iq: dict[str, Any],
+                 foundry_iq: dict[str, Any]) -> Path:
+    """Content-addressed output path for a prep doc or presentation.
+
+    Keyed on the canonical account, not the spelling: "KO" and "Coca-Cola"
+    render the same document and share one cache entry.
+    """
+    today = date.today().isoformat()
+    account = canonical_key(customer_name)
+    short = brand["short_name"].lower().replace(" ", "_")
+    if kind == "prep_doc":
+        key = output_cache.cache_key(
+            kind, _GENERATOR_VERSION, today,
+            account, brand, work_iq, fabric_iq, foundry_iq,
+        )
+        return out_dir / f"meeting_prep_{short}_{today}_{key[:12]}.docx"
+    key = output_cache.cache_key(
+        kind, _GENERATOR_VERSION, today, _template_digest(),
+        account, brand, work_iq, fabric_iq, foundry_iq,
+    )
+    return out_dir / f"presentation_{short}_{today}_{key[:12]}.pptx"
 
 
 # ── Brand helpers ──────────────────────────────────────────────────────
 
 def _load_brand(customer_name: str) -> dict[str, Any]:
-    brands_file = MOCK_DATA_DIR / "brands.json"
-    with open(brands_file) as f:
-        brands = json.load(f)
-    key = customer_name.lower().replace("the ", "").replace(" company", "").replace(" ", "-").strip()
-    for k, v in brands.items():
-        if k in key or key in k:
-            return v
+    brand = mock_store.lookup(MOCK_DATA_DIR / "brands.json", customer_name)
+    if brand is not None:
+        return brand
     return {
         "display_name": customer_name,
         "short_name": customer_name,
@@ -121,20 +226,21 @@ MS_LIGHT_GRAY = RGBColor(200, 200, 200)
 
 # ── Template loader ───────────────────────────────────────────────────
 
-def _load_template(template_path: Path | None = None) -> Presentation:
-    """Load the Microsoft brand .potx template as a Presentation with no slides.
+# Process-wide cache of the stripped template.  Keyed on the source file's
+# (mtime, size); when those change the file is re-hashed and only re-stripped
+# if its content actually differs.
+_template_cache: dict[str, Any] = {"path": None, "stat": None, "sha256": None, "data": None}
+_template_lock = threading.Lock()
+
+
+def _strip_template(raw: bytes) -> bytes:
+    """Convert raw .potx bytes into a slide-free .pptx package.
 
     python-pptx rejects .potx content types, so we patch the ZIP in memory:
     1. Change the content-type from *template* to *presentation*.
     2. Strip all existing slide parts and their relationships so the
        Presentation loads with layouts/masters only — no sample slides.
     """
-    import re
-
-    path = template_path or PPTX_TEMPLATE
-    with open(path, "rb") as f:
-        raw = f.read()
-
     src = BytesIO(raw)
     dst = BytesIO()
     with zipfile.ZipFile(src, "r") as zin, zipfile.ZipFile(dst, "w") as zout:
@@ -171,8 +277,88 @@ def _load_template(template_path: Path | None = None) -> Presentation:
                     data,
                 )
             zout.writestr(item, data)
-    dst.seek(0)
-    return Presentation(dst)
+    return dst.getvalue()
+
+
+def _template_artifact_path(template_path: Path, digest: str) -> Path:
+    """Path of the pre-stripped .pptx for a given template content hash."""
+    return template_path.with_name(f"{template_path.stem}.{digest[:16]}.pptx")
+
+
+def build_template_artifact(template_path: Path | None = None) -> Path:
+    """Write the stripped template next to the .potx, named by its content hash.
+
+    Run at image build time so cold containers skip the ZIP rewrite.  Stale
+    artifacts from earlier template versions are removed.
+    """
+    path = Path(template_path or PPTX_TEMPLATE)
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    artifact = _template_artifact_path(path, digest)
+    if not artifact.exists():
+        _write_template_artifact(artifact, _strip_template(raw))
+    return artifact
+
+
+def _write_template_artifact(artifact: Path, data: bytes) -> None:
+    """Atomically write a template artifact and drop older ones for the same template."""
+    stem = artifact.name.split(".", 1)[0]
+    tmp = artifact.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, artifact)
+    for stale in artifact.parent.glob(f"{stem}.*.pptx"):
+        if stale != artifact:
+            stale.unlink(missing_ok=True)
+
+
+def _template_bytes(template_path: Path | None = None) -> bytes:
+    """Return the stripped template package, patching the .potx at most once per change.
+
+    Looks for a pre-stripped artifact on disk (see ``build_template_artifact``)
+    before falling back to rewriting the ZIP, and persists the result so the
+    next cold start can read it directly.
+    """
+    path = Path(template_path or PPTX_TEMPLATE)
+    st = path.stat()
+    stat_key = (st.st_mtime_ns, st.st_size)
+
+    with _template_lock:
+        if _template_cache["path"] == path and _template_cache["stat"] == stat_key:
+            return _template_cache["data"]
+
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if _template_cache["path"] != path or _template_cache["sha256"] != digest:
+            artifact = _template_artifact_path(path, digest)
+            try:
+                data = artifact.read_bytes()
+            except OSError:
+                data = _strip_template(raw)
+                try:
+                    _write_template_artifact(artifact, data)
+                except OSError as exc:
+                    # Read-only image or volume — keep the in-memory copy only
+                    logger.warning("Could not persist template artifact %s: %s", artifact, exc)
+            _template_cache["data"] = data
+            _template_cache["sha256"] = digest
+        _template_cache["path"] = path
+        _template_cache["stat"] = stat_key
+        return _template_cache["data"]
+
+
+def _load_template(template_path: Path | None = None) -> Presentation:
+    """Load the Microsoft brand .potx template as a Presentation with no slides.
+
+    The stripped package is cached process-wide; each call gets a fresh
+    Presentation built from the cached bytes.
+    """
+    return Presentation(BytesIO(_template_bytes(template_path)))
+
+
+def _template_digest(template_path: Path | None = None) -> str:
+    """Content hash of the current template (used in output cache keys)."""
+    _template_bytes(template_path)
+    return _template_cache["sha256"]
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -181,24 +367,25 @@ def _load_template(template_path: Path | None = None) -> Presentation:
 
 def generate_prep_doc(
     customer_name: Annotated[str, Field(description="Customer company name")],
-    work_iq: Annotated[dict[str, Any] | str, Field(description="Work IQ data (dict or JSON string)")],
-    fabric_iq: Annotated[dict[str, Any] | str, Field(description="Fabric IQ data (dict or JSON string)")],
-    foundry_iq: Annotated[dict[str, Any] | str, Field(description="Foundry IQ data (dict or JSON string)")],
+    work_iq: Annotated[dict[str, Any] | str | None, Field(description="Work IQ data (dict or JSON string)")] = None,
+    fabric_iq: Annotated[dict[str, Any] | str | None, Field(description="Fabric IQ data (dict or JSON string)")] = None,
+    foundry_iq: Annotated[dict[str, Any] | str | None, Field(description="Foundry IQ data (dict or JSON string)")] = None,
+    intel_id: Annotated[str | None, Field(description="intel_id from run_meeting_prep_workflow (preferred)")] = None,
 ) -> str:
     """Generate a Word meeting prep document for a customer meeting.
 
     Returns the output file path.
     """
-    # Accept JSON strings (for function-tool invocation) or dicts
-    if isinstance(work_iq, str):
-        work_iq = json.loads(work_iq)
-    if isinstance(fabric_iq, str):
-        fabric_iq = json.loads(fabric_iq)
-    if isinstance(foundry_iq, str):
-        foundry_iq = json.loads(foundry_iq)
-
-    out_dir = ensure_output_dir()
+    work_iq, fabric_iq, foundry_iq = _resolve_iq(intel_id, work_iq, fabric_iq, foundry_iq)
     brand = _load_brand(customer_name)
+    path = _output_path("prep_doc", OUTPUT_DIR, customer_name, brand,
+                        work_iq, fabric_iq, foundry_iq)
+    return _produce("prep_doc", path, brand, work_iq, fabric_iq, foundry_iq)
+
+
+def _build_prep_doc(brand: dict[str, Any], work_iq: dict[str, Any],
+                    fabric_iq: dict[str, Any], foundry_iq: dict[str, Any]) -> Document:
+    """Render the Word prep document in memory."""
     doc = Document()
 
     # -- Page style --
@@ -316,11 +503,7 @@ def generate_prep_doc(
                 for ref in play["customer_references"]:
                     doc.add_paragraph(f"  → {ref['company']}: {ref['summary']}")
 
-    # -- Save --
-    filename = f"meeting_prep_{brand['short_name'].lower().replace(' ', '_')}_{date.today().isoformat()}.docx"
-    path = out_dir / filename
-    doc.save(str(path))
-    return _upload_and_get_url(path)
+    return doc
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -334,6 +517,28 @@ _LAYOUT_3COL_SUBHEADS = 23  # 3-column_Text_with Subheads
 _LAYOUT_1COL_TEXT = 19       # 1_1-column_Text
 
 
+def _prune_unused_parts(prs) -> None:
+    """Drop slide layouts and masters that no slide in the deck uses.
+
+    python-pptx saves only the parts reachable through relationships, so once
+    a layout or master is unlinked its images and theme drop out of the
+    package too.  This takes a deck from several MB to well under one.
+    """
+    used_layouts = {slide.slide_layout.part for slide in prs.slides}
+    master_ids = prs.slide_masters._sldMasterIdLst
+
+    for master in list(prs.slide_masters):
+        for layout in list(master.slide_layouts):
+            if layout.part not in used_layouts:
+                master.slide_layouts.remove(layout)
+        if len(master.slide_layouts):
+            continue
+        for sld_master_id in list(master_ids):
+            if prs.part.related_part(sld_master_id.rId) is master.part:
+                master_ids.remove(sld_master_id)
+                prs.part.drop_rel(sld_master_id.rId)
+
+
 def _set_placeholder_text(slide, idx: int, text: str, *,
                           font_size: int | None = None,
                           bold: bool | None = None,
@@ -592,9 +797,10 @@ def _get_next_steps():
 
 def generate_presentation(
     customer_name: Annotated[str, Field(description="Customer company name")],
-    work_iq: Annotated[dict[str, Any] | str, Field(description="Work IQ data as JSON")],
-    fabric_iq: Annotated[dict[str, Any] | str, Field(description="Fabric IQ data as JSON")],
-    foundry_iq: Annotated[dict[str, Any] | str, Field(description="Foundry IQ data as JSON")],
+    work_iq: Annotated[dict[str, Any] | str | None, Field(description="Work IQ data as JSON")] = None,
+    fabric_iq: Annotated[dict[str, Any] | str | None, Field(description="Fabric IQ data as JSON")] = None,
+    foundry_iq: Annotated[dict[str, Any] | str | None, Field(description="Foundry IQ data as JSON")] = None,
+    intel_id: Annotated[str | None, Field(description="intel_id from run_meeting_prep_workflow (preferred)")] = None,
 ) -> str:
     """Generate a customer-facing branded PowerPoint presentation.
 
@@ -605,16 +811,16 @@ def generate_presentation(
 
     Returns the output file path.
     """
-    # Accept JSON strings (for function-tool invocation) or dicts
-    if isinstance(work_iq, str):
-        work_iq = json.loads(work_iq)
-    if isinstance(fabric_iq, str):
-        fabric_iq = json.loads(fabric_iq)
-    if isinstance(foundry_iq, str):
-        foundry_iq = json.loads(foundry_iq)
-
-    out_dir = ensure_output_dir()
+    work_iq, fabric_iq, foundry_iq = _resolve_iq(intel_id, work_iq, fabric_iq, foundry_iq)
     brand = _load_brand(customer_name)
+    path = _output_path("presentation", OUTPUT_DIR, customer_name, brand,
+                        work_iq, fabric_iq, foundry_iq)
+    return _produce("presentation", path, brand, work_iq, fabric_iq, foundry_iq)
+
+
+def _build_presentation(brand: dict[str, Any], work_iq: dict[str, Any],
+                        fabric_iq: dict[str, Any], foundry_iq: dict[str, Any]) -> Presentation:
+    """Render the branded deck in memory."""
     primary = brand["primary_color"]
     ms_blue = "#0078D4"
 
@@ -788,8 +994,69 @@ def generate_presentation(
         alignment=PP_ALIGN.CENTER,
     )
 
-    # -- Save --
-    filename = f"presentation_{brand['short_name'].lower().replace(' ', '_')}_{date.today().isoformat()}.pptx"
-    path = out_dir / filename
-    prs.save(str(path))
-    return _upload_and_get_url(path)
+    _prune_unused_parts(prs)
+    return prs
+
+
+_BUILDERS: dict[str, Callable[..., Any]] = {
+    "prep_doc": _build_prep_doc,
+    "presentation": _build_presentation,
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════
+#  MEETING PACKAGE — both documents in one call
+# ═══════════════════════════════════════════════════════════════════════
+
+async def generate_meeting_package(
+    customer_name: Annotated[str, Field(description="Customer company name")],
+    work_iq: Annotated[dict[str, Any] | str | None, Field(description="Work IQ data (dict or JSON string)")] = None,
+    fabric_iq: Annotated[dict[str, Any] | str | None, Field(description="Fabric IQ data (dict or JSON string)")] = None,
+    foundry_iq: Annotated[dict[str, Any] | str | None, Field(description="Foundry IQ data (dict or JSON string)")] = None,
+    intel_id: Annotated[str | None, Field(description="intel_id from run_meeting_prep_workflow (preferred)")] = None,
+) -> dict[str, str]:
+    """Generate both the Word meeting prep document and the customer-facing
+    PowerPoint deck in one call.  Prefer this over calling generate_prep_doc
+    and generate_presentation separately.
+
+    Returns the output paths as {"prep_doc": ..., "presentation": ...}.
+    """
+    work_iq, fabric_iq, foundry_iq = _resolve_iq(intel_id, work_iq, fabric_iq, foundry_iq)
+    brand = _load_brand(customer_name)
+    paths = {
+        kind: _output_path(kind, OUTPUT_DIR, customer_name, brand, work_iq, fabric_iq, foundry_iq)
+        for kind in _BUILDERS
+    }
+
+    # Both documents render concurrently in the render pool and upload as
+    # soon as each is ready.
+    urls = await asyncio.gather(*(
+        _produce_async(kind, path, brand, work_iq, fabric_iq, foundry_iq)
+        for kind, path in paths.items()
+    ))
+    return dict(zip(paths, urls))
+
+
+_TOOL_KINDS = {"generate_prep_doc": "prep_doc", "generate_presentation": "presentation"}
+
+
+def async_doc_tool(fn: Callable[..., str]) -> Callable[..., Any]:
+    """Agent-facing async twin of ``generate_prep_doc`` / ``generate_presentation``.
+
+    The intel handle is resolved here — render-pool workers are separate
+    processes without the intel store — and only rendering runs in the pool.
+    The tool schema is ``fn``'s.
+    """
+    kind = _TOOL_KINDS[fn.__name__]
+
+    @functools.wraps(fn)
+    async def wrapper(customer_name: str, work_iq: dict[str, Any] | str | None = None,
+                      fabric_iq: dict[str, Any] | str | None = None,
+                      foundry_iq: dict[str, Any] | str | None = None,
+                      intel_id: str | None = None) -> str:
+        work_iq, fabric_iq, foundry_iq = _resolve_iq(intel_id, work_iq, fabric_iq, foundry_iq)
+        brand = _load_brand(customer_name)
+        path = _output_path(kind, OUTPUT_DIR, customer_name, brand, work_iq, fabric_iq, foundry_iq)
+        return await _produce_async(kind, path, brand, work_iq, fabric_iq, foundry_iq)
+
+    return wrapper
@@ -9,8 +9,6 @@ from __future__ import annotations
 import json
 from typing import Annotated, Any
 
-import httpx
-
 from src.config import (
     AZURE_SEARCH_ENDPOINT,
     AZURE_SEARCH_INDEX,
@@ -18,19 +16,12 @@ from src.config import (
     MOCK_DATA_DIR,
     USE_MOCK_DATA,
 )
+from src.tools import http_pool, http_retry, iq_cache, mock_store, single_flight
+from src.tools.customer_resolver import canonical_key
 
 _MOCK_FILE = MOCK_DATA_DIR / "foundry_iq_data.json"
 
 
-def _normalize_key(customer_name: str) -> str:
-    return customer_name.lower().replace("the ", "").replace(" company", "").replace(" ", "-").strip()
-
-
-def _load_mock() -> dict[str, Any]:
-    with open(_MOCK_FILE) as f:
-        return json.load(f)
-
-
 def _query_search(customer_name: str) -> dict[str, Any]:
     """Query Azure AI Search for sales plays matching a customer."""
     if not AZURE_SEARCH_ENDPOINT or not AZURE_SEARCH_KEY:
@@ -39,10 +30,10 @@ def _query_search(customer_name: str) -> dict[str, Any]:
         )
 
     url = f"{AZURE_SEARCH_ENDPOINT}/indexes/{AZURE_SEARCH_INDEX}/docs/search?api-version=2024-07-01"
-    customer_key = _normalize_key(customer_name)
+    customer_key = canonical_key(customer_name)
 
-    resp = httpx.post(
-        url,
+    resp = http_retry.request_sync(
+        http_pool.get_client(), "POST", url,
         headers={
             "Content-Type": "application/json",
             "api-key": AZURE_SEARCH_KEY,
@@ -102,19 +93,25 @@ def _query_search(customer_name: str) -> dict[str, Any]:
     }
 
 
+def _cache_principal() -> str | None:
+    """Search results are shared by every user of the index; mock data is not cached."""
+    return None if USE_MOCK_DATA else f"search:{AZURE_SEARCH_INDEX}"
+
+
+@iq_cache.cached("foundry_iq", _cache_principal)
+@single_flight.coalesce("foundry_iq", _cache_principal)
 def get_foundry_iq_data(
     customer_name: Annotated[str, "Customer company name to look up"],
 ) -> dict[str, Any]:
     """Retrieve sales enablement materials — relevant sales plays,
     competitive intelligence, customer references, and resources for a customer."""
     if USE_MOCK_DATA:
-        data = _load_mock()
-        key = _normalize_key(customer_name)
-        if key in data:
-            return data[key]
-        for k, v in data.items():
-            if k in key or key in k:
-                return v
+        record = mock_store.lookup(_MOCK_FILE, customer_name)
+        if record is not None:
+            return record
         return {"error": f"No Foundry IQ mock data found for '{customer_name}'"}
 
-    return _query_search(customer_name)
+    try:
+        return _query_search(customer_name)
+    except http_retry.UpstreamThrottled as e:
+        return http_retry.throttled_result(customer_name, e)
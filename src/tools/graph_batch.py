@@ -0,0 +1,138 @@
+"""Microsoft Graph JSON batching — many GETs in one ``POST /$batch`` round trip.
+
+Graph accepts up to 20 sub-requests per batch and answers each one
+independently: a batch can come back 200 while individual items are 429
+(throttled) or 404.  ``send`` splits larger request lists into 20-item
+batches, sends them concurrently, re-sends only the throttled items after
+their ``Retry-After`` (see ``http_retry`` for the shared backoff, deadline
+and per-host rate limit) and returns one ``SubResponse`` per request id so
+callers can treat partial failure item by item.
+
+The batch is authorised by the outer request's token, so every request in
+one ``send`` call runs under the same identity.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import quote, urlencode
+
+import httpx
+
+from src.config import HTTP_RETRY_DEADLINE_SECONDS
+from src.tools import http_retry
+
+logger = logging.getLogger(__name__)
+
+GRAPH_BATCH_URL = "https://graph.microsoft.com/v1.0/$batch"
+GRAPH_HOST = httpx.URL(GRAPH_BATCH_URL).host
+MAX_BATCH_SIZE = 20
+
+_RETRYABLE_STATUS = frozenset({429, 503, 504})
+
+# Leave OData punctuation readable; Graph rejects some percent-encoded forms.
+_ODATA_SAFE = "$(),'"
+
+
+@dataclass
+class SubRequest:
+    """One GET inside a batch.  ``url`` is relative to the Graph version root."""
+
+    id: str
+    url: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class SubResponse:
+    id: str
+    status: int
+    body: Any = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+def relative_url(path: str, params: dict[str, str]) -> str:
+    """Encode ``path`` + OData ``params`` the way Graph expects inside a batch."""
+    return f"{path}?{urlencode(params, quote_via=quote, safe=_ODATA_SAFE)}"
+
+
+async def _post(client: httpx.AsyncClient, requests: list[SubRequest],
+                headers: dict[str, str]) -> list[SubResponse]:
+    payload = {
+        "requests": [
+            {"id": r.id, "method": "GET", "url": r.url, **({"headers": r.headers} if r.headers else {})}
+            for r in requests
+        ],
+    }
+    resp = await http_retry.request(client, "POST", GRAPH_BATCH_URL, headers=headers, json=payload)
+    resp.raise_for_status()
+    return [
+        SubResponse(
+            id=str(item.get("id")),
+            status=int(item.get("status", 0)),
+            body=item.get("body"),
+            headers=item.get("headers") or {},
+        )
+        for item in resp.json().get("responses", [])
+    ]
+
+
+async def _send_chunk(client: httpx.AsyncClient, chunk: list[SubRequest],
+                      headers: dict[str, str]) -> dict[str, SubResponse]:
+    results: dict[str, SubResponse] = {}
+    pending = {r.id: r for r in chunk}
+    stop_at = time.monotonic() + HTTP_RETRY_DEADLINE_SECONDS
+    attempt = 0
+    while pending:
+        throttled: list[SubResponse] = []
+        for item in await _post(client, list(pending.values()), headers):
+            results[item.id] = item
+            if item.status in _RETRYABLE_STATUS and item.id in pending:
+                throttled.append(item)
+            else:
+                pending.pop(item.id, None)
+        if not throttled:
+            break
+        # The longest Retry-After among the throttled items governs the wait.
+        hints = [h for h in (http_retry.retry_after_seconds(i.headers) for i in throttled) if h is not None]
+        delay = http_retry.next_delay(
+            GRAPH_HOST, attempt, stop_at,
+            {"Retry-After": str(max(hints))} if hints else None,
+            throttled=any(i.status in http_retry.THROTTLE_STATUS for i in throttled),
+        )
+        if delay is None:
+            break
+        logger.info("Graph batch: %d of %d items throttled, retrying in %.1fs",
+                    len(throttled), len(chunk), delay)
+        pending = {item.id: pending[item.id] for item in throttled}
+        await asyncio.sleep(delay)
+        attempt += 1
+
+    # Items the service never answered are reported rather than dropped.
+    for r in chunk:
+        results.setdefault(r.id, SubResponse(id=r.id, status=0))
+    return results
+
+
+async def send(client: httpx.AsyncClient, requests: list[SubRequest],
+               headers: dict[str, str]) -> dict[str, SubResponse]:
+    """Run ``requests`` as Graph $batch calls and return responses by id.
+
+    Raises ``httpx.HTTPStatusError`` when a whole batch is rejected and
+    ``http_retry.UpstreamThrottled`` when the batch POST itself stays
+    throttled; per-item failures (including items still throttled once the
+    retry budget is spent) are returned as non-``ok`` responses.
+    """
+    chunks = [requests[i:i + MAX_BATCH_SIZE] for i in range(0, len(requests), MAX_BATCH_SIZE)]
+    merged: dict[str, SubResponse] = {}
+    for part in await asyncio.gather(*(_send_chunk(client, c, headers) for c in chunks)):
+        merged.update(part)
+    return merged
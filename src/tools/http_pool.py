@@ -0,0 +1,51 @@
+"""Shared HTTP clients — pooled, keep-alive connections for Graph and Search.
+
+Module-level ``httpx.get`` / ``httpx.post`` open a fresh TCP+TLS connection
+per call.  These clients are created once and reused: one sync client for
+code running in threads, and one AsyncClient per event loop.  Both speak
+HTTP/2 (``httpx[http2]``), so concurrent Graph and Search calls multiplex over
+one connection per host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+
+import httpx
+
+_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60)
+_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+_sync_client: httpx.Client | None = None
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide pooled sync client."""
+    global _sync_client
+    with _lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(http2=True, limits=_LIMITS, timeout=_TIMEOUT)
+        return _sync_client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the pooled AsyncClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(http2=True, limits=_LIMITS, timeout=_TIMEOUT)
+            _async_clients[loop] = client
+        return client
+
+
+async def aclose() -> None:
+    """Close the running loop's AsyncClient (e.g. on server shutdown)."""
+    with _lock:
+        client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,285 @@
+"""HTTP retry layer — throttling-aware retries for Graph and Azure AI Search.
+
+Every outbound Work IQ / Foundry IQ request goes through ``request`` (async)
+or ``request_sync``.  Both:
+
+* take a token from a per-host bucket first, so concurrent requests from
+  many users stay under the service's rate instead of bursting into a 429;
+* retry 429/502/503/504 responses and transport errors, sleeping for the
+  server's ``Retry-After`` when given and jittered exponential backoff
+  otherwise, within a total deadline;
+* pause the whole host's bucket when the service says to back off, so other
+  in-flight callers wait too rather than piling on;
+* raise ``UpstreamThrottled`` instead of handing back a 429/503 once the
+  deadline or attempt budget is spent.
+
+Requests, retries, throttled responses, give-ups and time spent waiting are
+exported as OpenTelemetry metrics (``sales_agent.http.*``, by ``host``);
+``metrics()`` returns the same per-host totals in-process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+from opentelemetry import metrics as otel_metrics
+
+from src.config import (
+    HTTP_RATE_LIMIT_BURST,
+    HTTP_RATE_LIMIT_PER_SECOND,
+    HTTP_RETRY_DEADLINE_SECONDS,
+    HTTP_RETRY_MAX_ATTEMPTS,
+)
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUS = frozenset({429, 503})
+_RETRY_STATUS = THROTTLE_STATUS | {502, 504}
+
+_BACKOFF_BASE = 0.5
+_BACKOFF_MAX = 8.0
+
+
+class UpstreamThrottled(Exception):
+    """The service kept throttling until the retry budget ran out."""
+
+    def __init__(self, host: str, retry_after: float | None = None):
+        self.host = host
+        self.retry_after = retry_after
+        hint = f"; retry after {retry_after:.0f}s" if retry_after else ""
+        super().__init__(f"{host} is throttling requests{hint}")
+
+
+def throttled_result(customer_name: str, e: UpstreamThrottled) -> dict[str, Any]:
+    """Tool result telling the LLM the lookup was throttled, not empty."""
+    return {
+        "error": (
+            f"Live data for '{customer_name}' is temporarily unavailable: {e}. "
+            "Try again shortly instead of continuing with partial data."
+        ),
+        "throttled": True,
+        "retry_after_seconds": e.retry_after,
+        "customer_name": customer_name,
+    }
+
+
+# ── Per-host token bucket ──────────────────────────────────────────────
+
+
+class TokenBucket:
+    """Thread-safe token bucket.  ``reserve`` returns how long to wait."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = max(0.0, self._blocked_until - now)
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+            return wait
+
+    def block(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (server asked us to back off)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _make_instruments(meter: otel_metrics.Meter) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Counters and histograms keyed by the names passed to ``record``."""
+    counters = {
+        "requests": meter.create_counter(
+            "sales_agent.http.requests", unit="{request}", description="Outbound requests, retries included"),
+        "retries": meter.create_counter(
+            "sales_agent.http.retries", unit="{request}", description="Requests retried after a throttle or failure"),
+        "throttled": meter.create_counter(
+            "sales_agent.http.throttled", unit="{response}", description="429/503 responses"),
+        "gave_up": meter.create_counter(
+            "sales_agent.http.gave_up", unit="{request}", description="Requests still throttled after retries"),
+    }
+    histograms = {
+        "retry_wait_seconds": meter.create_histogram(
+            "sales_agent.http.retry_wait", unit="s", description="Backoff before a retry"),
+        "rate_limit_wait_seconds": meter.create_histogram(
+            "sales_agent.http.rate_limit_wait", unit="s", description="Wait for a host bucket token"),
+    }
+    return counters, histograms
+
+
+_counters, _histograms = _make_instruments(otel_metrics.get_meter(__name__))
+
+_buckets: dict[str, TokenBucket] = {}
+_metrics: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+_lock = threading.Lock()
+
+
+def bucket(host: str) -> TokenBucket:
+    with _lock:
+        b = _buckets.get(host)
+        if b is None:
+            b = _buckets[host] = TokenBucket(HTTP_RATE_LIMIT_PER_SECOND, HTTP_RATE_LIMIT_BURST)
+        return b
+
+
+def record(host: str, name: str, value: float = 1) -> None:
+    with _lock:
+        _metrics[host][name] += value
+    if name in _counters:
+        _counters[name].add(value, {"host": host})
+    else:
+        _histograms[name].record(value, {"host": host})
+
+
+def metrics() -> dict[str, dict[str, float]]:
+    """Snapshot of per-host retry/throttling counters."""
+    with _lock:
+        return {host: dict(counters) for host, counters in _metrics.items()}
+
+
+def reset() -> None:
+    """Drop all buckets and counters (tests)."""
+    with _lock:
+        _buckets.clear()
+        _metrics.clear()
+
+
+# ── Delay policy ───────────────────────────────────────────────────────
+
+
+def retry_after_seconds(headers: Any) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    value = None
+    for key, val in (headers or {}).items():
+        if key.lower() == "retry-after":
+            value = val
+            break
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff(attempt: int) -> float:
+    """Full-jitter exponential backoff for retry number ``attempt`` (0-based)."""
+    return random.uniform(0, min(_BACKOFF_MAX, _BACKOFF_BASE * 2 ** attempt))
+
+
+def next_delay(host: str, attempt: int, stop_at: float, headers: Any = None,
+               *, throttled: bool = False) -> float | None:
+    """Delay before retry ``attempt + 1``, or None when the budget is spent.
+
+    ``throttled`` responses with a ``Retry-After`` also pause the host bucket.
+    """
+    retry_after = retry_after_seconds(headers)
+    delay = retry_after if retry_after is not None else backoff(attempt)
+    if throttled:
+        record(host, "throttled")
+        if retry_after is not None:
+            bucket(host).block(retry_after)
+    if attempt + 1 >= HTTP_RETRY_MAX_ATTEMPTS or time.monotonic() + delay > stop_at:
+        return None
+    record(host, "retries")
+    record(host, "retry_wait_seconds", delay)
+    return delay
+
+
+def _take_token(host: str) -> float:
+    wait = bucket(host).reserve()
+    if wait:
+        record(host, "rate_limit_wait_seconds", wait)
+    return wait
+
+
+def _give_up(host: str, resp: httpx.Response) -> httpx.Response:
+    """Return the final response, or raise if it is still a throttle."""
+    if resp.status_code in THROTTLE_STATUS:
+        record(host, "gave_up")
+        logger.warning("%s still throttling (HTTP %d) after retries", host, resp.status_code)
+        raise UpstreamThrottled(host, retry_after_seconds(resp.headers))
+    return resp
+
+
+# ── Request wrappers ───────────────────────────────────────────────────
+
+
+async def request(client: httpx.AsyncClient, method: str, url: str, *,
+                  deadline: float | None = None, **kwargs: Any) -> httpx.Response:
+    """``client.request`` with rate limiting and retries (see module docstring)."""
+    host = httpx.URL(url).host
+    stop_at = time.monotonic() + (deadline if deadline is not None else HTTP_RETRY_DEADLINE_SECONDS)
+    attempt = 0
+    while True:
+        wait = _take_token(host)
+        if wait:
+            await asyncio.sleep(wait)
+        record(host, "requests")
+        try:
+            resp = await client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            delay = next_delay(host, attempt, stop_at)
+            if delay is None:
+                raise
+            logger.info("%s %s failed (%s); retrying in %.1fs", method, host, e, delay)
+        else:
+            if resp.status_code not in _RETRY_STATUS:
+                return resp
+            delay = next_delay(host, attempt, stop_at, resp.headers,
+                               throttled=resp.status_code in THROTTLE_STATUS)
+            if delay is None:
+                return _give_up(host, resp)
+            logger.info("%s %s returned %d; retrying in %.1fs", method, host, resp.status_code, delay)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def request_sync(client: httpx.Client, method: str, url: str, *,
+                 deadline: float | None = None, **kwargs: Any) -> httpx.Response:
+    """Blocking twin of ``request`` for code running in worker threads."""
+    host = httpx.URL(url).host
+    stop_at = time.monotonic() + (deadline if deadline is not None else HTTP_RETRY_DEADLINE_SECONDS)
+    attempt = 0
+    while True:
+        wait = _take_token(host)
+        if wait:
+            time.sleep(wait)
+        record(host, "requests")
+        try:
+            resp = client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            delay = next_delay(host, attempt, stop_at)
+            if delay is None:
+                raise
+            logger.info("%s %s failed (%s); retrying in %.1fs", method, host, e, delay)
+        else:
+            if resp.status_code not in _RETRY_STATUS:
+                return resp
+            delay = next_delay(host, attempt, stop_at, resp.headers,
+                               throttled=resp.status_code in THROTTLE_STATUS)
+            if delay is None:
+                return _give_up(host, resp)
+            logger.info("%s %s returned %d; retrying in %.1fs", method, host, resp.status_code, delay)
+        time.sleep(delay)
+        attempt += 1
@@ -0,0 +1,145 @@
+"""Intel store — gathered IQ data kept server-side behind an ``intel_id`` handle.
+
+The meeting-prep workflow used to hand the LLM tens of KB of raw IQ JSON,
+which it then copied verbatim into the document tools' arguments — thousands
+of output tokens per deck.  Instead the workflow ``put``s what it gathered
+here and returns a short ``intel_id`` plus a summary; the document tools
+take the handle and ``get`` the full data back.
+
+Records belong to the Copilot session that created them (the one bound in
+``src.progress`` around the tool call), so one conversation cannot render
+another's data by guessing a handle.  Entries expire after
+``INTEL_STORE_TTL_SECONDS`` and the store is bounded to
+``INTEL_STORE_MAX_ENTRIES``.  The store lives in process memory: a handle is
+only valid on the worker that issued it.
+"""
+
+from __future__ import annotations
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from src import progress
+from src.tools import compaction
+from src.config import INTEL_STORE_MAX_ENTRIES, INTEL_STORE_TTL_SECONDS
+
+
+class IntelNotFound(LookupError):
+    """Unknown, expired or foreign ``intel_id``."""
+
+    def __init__(self, intel_id: str):
+        self.intel_id = intel_id
+        super().__init__(
+            f"intel_id '{intel_id}' is unknown or has expired. "
+            "Run run_meeting_prep_workflow again to gather fresh data."
+        )
+
+
+def missing_sources(sources: dict[str, dict[str, Any]]) -> list[str]:
+    """Sources that cannot back a document: empty, failed or timed out, or awaiting sign-in."""
+    return [
+        name for name, data in sources.items()
+        if not data or data.get("error") or data.get("auth_required")
+    ]
+
+
+@dataclass
+class IntelRecord:
+    intel_id: str
+    customer_name: str
+    work_iq: dict[str, Any] = field(default_factory=dict)
+    fabric_iq: dict[str, Any] = field(default_factory=dict)
+    foundry_iq: dict[str, Any] = field(default_factory=dict)
+    timed_out: list[str] = field(default_factory=list)
+    degraded: bool = False
+    session_id: str | None = None
+    expires_at: float = 0.0
+
+    def sources(self) -> dict[str, dict[str, Any]]:
+        return {"work_iq": self.work_iq, "fabric_iq": self.fabric_iq, "foundry_iq": self.foundry_iq}
+
+    def missing(self) -> list[str]:
+        return missing_sources(self.sources())
+
+
+class IntelStore:
+    """Thread-safe TTL + LRU map of ``intel_id`` → ``IntelRecord``."""
+
+    def __init__(self, ttl: float = INTEL_STORE_TTL_SECONDS, max_entries: int = INTEL_STORE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._records: OrderedDict[str, IntelRecord] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, customer_name: str, intel: dict[str, Any]) -> IntelRecord:
+        """Store ``intel`` (a workflow result) for the current session."""
+        record = IntelRecord(
+            intel_id=f"intel_{secrets.token_hex(8)}",
+            customer_name=customer_name,
+            work_iq=intel.get("work_iq") or {},
+            fabric_iq=intel.get("fabric_iq") or {},
+            foundry_iq=intel.get("foundry_iq") or {},
+            timed_out=list(intel.get("timed_out") or []),
+            degraded=bool(intel.get("degraded")),
+            session_id=progress.current_session.get(),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        with self._lock:
+            self._records[record.intel_id] = record
+            while len(self._records) > self.max_entries:
+                self._records.popitem(last=False)
+        return record
+
+    def get(self, intel_id: str) -> IntelRecord:
+        """Return the record, or raise IntelNotFound."""
+        session_id = progress.current_session.get()
+        with self._lock:
+            record = self._records.get(intel_id.strip())
+            if record is None or record.expires_at <= time.monotonic():
+                self._records.pop(intel_id.strip(), None)
+                raise IntelNotFound(intel_id)
+            if record.session_id is not None and record.session_id != session_id:
+                raise IntelNotFound(intel_id)
+            self._records.move_to_end(record.intel_id)
+            return record
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+_store = IntelStore()
+
+
+def get_store() -> IntelStore:
+    """Return the process-wide intel store."""
+    return _store
+
+
+# ── Tool result ────────────────────────────────────────────────────────
+
+
+def summarize(record: IntelRecord) -> dict[str, Any]:
+    """Token-budgeted view of each source (see ``compaction``)."""
+    return {name: compaction.compact(name, data) for name, data in record.sources().items()}
+
+
+def tool_result(record: IntelRecord) -> dict[str, Any]:
+    """What the workflow tools return to the LLM instead of the raw IQ data."""
+    result: dict[str, Any] = {
+        "intel_id": record.intel_id,
+        "customer_name": record.customer_name,
+        "summary": summarize(record),
+        "timed_out": record.timed_out,
+        "degraded": record.degraded,
+    }
+    for name, data in record.sources().items():
+        if data.get("auth_required"):
+            result.update(auth_required=True, auth_url=data.get("auth_url"), message=data.get("message"))
+        elif data.get("error"):
+            result.setdefault("errors", {})[name] = data["error"]
+    return result
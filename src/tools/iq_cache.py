@@ -0,0 +1,312 @@
+"""IQ result cache — per-customer TTL cache with stale-while-revalidate.
+
+Reps ask several questions about the same account within minutes; each one
+used to re-query Graph, Fabric and Search.  Results are cached under
+``(tool, canonical customer key, principal)``:
+
+* within the source's TTL a hit is served as-is;
+* for ``IQ_CACHE_STALE_SECONDS`` after that it is still served immediately
+  while one background refresh replaces it;
+* "not found" results are cached for ``IQ_CACHE_NEGATIVE_TTL`` seconds;
+* throttled and auth-required results are never cached.
+
+The backend is an in-process LRU by default.  Set ``IQ_CACHE_BACKEND=sqlite``
+to share entries between worker processes through a local SQLite file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from src.config import (
+    IQ_CACHE_BACKEND,
+    IQ_CACHE_MAX_ENTRIES,
+    IQ_CACHE_NEGATIVE_TTL,
+    IQ_CACHE_PATH,
+    IQ_CACHE_STALE_SECONDS,
+    IQ_CACHE_TTLS,
+)
+from src.tools.customer_resolver import canonical_key
+
+logger = logging.getLogger(__name__)
+
+# (value, fresh_until, stale_until) — wall-clock seconds so SQLite entries
+# mean the same thing in every process.
+Entry = tuple[Any, float, float]
+
+
+# ── Backends ───────────────────────────────────────────────────────────
+
+
+class MemoryBackend:
+    """Thread-safe in-process LRU."""
+
+    def __init__(self, max_entries: int = IQ_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteBackend:
+    """Local-file backend shared by worker processes on one host.
+
+    Values are stored as JSON.  Beyond ``max_entries`` the entries written
+    longest ago are dropped.
+    """
+
+    _PRUNE_EVERY = 64
+
+    def __init__(self, path: Path, max_entries: int = IQ_CACHE_MAX_ENTRIES):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS iq_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " fresh_until REAL NOT NULL, stale_until REAL NOT NULL,"
+                " written_at REAL NOT NULL)"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Entry | None:
+        row = self._conn().execute(
+            "SELECT value, fresh_until, stale_until FROM iq_cache WHERE key = ?", (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1], row[2]
+
+    def set(self, key: str, entry: Entry) -> None:
+        value, fresh_until, stale_until = entry
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO iq_cache VALUES (?, ?, ?, ?, ?)",
+            (key, json.dumps(value, default=str), fresh_until, stale_until, time.time()),
+        )
+        self._writes += 1
+        if self._writes % self._PRUNE_EVERY == 0:
+            conn.execute(
+                "DELETE FROM iq_cache WHERE key NOT IN"
+                " (SELECT key FROM iq_cache ORDER BY written_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM iq_cache")
+
+
+# ── Cache ──────────────────────────────────────────────────────────────
+
+
+def _is_cacheable(value: Any) -> bool:
+    return isinstance(value, dict) and not value.get("throttled") and not value.get("auth_required")
+
+
+class IQCache:
+    """TTL + stale-while-revalidate cache in front of the IQ tools."""
+
+    def __init__(
+        self,
+        backend: MemoryBackend | SQLiteBackend,
+        ttls: dict[str, float] = IQ_CACHE_TTLS,
+        *,
+        stale_seconds: float = IQ_CACHE_STALE_SECONDS,
+        negative_ttl: float = IQ_CACHE_NEGATIVE_TTL,
+    ):
+        self.backend = backend
+        self.ttls = ttls
+        self.stale_seconds = stale_seconds
+        self.negative_ttl = negative_ttl
+        self._refreshing: set[str] = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="iq-cache-refresh")
+        self._tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def key(tool: str, customer_name: str, principal: str) -> str:
+        return f"{tool}|{canonical_key(customer_name)}|{principal}"
+
+    def enabled(self, tool: str) -> bool:
+        return self.ttls.get(tool, 0) > 0
+
+    def lookup(self, tool: str, customer_name: str, principal: str) -> tuple[Any, bool] | None:
+        """Return ``(value, is_fresh)`` for a usable entry, else None."""
+        if not self.enabled(tool):
+            return None
+        entry = self.backend.get(self.key(tool, customer_name, principal))
+        if entry is None:
+            return None
+        value, fresh_until, stale_until = entry
+        now = time.time()
+        if now >= stale_until:
+            return None
+        return copy.deepcopy(value), now < fresh_until
+
+    def store(self, tool: str, customer_name: str, principal: str, value: Any) -> None:
+        if not self.enabled(tool) or not _is_cacheable(value):
+            return
+        now = time.time()
+        if "error" in value:
+            entry = (value, now + self.negative_ttl, now + self.negative_ttl)
+        else:
+            fresh_until = now + self.ttls[tool]
+            entry = (value, fresh_until, fresh_until + self.stale_seconds)
+        self.backend.set(self.key(tool, customer_name, principal), copy.deepcopy(entry))
+
+    def _claim_refresh(self, key: str) -> bool:
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _release_refresh(self, key: str) -> None:
+        with self._refresh_lock:
+            self._refreshing.discard(key)
+
+    # ── Sync ──
+
+    def get_or_fetch(self, tool: str, customer_name: str, principal: str,
+                     fetch: Callable[[], Any]) -> Any:
+        hit = self.lookup(tool, customer_name, principal)
+        if hit is not None:
+            value, fresh = hit
+            if not fresh:
+                self._refresh_sync(tool, customer_name, principal, fetch)
+            return value
+        value = fetch()
+        self.store(tool, customer_name, principal, value)
+        return value
+
+    def _refresh_sync(self, tool: str, customer_name: str, principal: str,
+                      fetch: Callable[[], Any]) -> None:
+        key = self.key(tool, customer_name, principal)
+        if not self._claim_refresh(key):
+            return
+
+        def run() -> None:
+            try:
+                self.store(tool, customer_name, principal, fetch())
+            except Exception:
+                logger.warning("Background refresh of %s failed", key, exc_info=True)
+            finally:
+                self._release_refresh(key)
+
+        self._refresh_pool.submit(run)
+
+    # ── Async ──
+
+    async def aget_many(self, tool: str, customer_names: list[str], principal: str,
+                        fetch_many: Callable[[list[str]], Awaitable[dict[str, Any]]]) -> dict[str, Any]:
+        """Cached values for ``customer_names``; misses are fetched in one call.
+
+        Stale hits are returned immediately and refreshed together in the
+        background.
+        """
+        results: dict[str, Any] = {}
+        stale: list[str] = []
+        misses: list[str] = []
+        for name in customer_names:
+            hit = self.lookup(tool, name, principal)
+            if hit is None:
+                misses.append(name)
+                continue
+            results[name] = hit[0]
+            if not hit[1] and self._claim_refresh(self.key(tool, name, principal)):
+                stale.append(name)
+
+        if stale:
+            task = asyncio.create_task(self._refresh_many(tool, stale, principal, fetch_many))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        if misses:
+            fetched = await fetch_many(misses)
+            for name, value in fetched.items():
+                self.store(tool, name, principal, value)
+            results.update(fetched)
+        return {name: results[name] for name in customer_names}
+
+    async def _refresh_many(self, tool: str, names: list[str], principal: str,
+                            fetch_many: Callable[[list[str]], Awaitable[dict[str, Any]]]) -> None:
+        try:
+            for name, value in (await fetch_many(names)).items():
+                self.store(tool, name, principal, value)
+        except Exception:
+            logger.warning("Background refresh of %s for %s failed", tool, names, exc_info=True)
+        finally:
+            for name in names:
+                self._release_refresh(self.key(tool, name, principal))
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+_cache: IQCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> IQCache:
+    """Return the process-wide IQ cache, creating its backend on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            backend = SQLiteBackend(IQ_CACHE_PATH) if IQ_CACHE_BACKEND == "sqlite" else MemoryBackend()
+            _cache = IQCache(backend)
+        return _cache
+
+
+def cached(tool: str, principal: Callable[[], str | None]) -> Callable:
+    """Decorator caching a sync ``fn(customer_name)`` IQ tool.
+
+    ``principal()`` names the identity the data is fetched as; returning None
+    (e.g. mock mode) bypasses the cache.
+    """
+    def decorator(fn: Callable[[str], Any]) -> Callable[[str], Any]:
+        @functools.wraps(fn)
+        def wrapper(customer_name: str) -> Any:
+            who = principal()
+            if who is None:
+                return fn(customer_name)
+            return get_cache().get_or_fetch(tool, customer_name, who, lambda: fn(customer_name))
+        return wrapper
+    return decorator
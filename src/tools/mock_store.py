@@ -0,0 +1,50 @@
+"""Mock data store — loads mock_data/*.json once and serves lookups from memory.
+
+Each file is parsed on first use and re-read only when its mtime changes.
+Customer names are resolved to record keys by a per-file CustomerResolver
+(exact/alias dict hit, then ranked fuzzy matching), so lookups do no file I/O.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from src.tools.customer_resolver import CustomerResolver, alias_table
+
+_stores: dict[Path, dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def _store(path: Path) -> dict[str, Any]:
+    """Return the in-memory store for ``path``, (re)loading it if the file changed."""
+    mtime = path.stat().st_mtime_ns
+    store = _stores.get(path)
+    if store is not None and store["mtime"] == mtime:
+        return store
+    with _lock:
+        store = _stores.get(path)
+        if store is None or store["mtime"] != mtime:
+            with open(path) as f:
+                data = json.load(f)
+            store = {"mtime": mtime, "data": data, "resolver": CustomerResolver(data, alias_table())}
+            _stores[path] = store
+        return store
+
+
+def lookup(path: Path, customer_name: str) -> Any | None:
+    """Return a copy of the record for ``customer_name``, or None if not found."""
+    store = _store(path)
+    key = store["resolver"].resolve(customer_name)
+    if key is None:
+        return None
+    return copy.deepcopy(store["data"][key])
+
+
+def preload(*paths: Path) -> None:
+    """Parse ``paths`` and build their resolvers now rather than on first lookup."""
+    for path in paths:
+        _store(path)
@@ -0,0 +1,95 @@
+"""Output cache — content-addressed reuse of generated documents.
+
+Generated files are named by a stable hash of everything that goes into them,
+so a repeat call with identical inputs finds the file already on disk and
+skips rendering.  Blob SAS URLs are remembered in memory until shortly before
+they expire.  The output directory is bounded by evicting the
+least-recently-used files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from src.config import OUTPUT_CACHE_MAX_BYTES, OUTPUT_CACHE_MAX_FILES
+
+# Generated SAS URLs are valid for 1 hour; stop handing them out a bit earlier.
+_URL_TTL_SECONDS = 55 * 60
+
+_OUTPUT_SUFFIXES = frozenset({".docx", ".pptx"})
+
+_url_cache: dict[str, tuple[str, float]] = {}
+_lock = threading.Lock()
+
+
+def cache_key(*parts: Any) -> str:
+    """Return a stable SHA-256 over JSON-serializable inputs (dict order ignored)."""
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_url(path: Path) -> str | None:
+    """Return a cached, still-valid download URL for a generated file."""
+    with _lock:
+        entry = _url_cache.get(path.name)
+        if entry and time.time() < entry[1]:
+            return entry[0]
+    return None
+
+
+def put_url(path: Path, url: str) -> None:
+    """Remember the download URL issued for a generated file."""
+    with _lock:
+        _url_cache[path.name] = (url, time.time() + _URL_TTL_SECONDS)
+
+
+def touch(path: Path) -> bool:
+    """Mark a cached file as recently used.  Returns False if it does not exist."""
+    try:
+        os.utime(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def evict(out_dir: Path, *, keep: Path | None = None,
+          max_bytes: int = OUTPUT_CACHE_MAX_BYTES,
+          max_files: int = OUTPUT_CACHE_MAX_FILES) -> list[Path]:
+    """Delete least-recently-used outputs until the directory is within bounds.
+
+    Returns the deleted paths.  ``keep`` is never evicted.
+    """
+    entries = []
+    for p in out_dir.iterdir():
+        if p.suffix not in _OUTPUT_SUFFIXES or p == keep:
+            continue
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+    entries.sort()
+
+    total_bytes = sum(size for _, size, _ in entries)
+    total_files = len(entries)
+    if keep is not None and keep.exists():
+        total_bytes += keep.stat().st_size
+        total_files += 1
+
+    removed: list[Path] = []
+    for _, size, p in entries:
+        if total_bytes <= max_bytes and total_files <= max_files:
+            break
+        p.unlink(missing_ok=True)
+        with _lock:
+            _url_cache.pop(p.name, None)
+        total_bytes -= size
+        total_files -= 1
+        removed.append(p)
+    return removed
@@ -0,0 +1,95 @@
+"""Render pool — runs CPU-bound document generation off the event loop.
+
+python-docx / python-pptx rendering holds the GIL, so running it on the event
+loop (or a default thread) stalls every other request's SSE stream.  When
+RENDER_POOL_SIZE > 0 the document tools run in a bounded ProcessPoolExecutor
+whose workers have already imported docx/pptx and loaded the brand template.
+With the pool disabled they fall back to a worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+from src.config import RENDER_POOL_SIZE, RENDER_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+
+class RenderPoolBusy(RuntimeError):
+    """Raised when the render pool's queue is full."""
+
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(max(RENDER_POOL_SIZE, 1) + RENDER_QUEUE_DEPTH)
+
+
+def _warm_worker() -> None:
+    """Process initializer — import the renderers and load the template once."""
+    from src.tools import doc_generator
+
+    doc_generator._template_bytes()
+
+
+def _ping() -> bool:
+    return True
+
+
+def _get_executor() -> ProcessPoolExecutor | None:
+    global _executor
+    if RENDER_POOL_SIZE <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            # Not fork: the pool starts while the event loop, the Copilot CLI
+            # reader and other threads are running, and a forked child can
+            # inherit their locks held.  _warm_worker does the imports.
+            _executor = ProcessPoolExecutor(
+                max_workers=RENDER_POOL_SIZE,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_warm_worker,
+            )
+        return _executor
+
+
+def start() -> None:
+    """Spawn and warm every worker so the first render doesn't pay for it."""
+    executor = _get_executor()
+    if executor is None:
+        return
+    futures = [executor.submit(_ping) for _ in range(RENDER_POOL_SIZE)]
+    for f in futures:
+        f.result()
+    logger.info("[RenderPool] %d workers warm", RENDER_POOL_SIZE)
+
+
+def shutdown() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+async def run(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run ``fn`` in the render pool (or a thread when the pool is disabled).
+
+    Raises RenderPoolBusy instead of queueing beyond RENDER_QUEUE_DEPTH.
+    """
+    if not _slots.acquire(blocking=False):
+        raise RenderPoolBusy("Document rendering is at capacity — try again shortly.")
+    try:
+        executor = _get_executor()
+        call = functools.partial(fn, *args, **kwargs)
+        if executor is None:
+            return await asyncio.to_thread(call)
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+    finally:
+        _slots.release()
@@ -0,0 +1,173 @@
+"""Single-flight request coalescing for IQ fetches.
+
+When a team preps for the same account at once, N identical lookups would
+each hit Graph/Search.  ``SingleFlight`` lets the first caller for a key do
+the work while concurrent callers for the same key wait for its result.
+Sync callers (tools running in worker threads) and async callers (the
+workflow, batched Work IQ) are coalesced separately but the same way.
+
+The result is snapshotted (deep-copied) once before any follower wakes; the
+leader keeps its own object and each follower gets a copy of the snapshot,
+so no caller can mutate another's data.  A follower that is cancelled does not cancel the
+shared fetch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+import threading
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from src.tools.customer_resolver import canonical_key
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._futures: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[Hashable, asyncio.Future]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    # ── Sync ──
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` once for all threads calling with ``key`` concurrently."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            call.result = copy.deepcopy(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    # ── Async ──
+
+    def _inflight(self) -> dict[Hashable, asyncio.Future]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            return self._futures.setdefault(loop, {})
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fn()`` once for all coroutines calling with ``key`` concurrently."""
+        async def fetch_one(names: list[str]) -> dict[str, Any]:
+            return {names[0]: await fn()}
+
+        return (await self.ado_many({"_": key}, fetch_one))["_"]
+
+    async def ado_many(
+        self,
+        keys: dict[str, Hashable],
+        fetch_many: Callable[[list[str]], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Coalesce a multi-item fetch item by item.
+
+        ``keys`` maps each name to its coalescing key.  Names already being
+        fetched by another caller are awaited; the rest are fetched with one
+        ``fetch_many`` call whose per-name results are shared in turn.
+        """
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight()
+        waiting: dict[str, asyncio.Future] = {}
+        leading: dict[str, asyncio.Future] = {}
+        for name, key in keys.items():
+            fut = inflight.get(key)
+            if fut is not None:
+                waiting[name] = fut
+                self.coalesced += 1
+            else:
+                fut = inflight[key] = loop.create_future()
+                leading[name] = fut
+
+        if leading:
+            task = loop.create_task(fetch_many(list(leading)))
+            task.add_done_callback(functools.partial(self._settle, inflight, keys, leading))
+
+        results: dict[str, Any] = {}
+        for name, fut in leading.items():
+            await asyncio.shield(fut)
+            # Our own object; followers share the snapshot held by ``fut``.
+            results[name] = task.result()[name]
+        for name, fut in waiting.items():
+            results[name] = copy.deepcopy(await asyncio.shield(fut))
+        return {name: results[name] for name in keys}
+
+    @staticmethod
+    def _settle(inflight: dict[Hashable, asyncio.Future], keys: dict[str, Hashable],
+                leading: dict[str, asyncio.Future], task: asyncio.Task) -> None:
+        for name, fut in leading.items():
+            inflight.pop(keys[name], None)
+            if fut.done():
+                continue
+            if task.cancelled():
+                fut.cancel()
+            elif task.exception() is not None:
+                fut.set_exception(task.exception())
+            elif name not in task.result():
+                fut.set_exception(KeyError(name))
+            else:
+                fut.set_result(copy.deepcopy(task.result()[name]))
+
+
+_flight = SingleFlight()
+
+
+def get() -> SingleFlight:
+    """Return the process-wide coalescer."""
+    return _flight
+
+
+def key(tool: str, customer_name: str, principal: str | None) -> tuple[str, str, str | None]:
+    """Coalescing key: same tool, same resolved customer, same identity."""
+    return tool, canonical_key(customer_name), principal
+
+
+def coalesce(tool: str, principal: Callable[[], str | None]) -> Callable:
+    """Decorator coalescing concurrent calls of a sync ``fn(customer_name)`` IQ tool.
+
+    ``principal()`` returning None (mock mode) calls ``fn`` directly.
+    """
+    def decorator(fn: Callable[[str], Any]) -> Callable[[str], Any]:
+        @functools.wraps(fn)
+        def wrapper(customer_name: str) -> Any:
+            who = principal()
+            if who is None:
+                return fn(customer_name)
+            return _flight.do(key(tool, customer_name, who), lambda: fn(customer_name))
+        return wrapper
+    return decorator
@@ -2,31 +2,28 @@
 
 In mock mode, returns data from mock_data/work_iq_data.json.
 In live mode, queries Microsoft Graph API directly using client credentials.
+``get_work_iq_data_async`` is the native async path used by the workflow: it
+packs the Graph sub-queries into JSON $batch requests on the pooled
+AsyncClient, and ``get_work_iq_data_many`` packs several customers into the
+same batches.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, Any
 
 import httpx
 
 from src.auth import DelegatedAuthRequired, get_graph_delegated_token, get_graph_token
 from src.config import GRAPH_USER_ID, MOCK_DATA_DIR, USE_MOCK_DATA
+from src.tools import graph_batch, http_pool, http_retry, iq_cache, mock_store, single_flight
 
 _MOCK_FILE = MOCK_DATA_DIR / "work_iq_data.json"
 
 _GRAPH_BASE = "https://graph.microsoft.com/v1.0"
-
-
-def _normalize_key(customer_name: str) -> str:
-    """Normalize customer name to a lookup key."""
-    return customer_name.lower().replace("the ", "").replace(" company", "").replace(" ", "-").strip()
-
-
-def _load_mock() -> dict[str, Any]:
-    with open(_MOCK_FILE) as f:
-        return json.load(f)
+_GRAPH_TIMEOUT = 15
 
 
 def _graph_headers() -> dict[str, str]:
@@ -36,31 +33,34 @@ def _graph_headers() -> dict[str, str]:
     }
 
 
-def _fetch_messages(customer_name: str) -> list[dict[str, Any]]:
-    """Fetch recent emails mentioning the customer from Graph."""
+def _delegated_graph_headers() -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {get_graph_delegated_token()}",
+        "ConsistencyLevel": "eventual",
+    }
+
+
+def _require_user_id() -> None:
     if not GRAPH_USER_ID:
         raise RuntimeError("GRAPH_USER_ID must be set when USE_MOCK_DATA=false")
 
-    url = f"{_GRAPH_BASE}/users/{GRAPH_USER_ID}/messages"
-    try:
-        resp = httpx.get(
-            url,
-            headers=_graph_headers(),
-            params={
-                "$search": f'"{customer_name}"',
-                "$top": "10",
-                "$select": "receivedDateTime,from,subject,bodyPreview",
-            },
-            timeout=15,
-        )
-        resp.raise_for_status()
-    except (httpx.HTTPStatusError, RuntimeError):
-        # Token not yet valid (e.g. Exchange replication delay) — return empty
-        return []
-    items = resp.json().get("value", [])
 
+# ── Request builders / response parsers (shared by sync and batch paths) ──
+#
+# Builders return a path relative to the Graph version root plus OData params.
+
+
+def _messages_request(customer_name: str) -> tuple[str, dict[str, str]]:
+    return f"/users/{GRAPH_USER_ID}/messages", {
+        "$search": f'"{customer_name}"',
+        "$top": "10",
+        "$select": "receivedDateTime,from,subject,bodyPreview",
+    }
+
+
+def _parse_messages(payload: dict[str, Any]) -> list[dict[str, Any]]:
     emails: list[dict[str, Any]] = []
-    for msg in items:
+    for msg in payload.get("value", []):
         from_addr = msg.get("from", {}).get("emailAddress", {})
         emails.append({
             "date": (msg.get("receivedDateTime") or "")[:10],
@@ -71,44 +71,17 @@ def _fetch_messages(customer_name: str) -> list[dict[str, Any]]:
     return emails
 
 
-def _delegated_graph_headers() -> dict[str, str]:
-    return {
-        "Authorization": f"Bearer {get_graph_delegated_token()}",
-        "ConsistencyLevel": "eventual",
+def _events_request(customer_name: str) -> tuple[str, dict[str, str]]:
+    return f"/users/{GRAPH_USER_ID}/events", {
+        "$filter": f"contains(subject,'{customer_name}')",
+        "$top": "10",
+        "$select": "start,subject,attendees,bodyPreview",
     }
 
 
-def _fetch_events(customer_name: str) -> list[dict[str, Any]]:
-    """Fetch calendar events mentioning the customer from Graph.
-
-    Uses the delegated token (Calendars.Read) since application-mode
-    calendar access is blocked for Entra Agent Identities.
-    """
-    if not GRAPH_USER_ID:
-        raise RuntimeError("GRAPH_USER_ID must be set when USE_MOCK_DATA=false")
-
-    url = f"{_GRAPH_BASE}/users/{GRAPH_USER_ID}/events"
-    try:
-        resp = httpx.get(
-            url,
-            headers=_delegated_graph_headers(),
-            params={
-                "$filter": f"contains(subject,'{customer_name}')",
-                "$top": "10",
-                "$select": "start,subject,attendees,bodyPreview",
-            },
-            timeout=15,
-        )
-        resp.raise_for_status()
-    except DelegatedAuthRequired:
-        raise
-    except (httpx.HTTPStatusError, RuntimeError):
-        # Delegated token not available or 403 — return empty calendar data
-        return []
-    items = resp.json().get("value", [])
-
+def _parse_events(payload: dict[str, Any]) -> list[dict[str, Any]]:
     meetings: list[dict[str, Any]] = []
-    for evt in items:
+    for evt in payload.get("value", []):
         attendees = [
             a.get("emailAddress", {}).get("name", "")
             for a in evt.get("attendees", [])
@@ -122,11 +95,11 @@ def _fetch_events(customer_name: str) -> list[dict[str, Any]]:
     return meetings
 
 
-def _query_graph(customer_name: str) -> dict[str, Any]:
-    """Build Work IQ data from Microsoft Graph API."""
-    emails = _fetch_messages(customer_name)
-    meetings = _fetch_events(customer_name)
-
+def _work_iq_record(
+    customer_name: str,
+    emails: list[dict[str, Any]],
+    meetings: list[dict[str, Any]],
+) -> dict[str, Any]:
     return {
         "customer_name": customer_name,
         "primary_contact": {},
@@ -138,37 +111,213 @@ def _query_graph(customer_name: str) -> dict[str, Any]:
     }
 
 
+def _auth_required_record(
+    customer_name: str, e: DelegatedAuthRequired, emails: list[dict[str, Any]],
+) -> dict[str, Any]:
+    return {
+        "auth_required": True,
+        "auth_url": e.auth_url,
+        "message": (
+            "Calendar access requires your authorization. "
+            f"Please visit {e.auth_url} to sign in, then tell me you're done."
+        ),
+        **_work_iq_record(customer_name, emails, []),
+    }
+
+
+# ── Sync path ──────────────────────────────────────────────────────────
+
+
+def _fetch_messages(customer_name: str) -> list[dict[str, Any]]:
+    """Fetch recent emails mentioning the customer from Graph."""
+    _require_user_id()
+
+    path, params = _messages_request(customer_name)
+    try:
+        resp = http_retry.request_sync(
+            http_pool.get_client(), "GET", _GRAPH_BASE + path,
+            headers=_graph_headers(), params=params, timeout=_GRAPH_TIMEOUT,
+        )
+        resp.raise_for_status()
+    except (httpx.HTTPStatusError, RuntimeError):
+        # Token not yet valid (e.g. Exchange replication delay) — return empty.
+        # Throttling is not swallowed here: UpstreamThrottled propagates.
+        return []
+    return _parse_messages(resp.json())
+
+
+def _fetch_events(customer_name: str) -> list[dict[str, Any]]:
+    """Fetch calendar events mentioning the customer from Graph.
+
+    Uses the delegated token (Calendars.Read) since application-mode
+    calendar access is blocked for Entra Agent Identities.
+    """
+    _require_user_id()
+
+    path, params = _events_request(customer_name)
+    try:
+        resp = http_retry.request_sync(
+            http_pool.get_client(), "GET", _GRAPH_BASE + path,
+            headers=_delegated_graph_headers(), params=params, timeout=_GRAPH_TIMEOUT,
+        )
+        resp.raise_for_status()
+    except DelegatedAuthRequired:
+        raise
+    except (httpx.HTTPStatusError, RuntimeError):
+        # Delegated token not available or 403 — return empty calendar data
+        return []
+    return _parse_events(resp.json())
+
+
+# Calendar lookups for the sync path run here while the caller fetches mail.
+_calendar_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="work-iq-calendar")
+
+
+def _query_graph(customer_name: str) -> dict[str, Any]:
+    """Build Work IQ data from Microsoft Graph API (mail and calendar concurrently)."""
+    meetings = _calendar_executor.submit(_fetch_events, customer_name)
+    emails = _fetch_messages(customer_name)
+    try:
+        return _work_iq_record(customer_name, emails, meetings.result())
+    except DelegatedAuthRequired as e:
+        # Mail already arrived — no need to refetch it for the auth prompt.
+        return _auth_required_record(customer_name, e, emails)
+
+
+# ── Async batch path ───────────────────────────────────────────────────
+
+# Mail runs under the app token and calendar under the delegated token; a
+# $batch carries a single identity, so each kind goes out in its own batch.
+_BATCH_SUB_HEADERS = {"ConsistencyLevel": "eventual"}
+
+
+def _sub_request(req_id: str, request: tuple[str, dict[str, str]]) -> graph_batch.SubRequest:
+    return graph_batch.SubRequest(req_id, graph_batch.relative_url(*request), dict(_BATCH_SUB_HEADERS))
+
+
+async def _run_batch(
+    header_fn, requests: list[graph_batch.SubRequest],
+) -> dict[str, graph_batch.SubResponse]:
+    """Send ``requests`` under one identity.  A failed batch yields no responses.
+
+    ``DelegatedAuthRequired`` and ``UpstreamThrottled`` propagate.
+    """
+    try:
+        # Token acquisition may block on MSAL/network; keep it off the loop.
+        headers = await asyncio.to_thread(header_fn)
+        return await graph_batch.send(http_pool.get_async_client(), requests, headers)
+    except DelegatedAuthRequired:
+        raise
+    except (httpx.HTTPStatusError, RuntimeError):
+        return {}
+
+
+def _batch_body(results: dict[str, graph_batch.SubResponse], req_id: str) -> dict[str, Any]:
+    item = results.get(req_id)
+    if item is None or not item.ok or not isinstance(item.body, dict):
+        return {}
+    return item.body
+
+
+def _throttled_item(*results: Any, req_id: str) -> http_retry.UpstreamThrottled | None:
+    """An ``UpstreamThrottled`` for ``req_id`` if any batch left it throttled."""
+    for group in results:
+        item = group.get(req_id) if isinstance(group, dict) else None
+        if item is not None and item.status in http_retry.THROTTLE_STATUS:
+            return http_retry.UpstreamThrottled(
+                graph_batch.GRAPH_HOST, http_retry.retry_after_seconds(item.headers),
+            )
+    return None
+
+
+async def _query_graph_many(customer_names: list[str]) -> dict[str, dict[str, Any]]:
+    """Build Work IQ data for several customers from as few Graph round trips as possible."""
+    _require_user_id()
+
+    mail = [_sub_request(str(i), _messages_request(n)) for i, n in enumerate(customer_names)]
+    calendar = [_sub_request(str(i), _events_request(n)) for i, n in enumerate(customer_names)]
+    mail_results, calendar_results = await asyncio.gather(
+        _run_batch(_graph_headers, mail),
+        _run_batch(_delegated_graph_headers, calendar),
+        return_exceptions=True,
+    )
+    for outcome in (mail_results, calendar_results):
+        if isinstance(outcome, http_retry.UpstreamThrottled):
+            return {name: http_retry.throttled_result(name, outcome) for name in customer_names}
+    if isinstance(mail_results, BaseException):
+        raise mail_results
+    if isinstance(calendar_results, BaseException) and not isinstance(calendar_results, DelegatedAuthRequired):
+        raise calendar_results
+
+    records: dict[str, dict[str, Any]] = {}
+    for i, name in enumerate(customer_names):
+        throttled = _throttled_item(mail_results, calendar_results, req_id=str(i))
+        if throttled is not None:
+            records[name] = http_retry.throttled_result(name, throttled)
+            continue
+        emails = _parse_messages(_batch_body(mail_results, str(i)))
+        if isinstance(calendar_results, DelegatedAuthRequired):
+            # Mail already arrived — no need to refetch it for the auth prompt.
+            records[name] = _auth_required_record(name, calendar_results, emails)
+        else:
+            meetings = _parse_events(_batch_body(calendar_results, str(i)))
+            records[name] = _work_iq_record(name, emails, meetings)
+    return records
+
+
+async def _fetch_many_coalesced(customer_names: list[str]) -> dict[str, dict[str, Any]]:
+    """``_query_graph_many``, sharing in-flight lookups with concurrent callers."""
+    principal = _cache_principal()
+    keys = {name: single_flight.key("work_iq", name, principal) for name in customer_names}
+    return await single_flight.get().ado_many(keys, _query_graph_many)
+
+
+# ── Tool entry points ──────────────────────────────────────────────────
+
+
+def _cache_principal() -> str | None:
+    """Graph data is per mailbox; mock data is not cached."""
+    return None if USE_MOCK_DATA else f"graph:{GRAPH_USER_ID}"
+
+
+def _mock_record(customer_name: str) -> dict[str, Any]:
+    record = mock_store.lookup(_MOCK_FILE, customer_name)
+    if record is not None:
+        return record
+    return {"error": f"No Work IQ mock data found for '{customer_name}'"}
+
+
+@iq_cache.cached("work_iq", _cache_principal)
+@single_flight.coalesce("work_iq", _cache_principal)
 def get_work_iq_data(
     customer_name: Annotated[str, "Customer company name to look up"],
 ) -> dict[str, Any]:
     """Retrieve relationship context from Microsoft Graph — recent emails,
     Teams messages, calendar events, and people information for a customer."""
     if USE_MOCK_DATA:
-        data = _load_mock()
-        key = _normalize_key(customer_name)
-        if key in data:
-            return data[key]
-        # Fuzzy match: check if any key is contained in the query
-        for k, v in data.items():
-            if k in key or key in k:
-                return v
-        return {"error": f"No Work IQ mock data found for '{customer_name}'"}
+        return _mock_record(customer_name)
 
     try:
         return _query_graph(customer_name)
-    except DelegatedAuthRequired as e:
-        return {
-            "auth_required": True,
-            "auth_url": e.auth_url,
-            "message": (
-                "Calendar access requires your authorization. "
-                f"Please visit {e.auth_url} to sign in, then tell me you're done."
-            ),
-            "customer_name": customer_name,
-            "recent_emails": _fetch_messages(customer_name),
-            "recent_meetings": [],
-            "primary_contact": {},
-            "account_team": {},
-            "teams_messages": [],
-            "relationship_summary": "",
-        }
+    except http_retry.UpstreamThrottled as e:
+        return http_retry.throttled_result(customer_name, e)
+
+
+async def get_work_iq_data_async(customer_name: str) -> dict[str, Any]:
+    """Async variant of ``get_work_iq_data`` — no worker thread per lookup."""
+    return (await get_work_iq_data_many([customer_name]))[customer_name]
+
+
+async def get_work_iq_data_many(customer_names: list[str]) -> dict[str, dict[str, Any]]:
+    """Work IQ data for several customers, keyed by the name as given.
+
+    Live lookups are served from the IQ cache where possible; the rest share
+    Graph $batch requests (up to 20 sub-requests each), so N customers cost
+    about two round trips per 10 customers.
+    """
+    names = list(dict.fromkeys(customer_names))
+    if not names:
+        return {}
+    if USE_MOCK_DATA:
+        return {name: _mock_record(name) for name in names}
+    return await iq_cache.get_cache().aget_many("work_iq", names, _cache_principal(), _fetch_many_coalesced)
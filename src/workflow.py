@@ -7,27 +7,68 @@ Why "better together": With the Copilot SDK alone, the LLM must sequentially
 decide to call each tool. The Agent Framework's workflow graph gives you
 deterministic parallel fan-out, then hands control back to the Copilot SDK's
 LLM for the reasoning phase.
+
+Every source runs under its own deadline, capped by what is left of the
+overall budget, so one slow backend cannot hold up the others: a late
+source is reported as timed out and the partial result is returned on time.
+
+Each source's result is also emitted as a workflow data event the moment it
+lands.  ``stream_meeting_prep_workflow`` yields those as they arrive, and the
+``run_meeting_prep_workflow`` tool forwards them to the request's SSE stream
+as progress events (see ``src.progress``).
+
+``prepare_meeting_package`` runs the whole "full prep" path as one graph —
+gather, then render both documents in the render pool — so the LLM never
+has to pass the gathered data back as tool arguments.  It only writes the
+narrative summary from the result.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from dataclasses import dataclass, field
 from typing import Annotated, Any, Never
 
-from agent_framework import WorkflowBuilder, WorkflowContext, executor
-
-from src.tools import get_fabric_iq_data, get_foundry_iq_data, get_work_iq_data
+from agent_framework import WorkflowBuilder, WorkflowContext, WorkflowEvent, executor
+
+from src import progress
+
+from src.config import (
+    GRAPH_USER_ID,
+    USE_MOCK_DATA,
+    WORKFLOW_BUDGET_SECONDS,
+    WORKFLOW_POOL_SIZE,
+    WORKFLOW_RENDER_TIMEOUT_SECONDS,
+    WORKFLOW_SOURCE_TIMEOUTS,
+)
+from src.tools import (
+    compaction,
+    generate_meeting_package,
+    get_fabric_iq_data,
+    get_foundry_iq_data,
+    intel_store,
+    single_flight,
+)
+from src.tools.work_iq import get_work_iq_data_async
 
 logger = logging.getLogger(__name__)
 
 
+_SOURCES = ("work_iq", "fabric_iq", "foundry_iq")
+
+
 @dataclass
 class CustomerRequest:
     customer_name: str
     request_text: str
+    # time.monotonic() by which every source must have answered; None = no budget.
+    deadline_at: float | None = None
 
 
 @dataclass
@@ -37,6 +78,53 @@ class GatheredIntel:
     work_iq: dict[str, Any] = field(default_factory=dict)
     fabric_iq: dict[str, Any] = field(default_factory=dict)
     foundry_iq: dict[str, Any] = field(default_factory=dict)
+    timed_out: list[str] = field(default_factory=list)
+    # True when any source timed out, failed, was throttled or needs user consent.
+    degraded: bool = False
+    timings_ms: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class PreparedMeeting:
+    intel: GatheredIntel
+    # {"prep_doc": url, "presentation": url}; empty when rendering was skipped or failed.
+    documents: dict[str, str] = field(default_factory=dict)
+    render_error: str | None = None
+
+
+def _source_timeout(source: str, req: CustomerRequest) -> float:
+    timeout = WORKFLOW_SOURCE_TIMEOUTS[source]
+    if req.deadline_at is not None:
+        timeout = min(timeout, max(0.0, req.deadline_at - time.monotonic()))
+    return timeout
+
+
+async def _gather(source: str, req: CustomerRequest, ctx: WorkflowContext[dict],
+                  fetch: Callable[[], Awaitable[dict[str, Any]]]) -> None:
+    """Run one source's fetch under its deadline, announce it, and fan it in."""
+    timeout = _source_timeout(source, req)
+    start = time.perf_counter()
+    try:
+        data = await asyncio.wait_for(fetch(), timeout)
+        timed_out = False
+    except TimeoutError:
+        # A worker thread may still finish and warm the IQ cache for next time.
+        logger.warning("[Workflow] %s timed out after %.1fs for %s", source, timeout, req.customer_name)
+        data = {"error": f"{source} did not respond within {timeout:.1f}s", "timed_out": True}
+        timed_out = True
+    except Exception as e:
+        # One broken source must not leave the fan-in waiting for a message.
+        logger.exception("[Workflow] %s failed for %s", source, req.customer_name)
+        data = {"error": f"{source} failed: {e}", "failed": True}
+        timed_out = False
+    msg = {
+        "source": source,
+        "data": data,
+        "timed_out": timed_out,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+    await ctx.add_event(WorkflowEvent.emit(source, msg))
+    await ctx.send_message(msg)
 
 
 # ── Workflow executors ─────────────────────────────────────────────────
@@ -54,29 +142,24 @@ async def start_node(req: CustomerRequest, ctx: WorkflowContext[CustomerRequest]
 async def gather_work_iq(req: CustomerRequest, ctx: WorkflowContext[dict]) -> None:
     """Fetch relationship context from Microsoft Graph."""
     logger.info("[Workflow] Gathering Work IQ for %s", req.customer_name)
-    result = await asyncio.to_thread(get_work_iq_data, req.customer_name)
-    await ctx.send_message({"source": "work_iq", "data": result})
+    await _gather("work_iq", req, ctx, lambda: get_work_iq_data_async(req.customer_name))
 
 
 @executor
 async def gather_fabric_iq(req: CustomerRequest, ctx: WorkflowContext[dict]) -> None:
     """Fetch business metrics from Fabric."""
     logger.info("[Workflow] Gathering Fabric IQ for %s", req.customer_name)
-    result = await asyncio.to_thread(get_fabric_iq_data, req.customer_name)
-    await ctx.send_message({"source": "fabric_iq", "data": result})
+    await _gather("fabric_iq", req, ctx, lambda: asyncio.to_thread(get_fabric_iq_data, req.customer_name))
 
 
 @executor
 async def gather_foundry_iq(req: CustomerRequest, ctx: WorkflowContext[dict]) -> None:
     """Fetch sales enablement materials from Foundry."""
     logger.info("[Workflow] Gathering Foundry IQ for %s", req.customer_name)
-    result = await asyncio.to_thread(get_foundry_iq_data, req.customer_name)
-    await ctx.send_message({"source": "foundry_iq", "data": result})
+    await _gather("foundry_iq", req, ctx, lambda: asyncio.to_thread(get_foundry_iq_data, req.customer_name))
 
 
-@executor
-async def aggregate(messages: list[dict], ctx: WorkflowContext[Never, GatheredIntel]) -> None:
-    """Fan-in aggregator — collects all IQ results into a single GatheredIntel."""
+def _merge(messages: list[dict], ctx: WorkflowContext[Any, Any]) -> GatheredIntel:
     intel = GatheredIntel(
         customer_name=ctx.get_state("customer_name", ""),
         request_text=ctx.get_state("request_text", ""),
@@ -91,6 +174,15 @@ async def aggregate(messages: list[dict], ctx: WorkflowContext[Never, GatheredIn
             intel.fabric_iq = data
         elif source == "foundry_iq":
             intel.foundry_iq = data
+        if msg.get("timed_out"):
+            intel.timed_out.append(source)
+        if "elapsed_ms" in msg:
+            intel.timings_ms[source] = msg["elapsed_ms"]
+
+    intel.degraded = bool(intel.timed_out) or any(
+        isinstance(d, dict) and (d.get("failed") or d.get("throttled") or d.get("auth_required"))
+        for d in (intel.work_iq, intel.fabric_iq, intel.foundry_iq)
+    )
 
     logger.info(
         "[Workflow] Aggregated — work_iq: %d chars, fabric_iq: %d chars, foundry_iq: %d chars",
@@ -98,7 +190,53 @@ async def aggregate(messages: list[dict], ctx: WorkflowContext[Never, GatheredIn
         len(json.dumps(intel.fabric_iq, default=str)),
         len(json.dumps(intel.foundry_iq, default=str)),
     )
-    await ctx.yield_output(intel)
+    return intel
+
+
+@executor
+async def aggregate(messages: list[dict], ctx: WorkflowContext[Never, GatheredIntel]) -> None:
+    """Fan-in aggregator — collects all IQ results into a single GatheredIntel."""
+    await ctx.yield_output(_merge(messages, ctx))
+
+
+@executor
+async def aggregate_for_render(messages: list[dict], ctx: WorkflowContext[GatheredIntel]) -> None:
+    """Fan-in for the prep pipeline — hands the GatheredIntel on to rendering."""
+    await ctx.send_message(_merge(messages, ctx))
+
+
+def render_blocker(sources: dict[str, Any]) -> str | None:
+    """Why documents must not be rendered from ``sources`` (same rule as the guardrail)."""
+    if any(isinstance(d, dict) and d.get("auth_required") for d in sources.values()):
+        return "Sign-in required before documents can be generated"
+    missing = intel_store.missing_sources(sources)
+    if missing:
+        return f"No usable data for {', '.join(missing)}"
+    return None
+
+
+@executor
+async def render_package(intel: GatheredIntel, ctx: WorkflowContext[Never, PreparedMeeting]) -> None:
+    """Render the prep doc and the deck in the render pool and publish both."""
+    prepared = PreparedMeeting(intel=intel)
+    prepared.render_error = render_blocker(
+        {"work_iq": intel.work_iq, "fabric_iq": intel.fabric_iq, "foundry_iq": intel.foundry_iq}
+    )
+    if prepared.render_error is None:
+        logger.info("[Workflow] Rendering meeting package for %s", intel.customer_name)
+        start = time.perf_counter()
+        try:
+            prepared.documents = await asyncio.wait_for(
+                generate_meeting_package(intel.customer_name, intel.work_iq, intel.fabric_iq, intel.foundry_iq),
+                WORKFLOW_RENDER_TIMEOUT_SECONDS,
+            )
+        except TimeoutError:
+            prepared.render_error = f"Document rendering did not finish within {WORKFLOW_RENDER_TIMEOUT_SECONDS:.0f}s"
+        except Exception as e:
+            logger.warning("[Workflow] Rendering failed for %s: %r", intel.customer_name, e)
+            prepared.render_error = f"Document rendering failed: {e}"
+        intel.timings_ms["render"] = round((time.perf_counter() - start) * 1000, 1)
+    await ctx.yield_output(prepared)
 
 
 # ── Builder ────────────────────────────────────────────────────────────
@@ -126,6 +264,86 @@ def create_data_workflow():
     )
 
 
+def create_prep_pipeline_workflow():
+    """Build the deterministic full-prep pipeline: gather, then render both documents.
+
+    Graph:
+        start_node ──fan-out──> gather_work_iq   ─┐
+                   ──fan-out──> gather_fabric_iq  ─┤──fan-in──> aggregate_for_render
+                   ──fan-out──> gather_foundry_iq ─┘                │
+                                                      render_package ──> PreparedMeeting
+    """
+    return (
+        WorkflowBuilder(start_executor=start_node, name="sales-prep-pipeline")
+        .add_fan_out_edges(
+            start_node,
+            [gather_work_iq, gather_fabric_iq, gather_foundry_iq],
+        )
+        .add_fan_in_edges(
+            [gather_work_iq, gather_fabric_iq, gather_foundry_iq],
+            aggregate_for_render,
+        )
+        .add_edge(aggregate_for_render, render_package)
+        .build()
+    )
+
+
+class WorkflowPool:
+    """Prebuilt workflow instances, each checked out by one run at a time.
+
+    A built workflow can be run again and again — every run gets fresh
+    executor state and a fresh GatheredIntel — but not concurrently, so
+    concurrent requests each take their own instance.  Instances are built
+    up front; extra ones are built on demand when every instance is busy
+    and kept (up to ``max_idle``) for the next burst.
+    """
+
+    def __init__(self, factory: Callable[[], Any] = create_data_workflow,
+                 size: int = WORKFLOW_POOL_SIZE, *, max_idle: int | None = None):
+        self._factory = factory
+        self._max_idle = max(size, max_idle or 0)
+        self._idle = [factory() for _ in range(size)]
+        self._lock = threading.Lock()
+        self.built = size
+
+    @contextlib.contextmanager
+    def checkout(self) -> Iterator[Any]:
+        with self._lock:
+            wf = self._idle.pop() if self._idle else None
+        if wf is None:
+            wf = self._factory()
+            with self._lock:
+                self.built += 1
+        yield wf
+        # Not reached when the run raised or was cancelled: such an instance
+        # may be left mid-run, so it is dropped rather than returned.
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(wf)
+
+
+_pools: dict[Callable[[], Any], WorkflowPool] = {}
+_pool_lock = threading.Lock()
+
+
+def _get_pool(factory: Callable[[], Any]) -> WorkflowPool:
+    with _pool_lock:
+        pool = _pools.get(factory)
+        if pool is None:
+            pool = _pools[factory] = WorkflowPool(factory)
+        return pool
+
+
+def get_workflow_pool() -> WorkflowPool:
+    """Return the process-wide data-gathering workflow pool, building it on first use."""
+    return _get_pool(create_data_workflow)
+
+
+def get_pipeline_pool() -> WorkflowPool:
+    """Return the process-wide prep-pipeline workflow pool, building it on first use."""
+    return _get_pool(create_prep_pipeline_workflow)
+
+
 # ── Tool wrapper ──────────────────────────────────────────────────────
 
 
@@ -133,16 +351,219 @@ async def run_meeting_prep_workflow(
     customer_name: Annotated[str, "Customer company name to research for meeting prep"],
 ) -> dict[str, Any]:
     """Run the parallel data-gathering workflow — fetches Work IQ, Fabric IQ,
-    and Foundry IQ simultaneously, then returns the aggregated intelligence.
-    Use this when preparing for a customer meeting to get all data at once."""
-    workflow = create_data_workflow()
-    result = await workflow.run(CustomerRequest(customer_name=customer_name, request_text=""))
-    outputs = result.get_outputs()
-    if not outputs:
+    and Foundry IQ simultaneously and keeps the full data server-side.
+    Returns an "intel_id" handle plus a summary; pass the intel_id to the
+    document tools instead of the data.  Sources that miss their deadline
+    are listed in "timed_out"."""
+    # Concurrent preps for the same account (and mailbox) share one run.
+    principal = None if USE_MOCK_DATA else GRAPH_USER_ID
+    flight_key = single_flight.key("run_meeting_prep_workflow", customer_name, principal)
+    with _watching(flight_key):
+        intel = await single_flight.get().ado(
+            flight_key,
+            lambda: _run_data_workflow(customer_name, on_source=_fan_out(flight_key)),
+        )
+    if "error" in intel:
+        return intel
+    return intel_store.tool_result(intel_store.get_store().put(customer_name, intel))
+
+
+async def prepare_meeting_package(
+    customer_name: Annotated[str, "Customer company name to prepare the meeting package for"],
+) -> dict[str, Any]:
+    """Full meeting prep in one call — gathers Work IQ, Fabric IQ and Foundry IQ
+    in parallel, then generates the Word prep doc and the PowerPoint deck.
+    Returns the document links ("documents"), a summary of the gathered data
+    and its "intel_id".  Sources that miss their deadline are listed in
+    "timed_out"; if documents could not be generated, "render_error" says why."""
+    principal = None if USE_MOCK_DATA else GRAPH_USER_ID
+    flight_key = single_flight.key("prepare_meeting_package", customer_name, principal)
+    with _watching(flight_key):
+        prepared = await single_flight.get().ado(
+            flight_key,
+            lambda: _run_prep_pipeline(customer_name, on_source=_fan_out(flight_key)),
+        )
+    if "error" in prepared:
+        return prepared
+    result = intel_store.tool_result(intel_store.get_store().put(customer_name, prepared))
+    result["documents"] = prepared["documents"]
+    if "render_error" in prepared:
+        result["render_error"] = prepared["render_error"]
+    return result
+
+
+async def stream_meeting_prep_workflow(customer_name: str) -> AsyncIterator[dict[str, Any]]:
+    """Gather all three sources for one customer, yielding each as it lands.
+
+    Yields ``{"type": "source", "customer_name", "source", "status",
+    "elapsed_ms", "data"}`` per source (fastest first), then
+    ``{"type": "result", "customer_name", "result"}``.  ``result`` is the raw
+    gathered data — ``work_iq``, ``fabric_iq``, ``foundry_iq``, ``timed_out``
+    and ``degraded``, or ``{"error": ...}`` — not the ``intel_id`` and
+    summary ``run_meeting_prep_workflow`` hands the LLM.  Nothing is put in
+    the intel store.
+    """
+    events: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    run = asyncio.create_task(_run_data_workflow(customer_name, on_source=events.put_nowait))
+    try:
+        while True:
+            next_event = asyncio.create_task(events.get())
+            done, _ = await asyncio.wait({next_event, run}, return_when=asyncio.FIRST_COMPLETED)
+            if next_event in done:
+                yield next_event.result()
+                continue
+            next_event.cancel()
+            while not events.empty():
+                yield events.get_nowait()
+            yield {"type": "result", "customer_name": customer_name, "result": run.result()}
+            return
+    finally:
+        run.cancel()
+
+
+# Progress sessions of every caller waiting on a coalesced run, by flight key.
+# Only touched from the event loop.
+_watchers: dict[Any, list[str | None]] = {}
+
+
+@contextlib.contextmanager
+def _watching(flight_key: Any) -> Iterator[None]:
+    """Register the current request's session for progress of ``flight_key``'s run."""
+    session_id = progress.current_session.get()
+    sessions = _watchers.setdefault(flight_key, [])
+    sessions.append(session_id)
+    try:
+        yield
+    finally:
+        sessions.remove(session_id)
+        if not sessions:
+            _watchers.pop(flight_key, None)
+
+
+def _fan_out(flight_key: Any) -> Callable[[dict[str, Any]], None]:
+    """on_source callback publishing to every caller sharing the run, not just its leader."""
+    def publish(event: dict[str, Any]) -> None:
+        for session_id in dict.fromkeys(_watchers.get(flight_key, ())):
+            with progress.bind(session_id):
+                _publish_source(event)
+    return publish
+
+
+def _publish_source(event: dict[str, Any]) -> None:
+    """Forward a source event to the request's stream with the LLM's compact view, not raw data."""
+    progress.publish({
+        "customer_name": event["customer_name"],
+        "source": event["source"],
+        "status": event["status"],
+        "elapsed_ms": event["elapsed_ms"],
+        "summary": compaction.compact(event["source"], event["data"]),
+    })
+
+
+# Slack for aggregation after the last source deadline before giving up entirely.
+_BUDGET_GRACE_SECONDS = 1.0
+
+
+def _source_event(customer_name: str, msg: dict[str, Any]) -> dict[str, Any]:
+    data = msg["data"]
+    if msg["timed_out"]:
+        status = "timed_out"
+    elif isinstance(data, dict) and "error" in data:
+        status = "error"
+    else:
+        status = "completed"
+    return {
+        "type": "source",
+        "customer_name": customer_name,
+        "source": msg["source"],
+        "status": status,
+        "elapsed_ms": msg["elapsed_ms"],
+        "data": data,
+    }
+
+
+async def _run_pooled(
+    pool: WorkflowPool,
+    customer_name: str,
+    budget: float,
+    on_source: Callable[[dict[str, Any]], None] | None,
+) -> Any:
+    """Run a pooled workflow and return its output (None if it yielded none).
+
+    Sources share ``WORKFLOW_BUDGET_SECONDS``; the run as a whole gets
+    ``budget`` plus a little grace, then raises TimeoutError.
+    """
+    req = CustomerRequest(
+        customer_name=customer_name,
+        request_text="",
+        deadline_at=time.monotonic() + WORKFLOW_BUDGET_SECONDS,
+    )
+
+    async def run(workflow: Any) -> Any:
+        output = None
+        async for event in workflow.run(req, stream=True):
+            if event.type == "data" and isinstance(event.data, dict) and "source" in event.data:
+                if on_source is not None:
+                    on_source(_source_event(customer_name, event.data))
+            elif event.type == "output":
+                output = event.data
+        return output
+
+    with pool.checkout() as workflow:
+        return await asyncio.wait_for(run(workflow), budget + _BUDGET_GRACE_SECONDS)
+
+
+def _budget_exhausted(customer_name: str, budget: float, what: str) -> dict[str, Any]:
+    logger.warning("[Workflow] Budget of %.1fs exhausted for %s", budget, customer_name)
+    return {
+        "error": f"{what} exceeded its {budget:.0f}s budget",
+        "timed_out": list(_SOURCES),
+        "degraded": True,
+    }
+
+
+async def _run_data_workflow(
+    customer_name: str,
+    on_source: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run the pooled workflow; ``on_source`` sees each source result as it lands."""
+    try:
+        intel = await _run_pooled(get_workflow_pool(), customer_name, WORKFLOW_BUDGET_SECONDS, on_source)
+    except TimeoutError:
+        return _budget_exhausted(customer_name, WORKFLOW_BUDGET_SECONDS, "Meeting prep data gathering")
+    if not isinstance(intel, GatheredIntel):
         return {"error": "Workflow returned no outputs"}
-    intel: GatheredIntel = outputs[0]
     return {
         "work_iq": intel.work_iq,
         "fabric_iq": intel.fabric_iq,
         "foundry_iq": intel.foundry_iq,
+        "timed_out": intel.timed_out,
+        "degraded": intel.degraded,
+    }
+
+
+async def _run_prep_pipeline(
+    customer_name: str,
+    on_source: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run the pooled gather → render pipeline for one customer."""
+    budget = WORKFLOW_BUDGET_SECONDS + WORKFLOW_RENDER_TIMEOUT_SECONDS
+    try:
+        prepared = await _run_pooled(get_pipeline_pool(), customer_name, budget, on_source)
+    except TimeoutError:
+        return _budget_exhausted(customer_name, budget, "Meeting prep")
+    if not isinstance(prepared, PreparedMeeting):
+        return {"error": "Workflow returned no outputs"}
+    intel = prepared.intel
+    result = {
+        "customer_name": customer_name,
+        "documents": prepared.documents,
+        "work_iq": intel.work_iq,
+        "fabric_iq": intel.fabric_iq,
+        "foundry_iq": intel.foundry_iq,
+        "timed_out": intel.timed_out,
+        "degraded": intel.degraded,
     }
+    if prepared.render_error:
+        result["render_error"] = prepared.render_error
+    return result
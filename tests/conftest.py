@@ -0,0 +1,11 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _tmp_output_dir(tmp_path, monkeypatch):
+    """Write generated documents under the test's tmp_path, not the repo's output/."""
+    from src.tools import doc_generator
+
+    monkeypatch.setattr(doc_generator, "OUTPUT_DIR", tmp_path / "output")
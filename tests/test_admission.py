@@ -0,0 +1,114 @@
+"""Tests for /responses admission control."""
+
+import asyncio
+
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.admission import (
+    LOOKUP,
+    PREP,
+    AdmissionController,
+    AdmissionMiddleware,
+    AdmissionRejected,
+    classify_prompt,
+)
+
+
+def test_classify_prompt():
+    assert classify_prompt("What's the latest email from Contoso?") == LOOKUP
+    assert classify_prompt("Show me Fabrikam's contract details") == LOOKUP
+    assert classify_prompt("Help me prepare for my meeting with Coca-Cola") == PREP
+    assert classify_prompt("Make a deck for Northwind") == PREP
+    assert classify_prompt("x " * 200) == PREP
+    assert classify_prompt("") == PREP
+
+
+async def test_queue_full_is_rejected_immediately():
+    ctl = AdmissionController(max_concurrent=1, max_queued=1, lookup_slots=0, max_wait=5, retry_after=7)
+    await ctl.acquire(PREP)
+    queued = asyncio.create_task(ctl.acquire(PREP))
+    await asyncio.sleep(0)
+    assert ctl.queued() == 1
+
+    try:
+        await asyncio.wait_for(ctl.acquire(PREP), 0.5)
+    except AdmissionRejected as e:
+        assert (e.reason, e.retry_after) == ("queue_full", 7)
+    else:
+        raise AssertionError("expected AdmissionRejected")
+
+    ctl.release(PREP)
+    await asyncio.wait_for(queued, 1)
+    assert ctl.active == 1
+
+
+async def test_wait_timeout_is_rejected():
+    ctl = AdmissionController(max_concurrent=1, max_queued=4, lookup_slots=0, max_wait=0.05)
+    await ctl.acquire(PREP)
+    try:
+        await ctl.acquire(PREP)
+    except AdmissionRejected as e:
+        assert e.reason == "wait_timeout"
+    else:
+        raise AssertionError("expected AdmissionRejected")
+    assert ctl.queued() == 0 and ctl.active == 1
+
+
+async def test_lookups_jump_the_queue_and_have_spare_slots():
+    ctl = AdmissionController(max_concurrent=1, max_queued=8, lookup_slots=1, max_wait=5)
+    await ctl.acquire(PREP)
+
+    # A lookup still gets in on its reserved slot while prep is saturated.
+    await asyncio.wait_for(ctl.acquire(LOOKUP), 0.5)
+    assert ctl.active == 2
+
+    order = []
+
+    async def wait(lane):
+        await ctl.acquire(lane)
+        order.append(lane)
+
+    tasks = [asyncio.create_task(wait(PREP)), asyncio.create_task(wait(LOOKUP))]
+    await asyncio.sleep(0)
+    assert ctl.snapshot() == {"active": 2, "queued_lookup": 1, "queued_prep": 1}
+
+    ctl.release(PREP)
+    await asyncio.sleep(0.01)
+    assert order == [LOOKUP]
+    ctl.release(LOOKUP)
+    ctl.release(LOOKUP)
+    await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    assert order == [LOOKUP, PREP]
+
+
+async def test_middleware_returns_429_with_retry_after():
+    gate = asyncio.Event()
+
+    async def responses(request):
+        body = await request.json()
+        await gate.wait()
+        return JSONResponse({"echo": body["input"]})
+
+    ctl = AdmissionController(max_concurrent=1, max_queued=0, lookup_slots=0, max_wait=5, retry_after=3)
+    app = AdmissionMiddleware(
+        Starlette(routes=[Route("/responses", responses, methods=["POST"])]),
+        controller=ctl,
+        lane_of=lambda payload: PREP,
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.post("/responses", json={"input": "prep Contoso"}))
+        while ctl.active == 0:
+            await asyncio.sleep(0.01)
+
+        busy = await client.post("/responses", json={"input": "prep Fabrikam"})
+        assert busy.status_code == 429
+        assert busy.headers["Retry-After"] == "3"
+
+        gate.set()
+        ok = await first
+        assert ok.json() == {"echo": "prep Contoso"}
+    assert ctl.active == 0
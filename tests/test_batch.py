@@ -0,0 +1,109 @@
+"""Tests for multi-customer batch prep (mock mode)."""
+
+import asyncio
+import threading
+import time
+
+from src import batch, workflow
+
+
+async def test_batch_gathers_each_distinct_customer_in_order():
+    reports = await batch.run_batch_prep(
+        ["Contoso", "Fabrikam", "contoso", "  ", "Coca-Cola"], render=False,
+    )
+
+    assert [r.customer_name for r in reports] == ["Contoso", "Fabrikam", "Coca-Cola"]
+    for r in reports:
+        assert r.status == "ok", r
+        assert r.sources == dict.fromkeys(workflow._SOURCES, "completed")
+        assert r.documents == {}
+        assert {"work_iq", "fabric_iq", "foundry_iq", "gather", "total"} <= set(r.timings_ms)
+
+
+async def test_batch_bounds_customer_concurrency(monkeypatch):
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def fabric(customer_name):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return {"customer_name": customer_name}
+
+    monkeypatch.setattr(workflow, "get_fabric_iq_data", fabric)
+    names = ["Contoso", "Fabrikam", "Coca-Cola", "PepsiCo", "Adatum"]
+
+    reports = await batch.run_batch_prep(names, concurrency=2, render=False)
+
+    assert peak[0] == 2
+    by_name = {r.customer_name: r for r in reports}
+    # PepsiCo has no Work IQ or Foundry IQ mock data.
+    assert by_name.pop("PepsiCo").status == "error"
+    assert all(r.status == "ok" for r in by_name.values())
+
+
+async def test_batch_does_not_render_without_usable_data(monkeypatch):
+    rendered = []
+
+    async def fake_package(customer_name, work_iq, fabric_iq, foundry_iq):
+        rendered.append(customer_name)
+        return {"prep_doc": f"{customer_name}.docx", "presentation": f"{customer_name}.pptx"}
+
+    monkeypatch.setattr(batch, "generate_meeting_package", fake_package)
+
+    unknown, known = await batch.run_batch_prep(["Acme Widgets", "Contoso"])
+
+    assert unknown.status == "error"
+    assert unknown.sources == dict.fromkeys(workflow._SOURCES, "error")
+    assert "work_iq, fabric_iq, foundry_iq" in unknown.error
+    assert unknown.documents == {}
+    assert known.status == "ok"
+    assert rendered == ["Contoso"]
+
+
+async def test_batch_renders_packages_and_isolates_failures(monkeypatch):
+    rendering = [0]
+    peak = [0]
+
+    async def fake_package(customer_name, work_iq, fabric_iq, foundry_iq):
+        rendering[0] += 1
+        peak[0] = max(peak[0], rendering[0])
+        await asyncio.sleep(0.01)
+        rendering[0] -= 1
+        if customer_name == "Fabrikam":
+            raise RuntimeError("template missing")
+        return {"prep_doc": f"{customer_name}.docx", "presentation": f"{customer_name}.pptx"}
+
+    monkeypatch.setattr(batch, "generate_meeting_package", fake_package)
+
+    reports = await batch.run_batch_prep(
+        ["Contoso", "Fabrikam", "Coca-Cola"], render_concurrency=1,
+    )
+
+    by_name = {r.customer_name: r for r in reports}
+    assert by_name["Contoso"].status == "ok"
+    assert by_name["Contoso"].documents["presentation"] == "Contoso.pptx"
+    assert "render" in by_name["Contoso"].timings_ms
+    assert by_name["Fabrikam"].status == "error"
+    assert "template missing" in by_name["Fabrikam"].error
+    assert by_name["Coca-Cola"].status == "ok"
+    assert peak[0] == 1
+
+
+async def test_batch_reports_timed_out_sources_as_degraded(monkeypatch):
+    def slow(customer_name):
+        time.sleep(0.5)
+        return {}
+
+    monkeypatch.setattr(workflow, "get_foundry_iq_data", slow)
+    monkeypatch.setitem(workflow.WORKFLOW_SOURCE_TIMEOUTS, "foundry_iq", 0.1)
+
+    (report,) = await batch.run_batch_prep(["Contoso"], render=False)
+
+    assert report.status == "degraded"
+    assert report.timed_out == ["foundry_iq"]
+    assert report.sources["foundry_iq"] == "timed_out"
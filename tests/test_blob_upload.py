@@ -0,0 +1,93 @@
+"""Tests for the long-lived blob upload client, against an in-process stand-in."""
+
+import base64
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+from azure.storage.blob import UserDelegationKey
+
+
+class FakeBlob:
+    def __init__(self, store, container, name):
+        self._store = store
+        self.url = f"https://fakeaccount.blob.core.windows.net/{container}/{name}"
+        self._key = (container, name)
+
+    def upload_blob(self, data, overwrite=False, content_settings=None, **kwargs):
+        self._store[self._key] = data if isinstance(data, bytes) else data.read()
+
+
+class FakeContainer:
+    def __init__(self, service, name):
+        self._service = service
+        self._name = name
+
+    def create_container(self):
+        self._service.create_calls += 1
+
+    def get_blob_client(self, name):
+        return FakeBlob(self._service.blobs, self._name, name)
+
+
+class FakeService:
+    """Minimal Azurite-style stand-in for BlobServiceClient (Entra ID auth)."""
+
+    account_name = "fakeaccount"
+    credential = object()  # token credential — no account key
+
+    def __init__(self):
+        self.blobs = {}
+        self.create_calls = 0
+        self.key_calls = 0
+
+    def get_container_client(self, name):
+        return FakeContainer(self, name)
+
+    def get_user_delegation_key(self, start, expiry):
+        self.key_calls += 1
+        key = UserDelegationKey()
+        key.signed_oid = key.signed_tid = "00000000-0000-0000-0000-000000000000"
+        key.signed_start = start.strftime("%Y-%m-%dT%H:%M:%SZ")
+        key.signed_expiry = expiry.strftime("%Y-%m-%dT%H:%M:%SZ")
+        key.signed_service = "b"
+        key.signed_version = "2021-08-06"
+        key.value = base64.b64encode(b"k" * 32).decode()
+        return key
+
+
+def test_uploader_reuses_container_and_delegation_key():
+    from src.tools.blob_upload import BlobUploader
+
+    service = FakeService()
+    uploader = BlobUploader(container="output", service_client=service)
+
+    urls = [uploader.upload(f"deck_{i}.pptx", b"PK-data") for i in range(3)]
+
+    assert service.create_calls == 1
+    assert service.key_calls == 1
+    assert service.blobs[("output", "deck_0.pptx")] == b"PK-data"
+    query = parse_qs(urlparse(urls[0]).query)
+    assert query["sp"] == ["r"]
+    assert "skoid" in query  # signed with the user delegation key
+
+
+def test_uploader_refreshes_delegation_key_before_expiry():
+    from src.tools import blob_upload
+
+    service = FakeService()
+    uploader = blob_upload.BlobUploader(container="output", service_client=service)
+    uploader.upload("doc.docx", b"PK")
+
+    # Pretend the key is about to expire — less than one SAS lifetime left
+    uploader._delegation_key_expiry -= blob_upload._DELEGATION_KEY_LIFETIME - timedelta(minutes=30)
+    uploader.upload("doc.docx", b"PK")
+    assert service.key_calls == 2
+
+
+def test_uploader_signs_with_account_key_for_connection_string():
+    from src.tools.blob_upload import BlobUploader
+
+    uploader = BlobUploader(connection_string="UseDevelopmentStorage=true")
+    service = uploader._service_client()
+    assert service.account_name == "devstoreaccount1"
+    assert uploader._service_client() is service
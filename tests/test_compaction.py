@@ -0,0 +1,64 @@
+"""Tests for token-budgeted compaction of IQ payloads."""
+
+import json
+
+import pytest
+
+from src.config import MOCK_DATA_DIR
+from src.tools.compaction import compact, compact_tool, estimate_tokens
+
+
+def _mock(source, key="lamna-healthcare"):
+    with open(MOCK_DATA_DIR / f"{source}_data.json") as f:
+        return json.load(f)[key]
+
+
+@pytest.mark.parametrize("source", ["work_iq", "fabric_iq", "foundry_iq"])
+def test_every_source_fits_the_budget(source):
+    data = _mock(source)
+    for budget in (600, 400):
+        assert estimate_tokens(data) > budget
+        assert estimate_tokens(compact(source, data, budget)) <= budget
+
+
+def test_small_payloads_errors_and_sign_in_pass_through():
+    data = _mock("fabric_iq")
+    assert compact("fabric_iq", data, budget=10_000) is data
+    error = {"error": "timed out", "timed_out": True}
+    assert compact("fabric_iq", error, budget=1) is error
+    sign_in = {"auth_required": True, "auth_url": "https://login.example", "recent_emails": [{}] * 50}
+    assert compact("work_iq", sign_in, budget=1) is sign_in
+
+
+def test_open_tickets_rank_before_resolved_by_severity():
+    data = {"support_tickets": [
+        {"id": "old", "severity": "P1", "status": "Resolved", "title": "fixed"},
+        {"id": "p3", "severity": "P3", "status": "Open", "title": "minor"},
+        {"id": "p1", "severity": "P1", "status": "Open", "title": "outage", "description": "x" * 2000},
+    ]}
+    tickets = compact("fabric_iq", data, budget=250)["support_tickets"]
+    assert [t["id"] for t in tickets][:2] == ["p1", "p3"]
+    assert len(tickets[0]["description"]) <= 400
+
+
+def test_sales_plays_ranked_by_relevance_with_deduplicated_talking_points():
+    point = "Copilot saves 10 hours a month per seller"
+    data = {"sales_plays": [
+        {"play_name": "low", "relevance_score": 0.2, "key_talking_points": [point]},
+        {"play_name": "high", "relevance_score": 0.9, "key_talking_points": [point, "Fabric unifies data"],
+         "resources": [{"title": "Deck", "url": "https://example.com/" + "x" * 3000}]},
+        {"play_name": "mid", "relevance_score": 0.5, "key_talking_points": [point.upper() + "!"]},
+    ]}
+    plays = compact("foundry_iq", data, budget=150)["sales_plays"]
+    assert [p["play_name"] for p in plays][0] == "high"
+    assert plays[0]["resources"] == ["Deck"]
+    all_points = [p for play in plays for p in play["key_talking_points"]]
+    assert all_points.count(point) == 1 and len(all_points) == 2
+
+
+def test_compact_tool_keeps_the_tool_signature():
+    from src.tools import get_foundry_iq_data
+
+    tool = compact_tool("foundry_iq", get_foundry_iq_data)
+    assert tool.__name__ == "get_foundry_iq_data"
+    assert estimate_tokens(tool("Lamna Healthcare")) <= estimate_tokens(get_foundry_iq_data("Lamna Healthcare"))
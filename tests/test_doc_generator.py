@@ -184,3 +184,153 @@ def test_generate_prep_doc_accepts_json_strings(coca_cola_data):
     )
     assert path.endswith(".docx")
     assert os.path.exists(path)
+
+
+def test_template_cache_reuses_and_invalidates(tmp_path):
+    """The stripped template is cached and only rebuilt when the source changes."""
+    import shutil
+    import zipfile
+
+    from src.config import PPTX_TEMPLATE
+    from src.tools.doc_generator import _load_template, _template_bytes
+
+    template = tmp_path / "template.potx"
+    shutil.copy(PPTX_TEMPLATE, template)
+
+    first = _template_bytes(template)
+    assert _template_bytes(template) is first
+
+    # Touching the file without changing content keeps the cached bytes
+    os.utime(template, ns=(0, 0))
+    assert _template_bytes(template) is first
+
+    # Changing content triggers a re-strip
+    with zipfile.ZipFile(template, "a") as z:
+        z.writestr("docProps/extra.xml", "<extra/>")
+    second = _template_bytes(template)
+    assert second is not first
+    assert len(_load_template(template).slides) == 0
+
+
+def test_template_artifact_persisted_and_reused(tmp_path, monkeypatch):
+    """A cold cache reads the hash-named artifact instead of re-stripping."""
+    import shutil
+
+    from src.config import PPTX_TEMPLATE
+    from src.tools import doc_generator
+
+    template = tmp_path / "template.potx"
+    shutil.copy(PPTX_TEMPLATE, template)
+
+    artifact = doc_generator.build_template_artifact(template)
+    assert artifact.parent == tmp_path
+    assert artifact.suffix == ".pptx"
+
+    doc_generator._template_cache.update(path=None, stat=None, sha256=None, data=None)
+    monkeypatch.setattr(
+        doc_generator, "_strip_template",
+        lambda raw: pytest.fail("template was re-stripped"),
+    )
+    assert doc_generator._template_bytes(template) == artifact.read_bytes()
+
+
+def test_presentation_prunes_unused_template_parts(coca_cola_data):
+    """Only the layouts and masters the deck uses are kept in the output."""
+    import zipfile
+
+    from src.tools.doc_generator import generate_presentation
+    from pptx import Presentation
+
+    work_iq, fabric_iq, foundry_iq = coca_cola_data
+    path = generate_presentation("Coca-Cola", work_iq, fabric_iq, foundry_iq)
+    prs = Presentation(path)
+
+    assert len(prs.slide_masters) == 1
+    assert len(prs.slide_masters[0].slide_layouts) == 4
+    with zipfile.ZipFile(path) as z:
+        layouts = [n for n in z.namelist() if n.startswith("ppt/slideLayouts/slideLayout")]
+    assert len(layouts) == 4
+    assert os.path.getsize(path) < 2_000_000
+
+
+def test_identical_inputs_reuse_cached_output(coca_cola_data, monkeypatch):
+    """A repeat call with the same data returns the existing file without rendering."""
+    from src.tools import doc_generator
+
+    work_iq, fabric_iq, foundry_iq = coca_cola_data
+    first = doc_generator.generate_presentation("Coca-Cola", work_iq, fabric_iq, foundry_iq)
+
+    build = doc_generator._BUILDERS["presentation"]
+    monkeypatch.setitem(
+        doc_generator._BUILDERS, "presentation",
+        lambda *a: pytest.fail("presentation was re-rendered"),
+    )
+    assert doc_generator.generate_presentation("Coca-Cola", work_iq, fabric_iq, foundry_iq) == first
+    # Another name for the same account is the same document.
+    assert doc_generator.generate_presentation("KO", work_iq, fabric_iq, foundry_iq) == first
+
+    # Different data → different file
+    monkeypatch.setitem(doc_generator._BUILDERS, "presentation", build)
+    changed = dict(fabric_iq, contract={})
+    assert doc_generator.generate_presentation("Coca-Cola", work_iq, changed, foundry_iq) != first
+
+
+def test_output_cache_evicts_least_recently_used(tmp_path):
+    from src.tools import output_cache
+
+    paths = []
+    for i in range(4):
+        p = tmp_path / f"doc_{i}.docx"
+        p.write_bytes(b"x" * 100)
+        os.utime(p, (1000 + i, 1000 + i))
+        paths.append(p)
+    # Touching the oldest file makes it most recently used
+    assert output_cache.touch(paths[0])
+
+    removed = output_cache.evict(tmp_path, keep=paths[3], max_bytes=10_000, max_files=2)
+    assert removed == [paths[1], paths[2]]
+    assert paths[0].exists() and paths[3].exists()
+
+
+async def test_generate_meeting_package(coca_cola_data):
+    """One call produces both documents from a single copy of the IQ data."""
+    from src.tools.doc_generator import generate_meeting_package
+
+    work_iq, fabric_iq, foundry_iq = coca_cola_data
+    result = await generate_meeting_package(
+        "Coca-Cola", json.dumps(work_iq), fabric_iq, foundry_iq,
+    )
+
+    assert set(result) == {"prep_doc", "presentation"}
+    assert result["prep_doc"].endswith(".docx")
+    assert result["presentation"].endswith(".pptx")
+    assert os.path.exists(result["prep_doc"])
+    assert os.path.exists(result["presentation"])
+
+
+def test_blob_mode_uploads_from_memory_without_local_file(coca_cola_data, monkeypatch):
+    """With blob storage configured, docs go from memory to the upload, not to disk."""
+    from src.tools import doc_generator
+
+    uploads = {}
+
+    def fake_upload(local_path, data=None):
+        uploads[local_path.name] = data
+        return f"https://blob.example/{local_path.name}?sas"
+
+    monkeypatch.setattr(doc_generator.blob_upload, "enabled", lambda: True)
+    monkeypatch.setattr(doc_generator, "SAVE_LOCAL_OUTPUT", False)
+    monkeypatch.setattr(doc_generator, "_upload_and_get_url", fake_upload)
+
+    work_iq, fabric_iq, foundry_iq = coca_cola_data
+    work_iq = dict(work_iq, relationship_summary="In-memory upload test")
+    url = doc_generator.generate_prep_doc("Coca-Cola", work_iq, fabric_iq, foundry_iq)
+
+    name = url.removeprefix("https://blob.example/").removesuffix("?sas")
+    assert uploads[name][:2] == b"PK"  # a real .docx (ZIP) payload
+    assert not (doc_generator.OUTPUT_DIR / name).exists()
+
+    # A repeat call reuses the issued URL without rendering or uploading again
+    uploads.clear()
+    assert doc_generator.generate_prep_doc("Coca-Cola", work_iq, fabric_iq, foundry_iq) == url
+    assert uploads == {}
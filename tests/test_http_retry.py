@@ -0,0 +1,140 @@
+"""Tests for the shared HTTP retry / throttling layer."""
+
+import httpx
+import pytest
+
+from src.tools import http_retry, iq_cache, work_iq
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state():
+    http_retry.reset()
+    iq_cache.get_cache().clear()
+    yield
+    http_retry.reset()
+    iq_cache.get_cache().clear()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record sleeps instead of waiting (both the sync and async wrappers)."""
+    delays: list[float] = []
+
+    async def fake_async_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(http_retry.asyncio, "sleep", fake_async_sleep)
+    monkeypatch.setattr(http_retry.time, "sleep", delays.append)
+    return delays
+
+
+def _sequence(*responses):
+    """Handler that replays ``responses`` (status, headers) in order."""
+    calls = iter(responses)
+
+    def handler(request):
+        status, headers = next(calls)
+        return httpx.Response(status, headers=headers, json={"value": []})
+
+    return handler
+
+
+async def test_retries_throttled_request_after_retry_after(sleeps):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(
+        _sequence((429, {"Retry-After": "3"}), (503, {}), (200, {})),
+    ))
+    resp = await http_retry.request(client, "GET", "https://graph.example/v1.0/me")
+
+    assert resp.status_code == 200
+    assert sleeps[0] == 3.0
+    counters = http_retry.metrics()["graph.example"]
+    assert counters["requests"] == 3
+    assert counters["throttled"] == 2
+    assert counters["retries"] == 2
+    # Retry-After (3s) plus a jittered backoff of at most 1s for the bare 503.
+    assert 3.0 <= counters["retry_wait_seconds"] <= 4.0
+    # The Retry-After also paused the host bucket for other callers.
+    assert counters["rate_limit_wait_seconds"] > 0
+
+
+def test_gives_up_with_upstream_throttled(sleeps, monkeypatch):
+    monkeypatch.setattr(http_retry, "HTTP_RETRY_MAX_ATTEMPTS", 2)
+    client = httpx.Client(transport=httpx.MockTransport(
+        _sequence((429, {"Retry-After": "1"}), (429, {"Retry-After": "7"})),
+    ))
+    with pytest.raises(http_retry.UpstreamThrottled) as exc:
+        http_retry.request_sync(client, "GET", "https://graph.example/v1.0/me")
+
+    assert exc.value.retry_after == 7.0
+    assert http_retry.metrics()["graph.example"]["gave_up"] == 1
+
+
+def test_retries_and_throttles_are_exported_as_otel_metrics(sleeps, monkeypatch):
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+    reader = InMemoryMetricReader()
+    counters, histograms = http_retry._make_instruments(MeterProvider(metric_readers=[reader]).get_meter("test"))
+    monkeypatch.setattr(http_retry, "_counters", counters)
+    monkeypatch.setattr(http_retry, "_histograms", histograms)
+    monkeypatch.setattr(http_retry, "HTTP_RETRY_MAX_ATTEMPTS", 2)
+    client = httpx.Client(transport=httpx.MockTransport(
+        _sequence((429, {"Retry-After": "2"}), (429, {})),
+    ))
+    with pytest.raises(http_retry.UpstreamThrottled):
+        http_retry.request_sync(client, "GET", "https://search.example/x")
+
+    points = {
+        m.name: m.data.data_points[0]
+        for rm in reader.get_metrics_data().resource_metrics
+        for sm in rm.scope_metrics
+        for m in sm.metrics
+    }
+    assert points["sales_agent.http.requests"].value == 2
+    assert points["sales_agent.http.throttled"].value == 2
+    assert points["sales_agent.http.retries"].value == 1
+    assert points["sales_agent.http.gave_up"].value == 1
+    assert points["sales_agent.http.retry_wait"].sum == 2.0
+    assert dict(points["sales_agent.http.retries"].attributes) == {"host": "search.example"}
+
+
+def test_deadline_stops_retries_before_a_long_retry_after(sleeps):
+    client = httpx.Client(transport=httpx.MockTransport(_sequence((503, {"Retry-After": "120"}))))
+    with pytest.raises(http_retry.UpstreamThrottled):
+        http_retry.request_sync(client, "GET", "https://search.example/x", deadline=10)
+    assert sleeps == []
+
+
+def test_token_bucket_spaces_out_bursts():
+    bucket = http_retry.TokenBucket(rate=10, burst=2)
+    waits = [bucket.reserve() for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.02)
+    assert waits[3] == pytest.approx(0.2, abs=0.02)
+
+    bucket.block(5)
+    assert bucket.reserve() >= 4.9
+
+
+def test_retry_after_accepts_http_dates():
+    assert http_retry.retry_after_seconds({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert http_retry.retry_after_seconds({"Retry-After": "2.5"}) == 2.5
+    assert http_retry.retry_after_seconds({}) is None
+
+
+def test_work_iq_reports_throttling_instead_of_empty_data(sleeps, monkeypatch):
+    monkeypatch.setattr(http_retry, "HTTP_RETRY_MAX_ATTEMPTS", 1)
+    client = httpx.Client(transport=httpx.MockTransport(
+        lambda request: httpx.Response(429, headers={"Retry-After": "30"}),
+    ))
+    monkeypatch.setattr(work_iq.http_pool, "get_client", lambda: client)
+    monkeypatch.setattr(work_iq, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(work_iq, "GRAPH_USER_ID", "user-1")
+    monkeypatch.setattr(work_iq, "_graph_headers", lambda: {})
+    monkeypatch.setattr(work_iq, "_delegated_graph_headers", lambda: {})
+
+    result = work_iq.get_work_iq_data("Contoso")
+
+    assert result["throttled"] is True
+    assert result["retry_after_seconds"] == 30.0
+    assert "recent_emails" not in result
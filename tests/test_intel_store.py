@@ -0,0 +1,102 @@
+"""Tests for server-side intel handles and the document-tool guardrail."""
+
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from agent_framework import MiddlewareTermination
+
+from src import progress
+from src.config import IQ_PROMPT_TOKEN_BUDGET, MOCK_DATA_DIR
+from src.middleware import DocGenerationGuardrail
+from src.tools import compaction, intel_store
+from src.tools.doc_generator import async_doc_tool, generate_prep_doc
+
+
+@pytest.fixture
+def intel():
+    data = {}
+    for source in ("work_iq", "fabric_iq", "foundry_iq"):
+        with open(MOCK_DATA_DIR / f"{source}_data.json") as f:
+            data[source] = json.load(f)["contoso"]
+    return data
+
+
+@pytest.fixture
+def store(monkeypatch):
+    fresh = intel_store.IntelStore(ttl=60, max_entries=2)
+    monkeypatch.setattr(intel_store, "_store", fresh)
+    return fresh
+
+
+async def _guard(tool_name, **arguments):
+    called = []
+    context = SimpleNamespace(function=SimpleNamespace(name=tool_name), arguments=arguments)
+
+    async def call_next():
+        called.append(True)
+
+    await DocGenerationGuardrail().process(context, call_next)
+    return bool(called)
+
+
+def test_handles_are_scoped_to_their_session(store, intel):
+    with progress.bind("s1"):
+        record = store.put("Contoso", intel)
+        assert store.get(record.intel_id).fabric_iq == intel["fabric_iq"]
+    with progress.bind("s2"), pytest.raises(intel_store.IntelNotFound):
+        store.get(record.intel_id)
+
+
+def test_handles_expire_and_are_bounded(store, intel):
+    first = store.put("Contoso", intel)
+    store.put("Fabrikam", intel)
+    store.put("Adatum", intel)
+    with pytest.raises(intel_store.IntelNotFound):
+        store.get(first.intel_id)
+
+    store.ttl = 0
+    expired = store.put("Contoso", intel)
+    time.sleep(0.01)
+    with pytest.raises(intel_store.IntelNotFound):
+        store.get(expired.intel_id)
+
+
+def test_tool_result_is_compact_and_surfaces_sign_in(store, intel):
+    record = store.put("Contoso", intel)
+    result = intel_store.tool_result(record)
+    for source, data in intel.items():
+        assert compaction.estimate_tokens(result["summary"][source]) <= IQ_PROMPT_TOKEN_BUDGET
+    assert result["summary"]["fabric_iq"]["contract"]["renewal_date"]
+
+    intel["work_iq"] = {"auth_required": True, "auth_url": "https://login.example", "message": "sign in"}
+    result = intel_store.tool_result(store.put("Contoso", intel))
+    assert result["auth_required"] is True and result["auth_url"] == "https://login.example"
+
+
+def test_prep_doc_renders_from_a_handle(store, intel):
+    record = store.put("Contoso", intel)
+    assert generate_prep_doc("Contoso", intel_id=record.intel_id).endswith(".docx")
+    with pytest.raises(ValueError):
+        generate_prep_doc("Contoso")
+
+
+async def test_async_doc_tool_resolves_the_handle_before_rendering(store, intel):
+    tool = async_doc_tool(generate_prep_doc)
+    assert tool.__name__ == "generate_prep_doc"
+    record = store.put("Contoso", intel)
+    assert (await tool("Contoso", intel_id=record.intel_id)).endswith(".docx")
+
+
+async def test_guardrail_checks_handles_server_side(store, intel):
+    complete = store.put("Contoso", intel)
+    assert await _guard("generate_presentation", customer_name="Contoso", intel_id=complete.intel_id)
+
+    with pytest.raises(MiddlewareTermination, match="unknown or has expired"):
+        await _guard("generate_presentation", customer_name="Contoso", intel_id="intel_bogus")
+
+    intel["foundry_iq"] = {"error": "foundry_iq did not respond within 10.0s", "timed_out": True}
+    partial = store.put("Contoso", intel)
+    with pytest.raises(MiddlewareTermination, match="foundry_iq"):
+        await _guard("generate_meeting_package", customer_name="Contoso", intel_id=partial.intel_id)
@@ -0,0 +1,152 @@
+"""Tests for the per-customer IQ result cache."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.tools import iq_cache
+
+
+def _cache(backend=None, **kwargs):
+    return iq_cache.IQCache(
+        backend or iq_cache.MemoryBackend(),
+        {"work_iq": 60, "foundry_iq": 60},
+        stale_seconds=kwargs.pop("stale_seconds", 60),
+        negative_ttl=kwargs.pop("negative_ttl", 30),
+    )
+
+
+def _age(cache, tool, name, principal, *, fresh_for=-1.0, stale_for=60.0):
+    """Rewrite an entry's deadlines relative to now (simulates time passing)."""
+    key = cache.key(tool, name, principal)
+    value, _, _ = cache.backend.get(key)
+    now = time.time()
+    cache.backend.set(key, (value, now + fresh_for, now + stale_for))
+
+
+class Counter:
+    def __init__(self, value=None):
+        self.calls = 0
+        self.value = value
+
+    def __call__(self):
+        self.calls += 1
+        return dict(self.value or {"n": self.calls})
+
+
+def test_fresh_hits_share_canonical_customer_key():
+    cache, fetch = _cache(), Counter()
+    assert cache.get_or_fetch("work_iq", "Coca-Cola", "u1", fetch) == {"n": 1}
+    assert cache.get_or_fetch("work_iq", "The Coca-Cola Company", "u1", fetch) == {"n": 1}
+    assert fetch.calls == 1
+
+    # Another principal (mailbox) never sees the first one's data.
+    assert cache.get_or_fetch("work_iq", "Coca-Cola", "u2", fetch) == {"n": 2}
+
+
+def test_hits_are_copies():
+    cache = _cache()
+    cache.get_or_fetch("work_iq", "Contoso", "u1", Counter({"emails": []}))
+    cache.lookup("work_iq", "Contoso", "u1")[0]["emails"].append("mutated")
+    assert cache.lookup("work_iq", "Contoso", "u1")[0] == {"emails": []}
+
+
+def test_stale_entry_is_served_while_refreshing_in_background():
+    cache, fetch = _cache(), Counter()
+    cache.get_or_fetch("work_iq", "Contoso", "u1", fetch)
+    _age(cache, "work_iq", "Contoso", "u1")
+
+    assert cache.get_or_fetch("work_iq", "Contoso", "u1", fetch) == {"n": 1}
+    cache._refresh_pool.shutdown(wait=True)  # drain the background refresh
+    assert fetch.calls == 2
+    assert cache.lookup("work_iq", "Contoso", "u1") == ({"n": 2}, True)
+
+
+def test_expired_entry_is_refetched_inline():
+    cache, fetch = _cache(), Counter()
+    cache.get_or_fetch("work_iq", "Contoso", "u1", fetch)
+    _age(cache, "work_iq", "Contoso", "u1", stale_for=-1)
+    assert cache.get_or_fetch("work_iq", "Contoso", "u1", fetch) == {"n": 2}
+
+
+def test_not_found_is_negative_cached_but_throttling_is_not():
+    cache = _cache()
+    missing = Counter({"error": "No data found"})
+    cache.get_or_fetch("foundry_iq", "Nobody Inc", "app", missing)
+    cache.get_or_fetch("foundry_iq", "Nobody Inc", "app", missing)
+    assert missing.calls == 1
+    _, fresh_until, stale_until = cache.backend.get(cache.key("foundry_iq", "Nobody Inc", "app"))
+    assert fresh_until == stale_until <= time.time() + 30  # no stale window
+
+    throttled = Counter({"error": "busy", "throttled": True})
+    cache.get_or_fetch("foundry_iq", "Contoso", "app", throttled)
+    cache.get_or_fetch("foundry_iq", "Contoso", "app", throttled)
+    assert throttled.calls == 2
+
+
+def test_zero_ttl_disables_a_source():
+    cache, fetch = _cache(), Counter()
+    cache.get_or_fetch("fabric_iq", "Contoso", "app", fetch)
+    cache.get_or_fetch("fabric_iq", "Contoso", "app", fetch)
+    assert fetch.calls == 2
+
+
+async def test_aget_many_fetches_misses_together_and_refreshes_stale():
+    cache = _cache()
+    batches: list[list[str]] = []
+
+    async def fetch_many(names):
+        batches.append(list(names))
+        return {n: {"name": n, "round": len(batches)} for n in names}
+
+    await cache.aget_many("work_iq", ["Contoso", "Fabrikam"], "u1", fetch_many)
+    _age(cache, "work_iq", "Contoso", "u1")
+
+    result = await cache.aget_many("work_iq", ["Contoso", "Fabrikam", "Northwind"], "u1", fetch_many)
+    assert result["Contoso"]["round"] == 1  # stale value served immediately
+    assert result["Northwind"]["round"] in (2, 3)
+    await asyncio.gather(*cache._tasks)
+
+    assert sorted(map(sorted, batches)) == [["Contoso"], ["Contoso", "Fabrikam"], ["Northwind"]]
+    assert cache.lookup("work_iq", "Contoso", "u1")[1] is True
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    path = tmp_path / "iq.sqlite3"
+    first = _cache(iq_cache.SQLiteBackend(path))
+    first.get_or_fetch("work_iq", "Contoso", "u1", Counter({"tier": "gold"}))
+
+    second = _cache(iq_cache.SQLiteBackend(path))
+    assert second.get_or_fetch("work_iq", "Contoso Ltd", "u1", Counter({"tier": "other"})) == {"tier": "gold"}
+
+
+def test_sqlite_backend_prunes_oldest_entries(tmp_path):
+    backend = iq_cache.SQLiteBackend(tmp_path / "iq.sqlite3", max_entries=10)
+    for i in range(iq_cache.SQLiteBackend._PRUNE_EVERY):
+        backend.set(f"k{i}", ({"i": i}, 0.0, 0.0))
+    count = backend._conn().execute("SELECT COUNT(*) FROM iq_cache").fetchone()[0]
+    assert count == 10
+    assert backend.get(f"k{iq_cache.SQLiteBackend._PRUNE_EVERY - 1}") is not None
+
+
+@pytest.fixture
+def live_foundry(monkeypatch):
+    from src.tools import foundry_iq
+
+    monkeypatch.setattr(foundry_iq, "USE_MOCK_DATA", False)
+    iq_cache.get_cache().clear()
+    yield foundry_iq
+    iq_cache.get_cache().clear()
+
+
+def test_tool_decorator_caches_live_results_only(live_foundry, monkeypatch):
+    calls = []
+    monkeypatch.setattr(live_foundry, "_query_search", lambda name: calls.append(name) or {"sales_plays": [1]})
+
+    live_foundry.get_foundry_iq_data("Contoso")
+    live_foundry.get_foundry_iq_data("contoso")
+    assert calls == ["Contoso"]
+
+    monkeypatch.setattr(live_foundry, "USE_MOCK_DATA", True)
+    assert live_foundry.get_foundry_iq_data("Contoso")["sales_plays"] != [1]
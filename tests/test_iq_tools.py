@@ -0,0 +1,87 @@
+"""Tests for the IQ lookup tools (mock mode)."""
+
+import json
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _mock_mode():
+    os.environ["USE_MOCK_DATA"] = "true"
+
+
+def test_iq_tools_return_customer_records():
+    from src.tools import get_fabric_iq_data, get_foundry_iq_data, get_work_iq_data
+
+    assert get_work_iq_data("Coca-Cola")["primary_contact"]
+    assert "financial_summary" in get_fabric_iq_data("The Coca-Cola Company")
+    assert get_foundry_iq_data("coca cola")["sales_plays"]
+    assert "error" in get_work_iq_data("Unknown Corp")
+
+
+def test_mock_lookups_do_no_file_io_after_first_load(monkeypatch):
+    from src.tools import get_work_iq_data, mock_store
+
+    get_work_iq_data("Contoso")
+    monkeypatch.setattr(mock_store.json, "load", lambda f: pytest.fail("mock file re-read"))
+    assert get_work_iq_data("Contoso")["customer_name"]
+    assert get_work_iq_data("Contoso Ltd")["customer_name"]
+
+
+def test_mock_store_returns_copies_and_reloads_on_change(tmp_path):
+    from src.tools import mock_store
+
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"contoso": {"tier": "gold"}}))
+
+    record = mock_store.lookup(path, "Contoso")
+    record["tier"] = "mutated"
+    assert mock_store.lookup(path, "Contoso") == {"tier": "gold"}
+
+    path.write_text(json.dumps({"contoso": {"tier": "platinum"}}))
+    os.utime(path, ns=(0, 0))
+    assert mock_store.lookup(path, "Contoso") == {"tier": "platinum"}
+
+
+@pytest.mark.parametrize("name", [
+    "Coca Cola", "The Coca-Cola Company", "KO", "coca-cola", "Cocacola", "Coca-Cola Q3 review",
+])
+def test_customer_resolver_variants_resolve_to_one_key(name):
+    from src.tools.customer_resolver import default_resolver
+
+    assert default_resolver().resolve(name) == "coca-cola"
+
+
+def test_customer_resolver_ranks_and_rejects():
+    from src.tools.customer_resolver import CustomerResolver
+
+    resolver = CustomerResolver(["northwind-traders", "woodgrove-bank", "contoso"])
+    assert resolver.resolve("Northwind") == "northwind-traders"
+    assert resolver.resolve("Contosso Ltd.") == "contoso"
+    assert resolver.resolve("Acme Corp") is None
+
+
+@pytest.mark.parametrize("name", [
+    "Bank of America", "Alpine Airlines", "A", "Healthcare Partners", "Ski Resort", "Tailwind Bank",
+    "Healthcare",
+])
+def test_customer_resolver_rejects_names_sharing_one_common_word(name):
+    from src.tools.customer_resolver import default_resolver
+
+    assert default_resolver().resolve(name) is None
+
+
+def test_unknown_customers_sharing_a_word_are_not_found():
+    from src.tools import get_fabric_iq_data
+    from src.tools.customer_resolver import canonical_key
+
+    assert "error" in get_fabric_iq_data("Bank of America")
+    assert canonical_key("Alpine Airlines") == "alpine-airlines"
+
+
+def test_iq_tools_resolve_aliases():
+    from src.tools import get_fabric_iq_data, get_work_iq_data
+
+    assert get_work_iq_data("KO") == get_work_iq_data("Coca-Cola")
+    assert "error" not in get_fabric_iq_data("Woodgrove Financial")
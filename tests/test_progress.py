@@ -0,0 +1,46 @@
+"""Tests for routing tool progress events to a request's stream."""
+
+import asyncio
+
+from src import progress
+
+
+async def test_publish_without_a_listener_is_a_no_op():
+    assert progress.publish({"source": "work_iq"}) is False
+    with progress.bind("unknown-session"):
+        assert progress.publish({"source": "work_iq"}) is False
+
+
+async def test_events_reach_only_the_linked_channel():
+    first, second = object(), object()
+    a = progress.open_channel(first)
+    b = progress.open_channel(second)
+    progress.link(first, "s1")
+    progress.link(second, "s2")
+    try:
+        with progress.bind("s2"):
+            assert progress.publish({"n": 1})
+        assert await asyncio.wait_for(b.get(), 1) == {"n": 1}
+        assert a._queue.empty()
+    finally:
+        progress.close_channel(first)
+        progress.close_channel(second)
+
+    with progress.bind("s2"):
+        assert progress.publish({"n": 2}) is False
+
+
+async def test_publish_from_a_worker_thread():
+    owner = object()
+    channel = progress.open_channel(owner)
+    progress.link(owner, "s1")
+
+    def work():
+        with progress.bind("s1"):
+            progress.publish({"from": "thread"})
+
+    try:
+        await asyncio.to_thread(work)
+        assert await asyncio.wait_for(channel.get(), 1) == {"from": "thread"}
+    finally:
+        progress.close_channel(owner)
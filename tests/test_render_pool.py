@@ -0,0 +1,63 @@
+"""Tests for the document render pool."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from src.config import MOCK_DATA_DIR
+
+
+@pytest.fixture
+def coca_cola_data():
+    data = []
+    for name in ("work_iq_data.json", "fabric_iq_data.json", "foundry_iq_data.json"):
+        with open(MOCK_DATA_DIR / name) as f:
+            data.append(json.load(f)["coca-cola"])
+    return data
+
+
+async def test_run_uses_worker_process(monkeypatch):
+    from src.tools import render_pool
+
+    monkeypatch.setattr(render_pool, "RENDER_POOL_SIZE", 1)
+    try:
+        render_pool.start()
+        assert await render_pool.run(os.getpid) != os.getpid()
+    finally:
+        render_pool.shutdown()
+
+
+async def test_async_doc_tool_renders_in_process_pool(coca_cola_data, monkeypatch):
+    from src import progress
+    from src.tools import intel_store, render_pool
+    from src.tools.doc_generator import async_doc_tool, generate_prep_doc
+
+    monkeypatch.setattr(render_pool, "RENDER_POOL_SIZE", 1)
+    monkeypatch.setattr(intel_store, "_store", intel_store.IntelStore())
+    tool = async_doc_tool(generate_prep_doc)
+    assert tool.__name__ == "generate_prep_doc"
+    work_iq, fabric_iq, foundry_iq = coca_cola_data
+    with progress.bind("s1"):
+        record = intel_store.get_store().put(
+            "Coca-Cola", {"work_iq": work_iq, "fabric_iq": fabric_iq, "foundry_iq": foundry_iq},
+        )
+        try:
+            render_pool.start()
+            # The handle resolves here; the worker process only renders.
+            path = await tool("Coca-Cola", intel_id=record.intel_id)
+        finally:
+            render_pool.shutdown()
+
+    assert path.endswith(".docx")
+    assert os.path.exists(path)
+
+
+async def test_render_pool_rejects_when_queue_full(monkeypatch):
+    from src.tools import render_pool
+
+    monkeypatch.setattr(render_pool, "_slots", threading.BoundedSemaphore(1))
+    render_pool._slots.acquire()
+    with pytest.raises(render_pool.RenderPoolBusy):
+        await render_pool.run(os.getpid)
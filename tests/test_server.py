@@ -0,0 +1,154 @@
+"""Tests for the /responses streaming adapter."""
+
+import asyncio
+import itertools
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from src import progress, server, workflow
+from src.config import MOCK_DATA_DIR
+from src.tools import compaction, mock_store
+
+
+class _StubOrchestrator:
+    """Streams the prompt back word by word, yielding to other streams in between."""
+
+    def run(self, prompt, stream=False, session=None):
+        async def updates():
+            for word in prompt.split():
+                await asyncio.sleep(random.uniform(0, 0.005))
+                yield SimpleNamespace(text=word + " ")
+
+        return updates()
+
+
+_ids = itertools.count()
+
+
+def _context(prompt: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        raw_payload={"input": prompt},
+        stream=True,
+        response_id=f"resp_{next(_ids)}",
+        conversation_id=None,
+        id_generator=SimpleNamespace(generate_message_id=lambda: f"msg_{next(_ids)}"),
+    )
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(server.app, "_orchestrator", _StubOrchestrator())
+    monkeypatch.setattr(server.app, "_ready", True)
+    return server.app
+
+
+async def test_concurrent_streams_keep_their_own_sequence_and_text(app):
+    prompts = [" ".join(f"s{i}w{j}" for j in range(10)) for i in range(40)]
+
+    async def collect(prompt):
+        return [event async for event in await app.agent_run(_context(prompt))]
+
+    streams = await asyncio.gather(*(collect(p) for p in prompts))
+
+    for prompt, events in zip(prompts, streams):
+        assert [e.sequence_number for e in events] == list(range(len(events)))
+        assert events[0].type == "response.created"
+        assert events[-1].type == "response.completed"
+        deltas = "".join(e.delta for e in events if e.type == "response.output_text.delta")
+        done = next(e for e in events if e.type == "response.output_text.done")
+        assert deltas == done.text == prompt + " "
+        item_ids = {e.item_id for e in events if hasattr(e, "item_id") and e.item_id}
+        assert len(item_ids) == 1
+
+
+class _SlowStartOrchestrator(_StubOrchestrator):
+    def __init__(self):
+        self.starts = 0
+        self.release = asyncio.Event()
+
+    async def start(self):
+        self.starts += 1
+        await self.release.wait()
+
+
+async def test_readiness_waits_for_warm_up():
+    app = server.SalesAgentServer()
+    app._orchestrator = orchestrator = _SlowStartOrchestrator()
+
+    not_ready = await app.agent_readiness(None)
+    assert not_ready.status_code == 503
+
+    # Early requests wait for the same warm-up instead of starting their own.
+    early = [asyncio.create_task(app.agent_run(_context("hello"))) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    assert not any(t.done() for t in early)
+
+    orchestrator.release.set()
+    await asyncio.wait_for(app._warmup, 10)
+    for stream in await asyncio.gather(*early):
+        assert [e async for e in stream][-1].type == "response.completed"
+
+    assert orchestrator.starts == 1
+    ready = await app.agent_readiness(None)
+    assert ready["status"] == "ready"
+    assert {"orchestrator", "renderers", "mock_data", "http_pools", "total"} <= set(ready["warmup_ms"])
+
+
+class _ProgressOrchestrator(_StubOrchestrator):
+    """Publishes one workflow progress event, as a tool would, before answering."""
+
+    def run(self, prompt, stream=False, session=None):
+        async def updates():
+            progress.link(session, "copilot-session")
+            with progress.bind("copilot-session"):
+                workflow._publish_source({
+                    "type": "source", "customer_name": "Contoso", "source": "fabric_iq",
+                    "status": "completed", "elapsed_ms": 12.5, "data": fabric,
+                })
+            await asyncio.sleep(0.01)
+            yield SimpleNamespace(text="done")
+
+        fabric = mock_store.lookup(MOCK_DATA_DIR / "fabric_iq_data.json", "Contoso")
+        return updates()
+
+
+async def test_progress_events_carry_a_compact_summary(app, monkeypatch):
+    monkeypatch.setattr(app, "_orchestrator", _ProgressOrchestrator())
+
+    events = [e async for e in await app.agent_run(_context("prep Contoso"))]
+
+    (event,) = [e for e in events if e.type == "response.workflow_progress"]
+    body = event.as_dict()
+    assert body["source"] == "fabric_iq" and body["status"] == "completed"
+    assert "data" not in body
+    fabric = mock_store.lookup(MOCK_DATA_DIR / "fabric_iq_data.json", "Contoso")
+    assert body["summary"] == compaction.compact("fabric_iq", fabric)
+    assert [e.sequence_number for e in events] == list(range(len(events)))
+
+
+class _LateProgressOrchestrator(_StubOrchestrator):
+    """Publishes a burst of progress right as the agent's stream ends."""
+
+    def run(self, prompt, stream=False, session=None):
+        async def updates():
+            progress.link(session, "copilot-session")
+            yield SimpleNamespace(text="done")
+            with progress.bind("copilot-session"):
+                for source in workflow._SOURCES:
+                    progress.publish({"source": source, "status": "completed"})
+
+        return updates()
+
+
+async def test_progress_queued_when_the_agent_finishes_is_still_sent(app, monkeypatch):
+    monkeypatch.setattr(app, "_orchestrator", _LateProgressOrchestrator())
+
+    events = [e async for e in await app.agent_run(_context("prep Contoso"))]
+
+    types = [e.type for e in events]
+    assert types.count("response.workflow_progress") == len(workflow._SOURCES)
+    assert types.index("response.output_text.done") > max(
+        i for i, t in enumerate(types) if t == "response.workflow_progress")
+    assert [e.sequence_number for e in events] == list(range(len(events)))
@@ -0,0 +1,133 @@
+"""Tests for single-flight coalescing of concurrent IQ fetches."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.tools.single_flight import SingleFlight
+
+
+def test_concurrent_threads_share_one_call():
+    flight, release = SingleFlight(), threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(timeout=2)
+        return {"emails": []}
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        futures = [pool.submit(flight.do, "k", fetch) for _ in range(6)]
+        while flight.coalesced < 5:
+            threading.Event().wait(0.005)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(r == {"emails": []} for r in results)
+    assert len({id(r) for r in results}) == 6  # followers get copies
+
+
+async def test_async_followers_get_a_snapshot_not_the_leaders_object():
+    flight, release = SingleFlight(), asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return {"n": [1]}
+
+    async def lead():
+        mine = await flight.ado("k", fetch)
+        mine["n"].append(2)  # before the follower has resumed
+        return mine
+
+    leader = asyncio.create_task(lead())
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.ado("k", fetch))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await leader == {"n": [1, 2]}
+    assert await follower == {"n": [1]}
+
+
+def test_errors_reach_every_waiter_and_do_not_stick():
+    flight, release = SingleFlight(), threading.Event()
+
+    def boom():
+        release.wait(timeout=2)
+        raise RuntimeError("graph down")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(flight.do, "k", boom) for _ in range(3)]
+        while flight.coalesced < 2:
+            threading.Event().wait(0.005)
+        release.set()
+        for f in futures:
+            with pytest.raises(RuntimeError):
+                f.result()
+
+    assert flight.do("k", lambda: "recovered") == "recovered"
+
+
+async def test_async_callers_share_one_fetch_and_survive_cancellation():
+    flight, release = SingleFlight(), asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return {"n": 1}
+
+    leader = asyncio.create_task(flight.ado("k", fetch))
+    followers = [asyncio.create_task(flight.ado("k", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    leader.cancel()  # the shared fetch keeps going for the others
+    release.set()
+
+    assert await asyncio.gather(*followers) == [{"n": 1}] * 3
+    assert len(calls) == 1
+
+
+async def test_ado_many_only_fetches_names_not_already_in_flight():
+    flight, release = SingleFlight(), asyncio.Event()
+    batches = []
+
+    async def fetch_many(names):
+        batches.append(sorted(names))
+        await release.wait()
+        return {n: n.upper() for n in names}
+
+    first = asyncio.create_task(flight.ado_many({"a": "a", "b": "b"}, fetch_many))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(flight.ado_many({"b": "b", "c": "c"}, fetch_many))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == {"a": "A", "b": "B"}
+    assert await second == {"b": "B", "c": "C"}
+    assert batches == [["a", "b"], ["c"]]
+
+
+async def test_meeting_prep_workflow_runs_once_for_concurrent_requests(monkeypatch):
+    from src import workflow
+    from src.tools import intel_store
+
+    runs = []
+
+    async def fake_run(customer_name, on_source=None):
+        runs.append(customer_name)
+        await asyncio.sleep(0.01)
+        return {"work_iq": {"n": 1}, "fabric_iq": {}, "foundry_iq": {}}
+
+    monkeypatch.setattr(workflow, "_run_data_workflow", fake_run)
+    results = await asyncio.gather(
+        workflow.run_meeting_prep_workflow("Coca-Cola"),
+        workflow.run_meeting_prep_workflow("The Coca-Cola Company"),
+        workflow.run_meeting_prep_workflow("coca cola"),
+    )
+
+    assert runs == ["Coca-Cola"]
+    store = intel_store.get_store()
+    assert all(store.get(r["intel_id"]).work_iq == {"n": 1} for r in results)
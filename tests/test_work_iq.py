@@ -0,0 +1,233 @@
+"""Tests for the live Work IQ Graph path (HTTP mocked with httpx.MockTransport)."""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from src.auth import DelegatedAuthRequired
+from src.tools import graph_batch, http_retry, iq_cache, work_iq
+
+
+@pytest.fixture(autouse=True)
+def _fresh_retry_state():
+    http_retry.reset()
+    iq_cache.get_cache().clear()
+    yield
+    http_retry.reset()
+    iq_cache.get_cache().clear()
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """Route the pooled AsyncClient through a handler the test supplies."""
+    def install(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(work_iq.http_pool, "get_async_client", lambda: client)
+        return client
+
+    monkeypatch.setattr(work_iq, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(work_iq, "GRAPH_USER_ID", "user-1")
+    monkeypatch.setattr(work_iq, "_graph_headers", lambda: {"Authorization": "Bearer app"})
+    monkeypatch.setattr(work_iq, "_delegated_graph_headers", lambda: {"Authorization": "Bearer user"})
+    return install
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    delays: list[float] = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(graph_batch.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+_MESSAGE = {
+    "receivedDateTime": "2025-01-02T10:00:00Z",
+    "from": {"emailAddress": {"address": "a@contoso.com"}},
+    "subject": "Renewal",
+    "bodyPreview": "Let's talk",
+}
+_EVENT = {
+    "start": {"dateTime": "2025-01-03T09:00:00"},
+    "subject": "Contoso QBR",
+    "attendees": [{"emailAddress": {"name": "Ana"}}],
+    "bodyPreview": "Agenda",
+}
+
+
+def _batch_reply(request: httpx.Request, status_for=lambda item: 200) -> httpx.Response:
+    """Answer every sub-request of a $batch POST with a one-item page."""
+    responses = []
+    for item in json.loads(request.content)["requests"]:
+        status = status_for(item)
+        body = _MESSAGE if "/messages" in item["url"] else _EVENT
+        responses.append({
+            "id": item["id"],
+            "status": status,
+            "headers": {"Retry-After": "1"} if status == 429 else {},
+            "body": {"value": [body]} if status == 200 else {"error": {"code": str(status)}},
+        })
+    return httpx.Response(200, json={"responses": responses})
+
+
+async def test_async_path_sends_mail_and_calendar_batches_concurrently(graph):
+    auths: list[str] = []
+    both_in_flight = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1.0/$batch"
+        auths.append(request.headers["Authorization"])
+        if len(auths) == 2:
+            both_in_flight.set()
+        # Sequential batches would never see the second arrival and time out.
+        await asyncio.wait_for(both_in_flight.wait(), timeout=2)
+        return _batch_reply(request)
+
+    graph(handler)
+    result = await work_iq.get_work_iq_data_async("Contoso")
+
+    assert sorted(auths) == ["Bearer app", "Bearer user"]
+    assert result["recent_emails"] == [
+        {"date": "2025-01-02", "from": "a@contoso.com", "subject": "Renewal", "snippet": "Let's talk"},
+    ]
+    assert result["recent_meetings"][0]["attendees"] == ["Ana"]
+
+
+async def test_many_customers_share_batches(graph):
+    posts: list[list[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        posts.append([item["url"] for item in json.loads(request.content)["requests"]])
+        return _batch_reply(request)
+
+    graph(handler)
+    names = ["Contoso", "Fabrikam", "Coca Cola"]
+    records = await work_iq.get_work_iq_data_many(names)
+
+    assert len(posts) == 2  # one mail batch + one calendar batch
+    assert sorted(records) == sorted(names)
+    assert all(r["recent_emails"] and r["recent_meetings"] for r in records.values())
+    assert "/users/user-1/messages?$search=%22Coca%20Cola%22&$top=10" in posts[0][2] + posts[1][2]
+
+
+async def test_batches_are_split_at_graph_limit(graph):
+    sizes: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sizes.append(len(json.loads(request.content)["requests"]))
+        return _batch_reply(request)
+
+    graph(handler)
+    requests = [graph_batch.SubRequest(str(i), f"/me/messages?i={i}") for i in range(45)]
+    results = await graph_batch.send(work_iq.http_pool.get_async_client(), requests, {})
+
+    assert sorted(sizes) == [5, 20, 20]
+    assert len(results) == 45 and all(r.ok for r in results.values())
+
+
+async def test_throttled_items_are_retried_after_retry_after(graph, no_sleep):
+    attempts: dict[str, int] = {}
+
+    def status_for(item):
+        attempts[item["url"]] = attempts.get(item["url"], 0) + 1
+        return 429 if "/events" in item["url"] and attempts[item["url"]] == 1 else 200
+
+    graph(lambda request: _batch_reply(request, status_for))
+    result = await work_iq.get_work_iq_data_async("Contoso")
+
+    assert no_sleep[0] == 1.0
+    assert result["recent_meetings"] and result["recent_emails"]
+    assert sorted(attempts.values()) == [1, 2]  # only the throttled item was re-sent
+
+
+async def test_partial_failure_keeps_successful_items(graph, no_sleep):
+    graph(lambda request: _batch_reply(request, lambda item: 404 if "/events" in item["url"] else 200))
+    result = await work_iq.get_work_iq_data_async("Contoso")
+
+    assert len(result["recent_emails"]) == 1
+    assert result["recent_meetings"] == []
+    assert no_sleep == []
+
+
+async def test_async_path_keeps_mail_when_calendar_needs_consent(graph, monkeypatch):
+    auths: list[str] = []
+
+    def delegated():
+        raise DelegatedAuthRequired("https://login.example/consent")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        auths.append(request.headers["Authorization"])
+        return _batch_reply(request)
+
+    graph(handler)
+    monkeypatch.setattr(work_iq, "_delegated_graph_headers", delegated)
+    result = await work_iq.get_work_iq_data_async("Contoso")
+
+    assert result["auth_required"] is True
+    assert result["auth_url"] == "https://login.example/consent"
+    assert len(result["recent_emails"]) == 1
+    assert auths == ["Bearer app"]
+
+
+async def test_async_path_returns_empty_lists_on_http_errors(graph):
+    graph(lambda request: httpx.Response(403))
+    result = await work_iq.get_work_iq_data_async("Contoso")
+    assert result["recent_emails"] == [] and result["recent_meetings"] == []
+
+
+# ── Sync path ──────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def graph_sync(monkeypatch):
+    """Route the pooled sync Client through a handler the test supplies."""
+    def install(handler):
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(work_iq.http_pool, "get_client", lambda: client)
+        return client
+
+    monkeypatch.setattr(work_iq, "USE_MOCK_DATA", False)
+    monkeypatch.setattr(work_iq, "GRAPH_USER_ID", "user-1")
+    monkeypatch.setattr(work_iq, "_graph_headers", lambda: {"Authorization": "Bearer app"})
+    monkeypatch.setattr(work_iq, "_delegated_graph_headers", lambda: {"Authorization": "Bearer user"})
+    return install
+
+
+def test_sync_path_fetches_mail_and_calendar_concurrently(graph_sync):
+    # Each request waits for the other: sequential fetches would time out.
+    both_in_flight = threading.Barrier(2, timeout=2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        both_in_flight.wait()
+        body = _MESSAGE if request.url.path.endswith("/messages") else _EVENT
+        return httpx.Response(200, json={"value": [body]})
+
+    graph_sync(handler)
+    result = work_iq._query_graph("Contoso")
+
+    assert len(result["recent_emails"]) == 1
+    assert len(result["recent_meetings"]) == 1
+
+
+def test_sync_path_keeps_mail_when_calendar_needs_consent(graph_sync, monkeypatch):
+    paths: list[str] = []
+
+    def delegated():
+        raise DelegatedAuthRequired("https://login.example/consent")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"value": [_MESSAGE]})
+
+    graph_sync(handler)
+    monkeypatch.setattr(work_iq, "_delegated_graph_headers", delegated)
+    result = work_iq._query_graph("Contoso")
+
+    assert result["auth_required"] is True
+    assert len(result["recent_emails"]) == 1
+    assert paths == ["/v1.0/users/user-1/messages"]
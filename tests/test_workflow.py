@@ -0,0 +1,217 @@
+"""Tests for the meeting-prep data workflow (mock mode)."""
+
+import asyncio
+import time
+
+import pytest
+
+from src import workflow
+from src.tools import compaction, intel_store
+
+
+def _intel(result):
+    """The full data a workflow tool kept server-side behind its intel_id."""
+    return intel_store.get_store().get(result["intel_id"])
+
+
+@pytest.fixture
+def slow_foundry(monkeypatch):
+    def slow(customer_name):
+        time.sleep(1.0)
+        return {"sales_plays": ["late"]}
+
+    monkeypatch.setattr(workflow, "get_foundry_iq_data", slow)
+    monkeypatch.setitem(workflow.WORKFLOW_SOURCE_TIMEOUTS, "foundry_iq", 0.2)
+
+
+async def test_workflow_gathers_all_sources():
+    result = await workflow.run_meeting_prep_workflow("Contoso")
+
+    intel = _intel(result)
+    assert intel.work_iq["customer_name"]
+    assert "financial_summary" in intel.fabric_iq
+    assert intel.foundry_iq["sales_plays"]
+    assert result["timed_out"] == [] and result["degraded"] is False
+    assert result["summary"]["foundry_iq"]["sales_plays"]
+    assert "recent_emails" not in result
+
+
+async def test_slow_source_times_out_without_holding_up_the_rest(slow_foundry):
+    start = time.perf_counter()
+    result = await workflow.run_meeting_prep_workflow("Contoso")
+
+    assert time.perf_counter() - start < 0.8
+    assert result["timed_out"] == ["foundry_iq"]
+    assert result["degraded"] is True
+    intel = _intel(result)
+    assert intel.foundry_iq["timed_out"] is True
+    assert intel.work_iq["customer_name"] and intel.fabric_iq
+    assert "foundry_iq" in result["errors"]
+
+
+async def test_failing_source_degrades_the_result_instead_of_stalling(monkeypatch):
+    def broken(customer_name):
+        raise RuntimeError("search index unavailable")
+
+    monkeypatch.setattr(workflow, "get_foundry_iq_data", broken)
+
+    start = time.perf_counter()
+    result = await workflow.run_meeting_prep_workflow("Contoso")
+
+    assert time.perf_counter() - start < 5
+    assert result["timed_out"] == [] and result["degraded"] is True
+    intel = _intel(result)
+    assert intel.foundry_iq["failed"] is True
+    assert "search index unavailable" in intel.foundry_iq["error"]
+    assert intel.work_iq["customer_name"] and intel.fabric_iq
+    assert "foundry_iq" in result["errors"]
+
+
+async def test_overall_budget_caps_every_source(slow_foundry, monkeypatch):
+    monkeypatch.setitem(workflow.WORKFLOW_SOURCE_TIMEOUTS, "foundry_iq", 30)
+    monkeypatch.setattr(workflow, "WORKFLOW_BUDGET_SECONDS", 0.3)
+
+    start = time.perf_counter()
+    result = await workflow.run_meeting_prep_workflow("Fabrikam")
+
+    assert time.perf_counter() - start < 0.9
+    assert result["timed_out"] == ["foundry_iq"]
+
+
+def test_workflow_pool_reuses_instances_and_drops_failed_ones():
+    pool = workflow.WorkflowPool(factory=object, size=1)
+
+    with pool.checkout() as first:
+        with pool.checkout() as second:  # concurrent run gets its own instance
+            assert second is not first
+    assert pool.built == 2
+
+    with pool.checkout() as again:
+        assert again in (first, second)
+
+    with pytest.raises(RuntimeError):
+        with pool.checkout() as broken:
+            raise RuntimeError("run failed")
+    with pool.checkout() as after, pool.checkout() as other:
+        assert broken not in (after, other)
+
+
+async def test_sequential_runs_on_one_instance_are_isolated():
+    pool = workflow.WorkflowPool(size=1)
+    for name in ("Contoso", "Fabrikam"):
+        with pool.checkout() as wf:
+            intel = (await wf.run(workflow.CustomerRequest(name, ""))).get_outputs()[0]
+        assert intel.customer_name == name
+        assert intel.timed_out == []
+    assert pool.built == 1
+
+
+async def test_stream_yields_each_source_as_it_lands(monkeypatch):
+    def slow(customer_name):
+        time.sleep(0.3)
+        return {"sales_plays": ["late"]}
+
+    monkeypatch.setattr(workflow, "get_foundry_iq_data", slow)
+
+    events = [e async for e in workflow.stream_meeting_prep_workflow("Contoso")]
+
+    sources = [e["source"] for e in events if e["type"] == "source"]
+    assert sorted(sources) == sorted(workflow._SOURCES)
+    assert sources[-1] == "foundry_iq"
+    assert all(e["status"] == "completed" for e in events[:-1])
+    assert events[-1]["type"] == "result"
+    assert events[-1]["result"]["foundry_iq"] == {"sales_plays": ["late"]}
+
+
+async def test_meeting_prep_tool_publishes_progress_to_the_bound_session():
+    from src import progress
+
+    owner = object()
+    channel = progress.open_channel(owner)
+    progress.link(owner, "copilot-session-1")
+    try:
+        with progress.bind("copilot-session-1"):
+            result = await workflow.run_meeting_prep_workflow("Contoso")
+            intel = _intel(result)
+        events = [await channel.get() for _ in workflow._SOURCES]
+    finally:
+        progress.close_channel(owner)
+
+    assert {e["source"] for e in events} == set(workflow._SOURCES)
+    assert all(e["customer_name"] == "Contoso" for e in events)
+    assert all("data" not in e for e in events)
+    by_source = {e["source"]: e["summary"] for e in events}
+    assert by_source["fabric_iq"] == compaction.compact("fabric_iq", intel.fabric_iq)
+
+
+async def test_coalesced_callers_each_get_progress(monkeypatch):
+    from src import progress
+
+    def slow(customer_name):
+        time.sleep(0.3)
+        return {"sales_plays": ["late"]}
+
+    monkeypatch.setattr(workflow, "get_foundry_iq_data", slow)
+
+    async def prep(session_id):
+        with progress.bind(session_id):
+            return await workflow.run_meeting_prep_workflow("Contoso")
+
+    owners = [object(), object()]
+    channels = [progress.open_channel(owner) for owner in owners]
+    for i, owner in enumerate(owners):
+        progress.link(owner, f"copilot-session-{i}")
+    try:
+        leader = asyncio.create_task(prep("copilot-session-0"))
+        await asyncio.sleep(0.05)
+        follower = asyncio.create_task(prep("copilot-session-1"))
+        await asyncio.gather(leader, follower)
+        events = [channel.drain() for channel in channels]
+    finally:
+        for owner in owners:
+            progress.close_channel(owner)
+
+    # The follower joined before foundry_iq landed, so it sees at least that one.
+    assert {e["source"] for e in events[0]} == set(workflow._SOURCES)
+    assert "foundry_iq" in {e["source"] for e in events[1]}
+    assert workflow._watchers == {}
+
+
+async def test_prep_pipeline_gathers_and_renders_both_documents():
+    result = await workflow.prepare_meeting_package("Contoso")
+
+    assert result["documents"]["prep_doc"].endswith(".docx")
+    assert result["documents"]["presentation"].endswith(".pptx")
+    assert "render_error" not in result
+    assert _intel(result).fabric_iq and result["timed_out"] == []
+
+
+async def test_prep_pipeline_skips_rendering_when_sign_in_is_required(monkeypatch):
+    async def needs_sign_in(customer_name):
+        return {"auth_required": True, "auth_url": "https://login.example"}
+
+    async def must_not_render(*args):
+        raise AssertionError("rendered without data")
+
+    monkeypatch.setattr(workflow, "get_work_iq_data_async", needs_sign_in)
+    monkeypatch.setattr(workflow, "generate_meeting_package", must_not_render)
+
+    result = await workflow.prepare_meeting_package("Contoso")
+
+    assert result["documents"] == {}
+    assert "Sign-in required" in result["render_error"]
+    assert result["auth_required"] is True
+    assert result["auth_url"] == "https://login.example"
+
+
+async def test_prep_pipeline_returns_data_when_rendering_fails(monkeypatch):
+    async def broken(*args):
+        raise RuntimeError("render pool busy")
+
+    monkeypatch.setattr(workflow, "generate_meeting_package", broken)
+
+    result = await workflow.prepare_meeting_package("Fabrikam")
+
+    assert result["documents"] == {}
+    assert "render pool busy" in result["render_error"]
+    assert _intel(result).foundry_iq["sales_plays"]